@@ -0,0 +1,149 @@
+"""Throughput and tail latency of the sync vs async database stacks.
+
+Seeds a SQLite file, then for each mode starts ``uvicorn main:app`` in a
+subprocess (``USE_ASYNC_DB`` off/on) and drives it with ``--concurrency``
+simultaneous keep-alive connections against the read endpoints.
+
+Run from backend/app:
+
+    python -m benchmarks.bench_async_db --concurrency 500 --requests 20000
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+_db_dir = tempfile.mkdtemp(prefix="bench-async-")
+DATABASE_URL = f"sqlite:///{_db_dir}/bench.db"
+SECRET_KEY = "bench-secret-key"
+os.environ["DATABASE_URL"] = DATABASE_URL
+os.environ["SECRET_KEY"] = SECRET_KEY
+
+import httpx  # noqa: E402
+from database import SessionLocal, init_db  # noqa: E402
+from models.opportunity import Opportunity  # noqa: E402
+from models.post import Post  # noqa: E402
+from models.user import User  # noqa: E402
+from utils.auth import create_access_token  # noqa: E402
+
+PATHS = ["/posts?limit=20", "/opportunities?limit=20", "/network?limit=20"]
+
+
+def seed(users: int, rows: int) -> None:
+    init_db()
+    db = SessionLocal()
+    db.add_all(
+        User(
+            email=f"user{i}@example.com",
+            username=f"user{i}",
+            hashed_password="x",
+            full_name=f"User {i}",
+        )
+        for i in range(1, users + 1)
+    )
+    db.flush()
+    db.add_all(Post(author_id=1 + i % users, content=f"post {i}") for i in range(rows))
+    db.add_all(
+        Opportunity(
+            title=f"Opportunity {i}",
+            description="A benchmark opportunity description.",
+            creator_id=1 + i % users,
+        )
+        for i in range(rows)
+    )
+    db.commit()
+    db.close()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_ready(base_url: str) -> None:
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        for _ in range(100):
+            try:
+                await client.get("/")
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+    raise RuntimeError("server did not start")
+
+
+async def drive(base_url: str, concurrency: int, requests: int) -> tuple:
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': 1})}"}
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(
+        base_url=base_url, headers=headers, limits=limits, timeout=60
+    ) as client:
+
+        async def worker():
+            nonlocal errors
+            for i in remaining:
+                start = time.perf_counter()
+                try:
+                    response = await client.get(PATHS[i % len(PATHS)])
+                    response.raise_for_status()
+                    latencies.append(time.perf_counter() - start)
+                except httpx.HTTPError:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return latencies, errors, elapsed
+
+
+def run_mode(use_async: bool, concurrency: int, requests: int) -> None:
+    port = free_port()
+    env = dict(os.environ, USE_ASYNC_DB="true" if use_async else "false")
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "main:app",
+            "--port", str(port), "--log-level", "warning",
+            "--backlog", str(max(2048, concurrency * 2)),
+        ],
+        env=env,
+    )
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        asyncio.run(wait_ready(base_url))
+        latencies, errors, elapsed = asyncio.run(drive(base_url, concurrency, requests))
+    finally:
+        server.terminate()
+        server.wait()
+
+    ordered = sorted(latencies)
+    p99 = ordered[int(0.99 * (len(ordered) - 1))] if ordered else 0.0
+    label = "async" if use_async else "sync"
+    print(
+        f"{label:>5}: {len(latencies) / elapsed:8.0f} req/s | "
+        f"p50={statistics.median(ordered) * 1000:7.1f}ms p99={p99 * 1000:7.1f}ms "
+        f"| errors={errors}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--modes", default="sync,async")
+    args = parser.parse_args()
+    seed(args.users, args.rows)
+    print(f"concurrency={args.concurrency} requests={args.requests}")
+    for mode in args.modes.split(","):
+        run_mode(mode == "async", args.concurrency, args.requests)
@@ -0,0 +1,115 @@
+"""Login storm benchmark for the password hashing pool.
+
+Fires concurrent logins while a second client keeps calling an unrelated
+authenticated endpoint, then reports p50/p99 latency for both, once with
+bcrypt on threads (``PASSWORD_HASH_WORKERS=0``) and once on worker processes.
+
+Run from backend/app:
+
+    python -m benchmarks.bench_auth_pool --logins 200 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+_db_dir = tempfile.mkdtemp(prefix="bench-auth-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_db_dir}/bench.db")
+
+import httpx  # noqa: E402
+import utils.hashing as hashing  # noqa: E402
+from database import init_db  # noqa: E402
+from main import app  # noqa: E402
+from utils.hashing import PasswordHashingPool  # noqa: E402
+
+EMAIL = "bench@example.com"
+PASSWORD = "password123"
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_storm(client: httpx.AsyncClient, logins: int, concurrency: int):
+    token = (
+        await client.post("/auth/login", json={"email": EMAIL, "password": PASSWORD})
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    login_latencies: list[float] = []
+    other_latencies: list[float] = []
+    rejected = 0
+    semaphore = asyncio.Semaphore(concurrency)
+    done = asyncio.Event()
+
+    async def one_login():
+        nonlocal rejected
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post(
+                "/auth/login", json={"email": EMAIL, "password": PASSWORD}
+            )
+            if response.status_code == 503:
+                rejected += 1
+            else:
+                login_latencies.append(time.perf_counter() - start)
+
+    async def unrelated_traffic():
+        while not done.is_set():
+            start = time.perf_counter()
+            await client.get("/network", headers=headers)
+            other_latencies.append(time.perf_counter() - start)
+
+    background = asyncio.create_task(unrelated_traffic())
+    started = time.perf_counter()
+    await asyncio.gather(*(one_login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await background
+    return login_latencies, other_latencies, rejected, elapsed
+
+
+async def main(logins: int, concurrency: int, workers: int, max_pending: int):
+    init_db()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+        await c.post(
+            "/auth/signup",
+            json={
+                "email": EMAIL,
+                "username": "bench",
+                "password": PASSWORD,
+                "full_name": "Bench User",
+            },
+        )
+        for label, pool_workers in (("threads", 0), ("processes", workers)):
+            hashing.hashing_pool.shutdown()
+            hashing.hashing_pool = PasswordHashingPool(pool_workers, max_pending)
+            # Warm the pool so worker start-up is not billed to the first logins
+            await hashing.verify_password_async(PASSWORD, hashing.get_password_hash(PASSWORD))
+            login, other, rejected, elapsed = await run_storm(c, logins, concurrency)
+            print(
+                f"{label:>9}: {len(login)} logins in {elapsed:.2f}s, {rejected} rejected | "
+                f"login p50={statistics.median(login) * 1000:.0f}ms "
+                f"p99={percentile(login, 99) * 1000:.0f}ms | "
+                f"unrelated n={len(other)} p50={statistics.median(other) * 1000:.1f}ms "
+                f"p99={percentile(other, 99) * 1000:.1f}ms"
+            )
+    hashing.hashing_pool.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--max-pending", type=int, default=256)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.concurrency, args.workers, args.max_pending))
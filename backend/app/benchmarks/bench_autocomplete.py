@@ -0,0 +1,97 @@
+"""Autocomplete latency percentiles from the in-memory prefix index.
+
+Loads ``--users`` synthetic users (random usernames, two-word full names,
+3-8 Zipf-ish skills from ``--skills``) into a SQLite file, builds the
+AutocompleteIndex the way startup does, then times suggest() for 1-4
+character prefixes, the keystrokes a search box sends.
+
+Run from backend/app:
+
+    python -m benchmarks.bench_autocomplete --users 200000
+"""
+
+import argparse
+import itertools
+import json
+import random
+import string
+import tempfile
+import time
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, apply_sqlite_pragmas
+from models.user import User
+from utils.autocomplete import AutocompleteIndex
+
+SYLLABLES = ["ka", "lo", "mi", "ra", "sen", "ta", "vo", "an", "el", "jo", "ne", "ri"]
+
+
+def word(rng: random.Random) -> str:
+    return "".join(rng.choices(SYLLABLES, k=rng.randint(2, 4)))
+
+
+def seed(engine, users: int, skill_count: int, rng: random.Random) -> None:
+    skills = [f"{word(rng)}{i}" for i in range(skill_count)]
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(skills))))
+    chunk = 50_000
+    with engine.begin() as conn:
+        for offset in range(0, users, chunk):
+            conn.execute(
+                insert(User),
+                [
+                    {
+                        "email": f"user{i}@example.com",
+                        "username": f"{word(rng)}{i}",
+                        "hashed_password": "x",
+                        "full_name": f"{word(rng).title()} {word(rng).title()}",
+                        "skills": json.dumps(
+                            rng.choices(skills, cum_weights=cum_weights, k=rng.randint(3, 8))
+                        ),
+                        "mode": "hustler",
+                        "is_active": True,
+                    }
+                    for i in range(offset, min(offset + chunk, users))
+                ],
+            )
+
+
+def main(users: int, skill_count: int, queries: int, limit: int) -> None:
+    rng = random.Random(42)
+    path = f"{tempfile.mkdtemp(prefix='bench-autocomplete-')}/bench.db"
+    engine = create_engine(f"sqlite:///{path}")
+    event.listen(engine, "connect", apply_sqlite_pragmas)
+    Base.metadata.create_all(bind=engine)
+    seed(engine, users, skill_count, rng)
+
+    index = AutocompleteIndex()
+    started = time.perf_counter()
+    with sessionmaker(bind=engine)() as db:
+        index.load(db)
+    print(f"indexed {users} users in {time.perf_counter() - started:.1f}s")
+
+    for length in range(1, 5):
+        prefixes = [
+            "".join(rng.choices(string.ascii_lowercase[:20], k=length)) for _ in range(queries)
+        ]
+        samples = []
+        for prefix in prefixes:
+            started = time.perf_counter()
+            index.suggest(prefix, limit)
+            samples.append(time.perf_counter() - started)
+        samples.sort()
+        p50 = samples[len(samples) // 2] * 1e6
+        p99 = samples[int(len(samples) * 0.99)] * 1e6
+        print(f"{length}-char prefix: p50 {p50:7.1f} us   p99 {p99:7.1f} us")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=200_000)
+    parser.add_argument("--skills", type=int, default=10_000)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--limit", type=int, default=8)
+    args = parser.parse_args()
+    main(args.users, args.skills, args.queries, args.limit)
@@ -0,0 +1,127 @@
+"""Bulk opportunity import throughput and peak memory vs one commit per row.
+
+Writes ``--rows`` synthetic listings (1-5 skills each, one in fifty
+invalid) to a JSONL file and streams it through run_import, timed at the
+full size. Peak Python heap (tracemalloc) is measured separately at 1% and
+10% of the file and should not grow with it; RSS would, as SQLite's page
+cache and mmap fill. The baseline replays the first ``--baseline`` rows the way
+POST /opportunities does, one ORM add and commit per row.
+
+Run from backend/app:
+
+    python -m benchmarks.bench_bulk_import --rows 200000
+"""
+
+import argparse
+import itertools
+import json
+import random
+import tempfile
+import time
+import tracemalloc
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, apply_sqlite_pragmas
+from models import application, comment, post, user  # noqa: F401  (registers the tables)
+from models.opportunity import Opportunity
+from schemas.opportunity import OpportunityCreate
+from utils.bulk_import import OpportunityImport, parse_rows, run_import
+from utils.skills import set_opportunity_skills
+
+
+def write_rows(path: str, rows: int, rng: random.Random) -> None:
+    skills = [f"skill{i}" for i in range(2_000)]
+    with open(path, "w") as out:
+        for i in range(rows):
+            row = {
+                "title": f"Imported listing {i}",
+                "description": "Migrated from another job board, with enough detail.",
+                "required_skills": rng.sample(skills, rng.randint(1, 5)),
+                "bounty_amount": rng.choice([None, 100, 500]),
+            }
+            if i % 50 == 0:
+                row["title"] = "Bad"
+            out.write(json.dumps(row) + "\n")
+
+
+def fresh_session(directory: str, name: str):
+    engine = create_engine(f"sqlite:///{directory}/{name}.db")
+    event.listen(engine, "connect", apply_sqlite_pragmas)
+    Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(bind=engine)()
+
+
+def bulk(directory: str, path: str, rows: int, chunk_size: int, traced: bool) -> None:
+    engine, db = fresh_session(directory, f"bulk{rows}")
+    if traced:
+        tracemalloc.start()
+    started = time.perf_counter()
+    with open(path, newline="") as lines:
+        report = run_import(
+            db,
+            parse_rows(itertools.islice(lines, rows), "jsonl"),
+            OpportunityImport(1),
+            chunk_size,
+            max_errors=100,
+        )
+    elapsed = time.perf_counter() - started
+    if traced:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"bulk {rows:>8} rows: peak heap {peak / 2**20:6.1f} MiB")
+    else:
+        print(
+            f"bulk {rows:>8} rows: {report.imported / elapsed:9.0f} rows/s, "
+            f"{report.failed} failed"
+        )
+    db.close()
+    engine.dispose()
+
+
+def per_row(directory: str, path: str, rows: int) -> None:
+    engine, db = fresh_session(directory, "per_row")
+    imported = 0
+    started = time.perf_counter()
+    with open(path) as lines:
+        for line in itertools.islice(lines, rows):
+            try:
+                data = OpportunityCreate.model_validate_json(line)
+            except ValueError:
+                continue
+            opportunity = Opportunity(
+                title=data.title,
+                description=data.description,
+                required_skills=json.dumps(data.required_skills),
+                bounty_amount=data.bounty_amount,
+                creator_id=1,
+            )
+            db.add(opportunity)
+            db.flush()
+            set_opportunity_skills(db, opportunity.id, data.required_skills)
+            db.commit()
+            imported += 1
+    elapsed = time.perf_counter() - started
+    print(f"per-row commit {rows:>6} rows: {imported / elapsed:9.0f} rows/s")
+    db.close()
+    engine.dispose()
+
+
+def main(rows: int, baseline: int, chunk_size: int) -> None:
+    directory = tempfile.mkdtemp(prefix="bench-import-")
+    path = f"{directory}/listings.jsonl"
+    write_rows(path, rows, random.Random(42))
+    bulk(directory, path, rows, chunk_size, traced=False)
+    for size in (rows // 100, rows // 10):
+        bulk(directory, path, size, chunk_size, traced=True)
+    per_row(directory, path, baseline)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--baseline", type=int, default=5_000)
+    parser.add_argument("--chunk-size", type=int, default=1_000)
+    args = parser.parse_args()
+    main(args.rows, args.baseline, args.chunk_size)
@@ -0,0 +1,99 @@
+"""Deleting an opportunity with many applications, set-based vs ORM per-row.
+
+Seeds two opportunities with ``--applications`` applications and three
+skills each into a SQLite file, then deletes one the way an ORM
+``all, delete-orphan`` cascade does (load every application, one DELETE per
+row) and the other with utils.cascade.delete_opportunities (one DELETE per
+child table).
+
+Run from backend/app:
+
+    python -m benchmarks.bench_cascade_delete --applications 50000
+"""
+
+import argparse
+import tempfile
+import time
+
+from sqlalchemy import create_engine, delete, event, func, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, apply_sqlite_pragmas
+from models.application import Application
+from models.opportunity import Opportunity
+from models.skill import Skill, opportunity_skills
+from models import comment, post, user  # noqa: F401  (registers the tables)
+from utils.cascade import delete_opportunities
+
+
+def seed(engine, applications: int) -> list[int]:
+    with engine.begin() as conn:
+        conn.execute(insert(Skill), [{"name": f"skill{i}"} for i in range(3)])
+        ids = []
+        for _ in range(2):
+            opportunity_id = conn.execute(
+                insert(Opportunity)
+                .values(title="Popular bounty", description="Everyone applied", creator_id=1)
+                .returning(Opportunity.id)
+            ).scalar_one()
+            ids.append(opportunity_id)
+            conn.execute(
+                insert(opportunity_skills),
+                [{"opportunity_id": opportunity_id, "skill_id": i} for i in range(1, 4)],
+            )
+            conn.execute(
+                insert(Application),
+                [
+                    {
+                        "opportunity_id": opportunity_id,
+                        "applicant_id": applicant_id,
+                        "message": "Pick me",
+                        "status": "pending",
+                    }
+                    for applicant_id in range(1, applications + 1)
+                ],
+            )
+    return ids
+
+
+def orm_per_row(db, opportunity_id: int) -> None:
+    for application in db.scalars(
+        select(Application).where(Application.opportunity_id == opportunity_id)
+    ):
+        db.delete(application)
+    db.execute(
+        delete(opportunity_skills).where(opportunity_skills.c.opportunity_id == opportunity_id)
+    )
+    db.delete(db.get(Opportunity, opportunity_id))
+
+
+def main(applications: int) -> None:
+    path = f"{tempfile.mkdtemp(prefix='bench-cascade-')}/bench.db"
+    engine = create_engine(f"sqlite:///{path}")
+    event.listen(engine, "connect", apply_sqlite_pragmas)
+    Base.metadata.create_all(bind=engine)
+    orm_id, set_id = seed(engine, applications)
+    Session = sessionmaker(bind=engine)
+
+    for label, run, opportunity_id in (
+        ("ORM per-row", orm_per_row, orm_id),
+        ("set-based  ", lambda db, target: delete_opportunities(db, [target]), set_id),
+    ):
+        with Session() as db:
+            started = time.perf_counter()
+            run(db, opportunity_id)
+            db.commit()
+            elapsed = time.perf_counter() - started
+        print(f"{label}: {elapsed * 1000:9.1f} ms for {applications} applications")
+
+    with Session() as db:
+        left = db.scalar(select(func.count()).select_from(Application))
+    print(f"applications left: {left}")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--applications", type=int, default=50_000)
+    args = parser.parse_args()
+    main(args.applications)
@@ -0,0 +1,132 @@
+"""Opportunity search latency as the table grows, FTS5 vs LIKE.
+
+Grows a SQLite file through each of ``--sizes`` synthetic opportunities and,
+at every size, times routes.opportunities.search_opportunities next to a
+``title LIKE '%term%' OR description LIKE '%term%'`` scan for the same
+term and status. The term matches a fixed number of rows, so FTS5 latency
+should stay flat while the LIKE scan grows with the table.
+
+Run from backend/app:
+
+    python -m benchmarks.bench_opportunities_search --sizes 10000,100000,1000000
+"""
+
+import argparse
+import itertools
+import random
+import statistics
+import tempfile
+import time
+from types import SimpleNamespace
+
+from fastapi import Response
+from sqlalchemy import create_engine, event, insert, or_, select
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, apply_sqlite_pragmas
+from models.opportunity import Opportunity
+from routes.opportunities import search_opportunities
+
+LIMIT = 20
+TERM = "needle"
+MATCHES = 50
+VOCABULARY = [f"word{i}" for i in range(20_000)]
+CUM_WEIGHTS = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(VOCABULARY))))
+
+
+def seed(engine, start: int, stop: int, rng: random.Random) -> None:
+    chunk = 50_000
+    with engine.begin() as conn:
+        for offset in range(start, stop, chunk):
+            conn.execute(
+                insert(Opportunity),
+                [
+                    {
+                        "title": " ".join(rng.choices(VOCABULARY, cum_weights=CUM_WEIGHTS, k=6)),
+                        "description": " ".join(
+                            rng.choices(VOCABULARY, cum_weights=CUM_WEIGHTS, k=40)
+                        ),
+                        "status": rng.choice(("open", "closed")),
+                        "creator_id": 1,
+                    }
+                    for _ in range(offset, min(offset + chunk, stop))
+                ],
+            )
+
+
+def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main(sizes: list[int], repeat: int) -> None:
+    path = f"{tempfile.mkdtemp(prefix='bench-opp-search-')}/bench.db"
+    engine = create_engine(f"sqlite:///{path}")
+    event.listen(engine, "connect", apply_sqlite_pragmas)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Opportunity),
+            [
+                {
+                    "title": f"{TERM} {i}",
+                    "description": "A row every search run should find.",
+                    "status": "open",
+                    "creator_id": 1,
+                }
+                for i in range(MATCHES)
+            ],
+        )
+
+    rng = random.Random(42)
+    db = sessionmaker(bind=engine)()
+    user = SimpleNamespace(id=1)
+    rows = MATCHES
+    for size in sizes:
+        seed(engine, rows, size, rng)
+        rows = max(rows, size)
+        fts = timed(
+            lambda: search_opportunities(
+                response=Response(),
+                q=TERM,
+                status="open",
+                limit=LIMIT,
+                db=db,
+                current_user=user,
+            ),
+            repeat,
+        )
+        like = timed(
+            lambda: db.scalars(
+                select(Opportunity.id)
+                .where(
+                    Opportunity.status == "open",
+                    or_(
+                        Opportunity.title.like(f"%{TERM}%"),
+                        Opportunity.description.like(f"%{TERM}%"),
+                    ),
+                )
+                .order_by(Opportunity.id.desc())
+                .limit(LIMIT)
+            ).all(),
+            repeat,
+        )
+        print(f"{rows:>9} rows: FTS5 {fts * 1000:8.2f} ms   LIKE {like * 1000:8.2f} ms")
+    db.close()
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=[10_000, 100_000, 1_000_000],
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.sizes, args.repeat)
@@ -0,0 +1,99 @@
+"""Page 1 vs page N latency of the posts feed, OFFSET vs keyset cursor.
+
+Seeds ``--rows`` posts into a SQLite file, then times routes.posts.get_posts
+for the first page and for page ``--page`` using ``skip`` and using the
+cursor handed back by the previous page.
+
+Run from backend/app:
+
+    python -m benchmarks.bench_posts_pagination --rows 1000000 --page 1000
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from fastapi import Response
+from sqlalchemy import create_engine, event, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, apply_sqlite_pragmas
+from models.post import Post
+from routes.posts import get_posts
+from utils.pagination import NEXT_CURSOR_HEADER, encode_cursor
+
+LIMIT = 20
+READER = SimpleNamespace(id=1)
+
+
+def seed(engine, rows: int) -> None:
+    start = datetime(2024, 1, 1)
+    chunk = 50_000
+    with engine.begin() as conn:
+        for offset in range(0, rows, chunk):
+            conn.execute(
+                insert(Post),
+                [
+                    {
+                        "author_id": 1,
+                        "content": f"post {i}",
+                        "created_at": start + timedelta(seconds=i),
+                        "updated_at": start + timedelta(seconds=i),
+                    }
+                    for i in range(offset, min(offset + chunk, rows))
+                ],
+            )
+
+
+def timed(db, repeat: int, **params) -> tuple[float, Response]:
+    samples = []
+    for _ in range(repeat):
+        response = Response()
+        started = time.perf_counter()
+        get_posts(response=response, limit=LIMIT, db=db, current_user=READER, **params)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples), response
+
+
+def main(rows: int, page: int, repeat: int) -> None:
+    path = f"{tempfile.mkdtemp(prefix='bench-feed-')}/bench.db"
+    engine = create_engine(f"sqlite:///{path}")
+    event.listen(engine, "connect", apply_sqlite_pragmas)
+    Base.metadata.create_all(bind=engine)
+    started = time.perf_counter()
+    seed(engine, rows)
+    print(f"seeded {rows} posts in {time.perf_counter() - started:.1f}s")
+
+    db = sessionmaker(bind=engine)()
+    skip = (page - 1) * LIMIT
+    # The cursor a client holds after reading page - 1
+    boundary = db.execute(
+        select(Post.created_at, Post.id)
+        .order_by(Post.created_at.desc(), Post.id.desc())
+        .offset(skip - 1)
+        .limit(1)
+    ).one()
+    cursor = encode_cursor(*boundary)
+
+    first, response = timed(db, repeat, skip=0, cursor=None)
+    assert NEXT_CURSOR_HEADER in response.headers
+    deep_offset, _ = timed(db, repeat, skip=skip, cursor=None)
+    deep_cursor, _ = timed(db, repeat, skip=0, cursor=cursor)
+
+    print(f"page 1             : {first * 1000:8.2f} ms")
+    print(f"page {page} (OFFSET) : {deep_offset * 1000:8.2f} ms")
+    print(f"page {page} (cursor) : {deep_cursor * 1000:8.2f} ms")
+    db.close()
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--page", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    main(args.rows, args.page, args.repeat)
@@ -0,0 +1,95 @@
+"""Post search latency, FTS5 + BM25 vs LIKE '%term%'.
+
+Seeds ``--rows`` synthetic posts (random words from a Zipf-ish vocabulary)
+into a SQLite file, with the FTS5 triggers indexing them as they go, then
+times routes.posts.search_posts for common and rare terms next to the
+equivalent LIKE scan.
+
+Run from backend/app:
+
+    python -m benchmarks.bench_posts_search --rows 2000000
+"""
+
+import argparse
+import itertools
+import random
+import statistics
+import tempfile
+import time
+from types import SimpleNamespace
+
+from fastapi import Response
+from sqlalchemy import create_engine, event, func, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, apply_sqlite_pragmas
+from models.post import Post
+from routes.posts import search_posts
+
+LIMIT = 20
+VOCABULARY = [f"word{i}" for i in range(20_000)]
+CUM_WEIGHTS = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(VOCABULARY))))
+
+
+def seed(engine, rows: int) -> None:
+    rng = random.Random(42)
+    chunk = 50_000
+    with engine.begin() as conn:
+        for offset in range(0, rows, chunk):
+            conn.execute(
+                insert(Post),
+                [
+                    {
+                        "author_id": 1,
+                        "content": " ".join(rng.choices(VOCABULARY, cum_weights=CUM_WEIGHTS, k=24)),
+                    }
+                    for _ in range(offset, min(offset + chunk, rows))
+                ],
+            )
+
+
+def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main(rows: int, repeat: int) -> None:
+    path = f"{tempfile.mkdtemp(prefix='bench-search-')}/bench.db"
+    engine = create_engine(f"sqlite:///{path}")
+    event.listen(engine, "connect", apply_sqlite_pragmas)
+    Base.metadata.create_all(bind=engine)
+    started = time.perf_counter()
+    seed(engine, rows)
+    print(f"seeded and indexed {rows} posts in {time.perf_counter() - started:.1f}s")
+
+    db = sessionmaker(bind=engine)()
+    reader = SimpleNamespace(id=1)
+    for term in ("word3", "word500", "word19000"):
+        fts = timed(
+            lambda: search_posts(
+                response=Response(), q=term, limit=LIMIT, db=db, current_user=reader
+            ),
+            repeat,
+        )
+        like = timed(
+            lambda: db.scalars(
+                select(Post.id).where(Post.content.like(f"%{term} %")).limit(LIMIT)
+            ).all(),
+            repeat,
+        )
+        matches = db.scalar(select(func.count()).where(Post.content.like(f"%{term} %")))
+        print(f"{term:>10} (~{matches} hits): FTS5 {fts * 1000:8.2f} ms   LIKE {like * 1000:8.2f} ms")
+    db.close()
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.rows, args.repeat)
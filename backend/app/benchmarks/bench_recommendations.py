@@ -0,0 +1,97 @@
+"""Recommendation latency, inverted index vs scoring every opportunity.
+
+Fills a RecommendationIndex with ``--opportunities`` synthetic open
+opportunities drawing 2-6 skills each from ``--skills`` distinct skills
+(Zipf-ish popularity), then times top-k recommendations for random users
+against a brute-force pass that scores every opportunity.
+
+Run from backend/app:
+
+    python -m benchmarks.bench_recommendations --opportunities 100000 --skills 10000
+"""
+
+import argparse
+import heapq
+import itertools
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models.opportunity import Opportunity
+from utils.recommendations import RecommendationIndex
+
+
+def build(index: RecommendationIndex, opportunities: int, skills: list[str], rng) -> dict:
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(skills))))
+    now = datetime.now()
+    catalog = {}
+    for opportunity_id in range(1, opportunities + 1):
+        required = set(rng.choices(skills, cum_weights=cum_weights, k=rng.randint(2, 6)))
+        opportunity = Opportunity(
+            id=opportunity_id,
+            status="open",
+            creator_id=0,
+            bounty_amount=rng.choice((None, 100, 500, 2000)),
+            deadline=rng.choice((None, now + timedelta(days=rng.randint(1, 90)))),
+        )
+        index.upsert(opportunity, sorted(required))
+        catalog[opportunity_id] = required
+    return catalog
+
+
+def brute_force(index: RecommendationIndex, catalog: dict, user: list[str], k: int) -> list:
+    wanted = set(user)
+    now = datetime.now().astimezone()
+    scored = []
+    for opportunity_id, required in catalog.items():
+        matched = len(required & wanted)
+        if matched:
+            doc = index._docs[opportunity_id]
+            scored.append((index._score(doc, matched, now), opportunity_id))
+    return heapq.nlargest(k, scored)
+
+
+def timed(fn, users: list) -> float:
+    samples = []
+    for user in users:
+        started = time.perf_counter()
+        fn(user)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main(opportunities: int, skill_count: int, users: int, k: int) -> None:
+    rng = random.Random(42)
+    skills = [f"skill{i}" for i in range(skill_count)]
+
+    # load() on an empty database just marks the index ready for upserts
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    index = RecommendationIndex()
+    with sessionmaker(bind=engine)() as db:
+        index.load(db)
+
+    started = time.perf_counter()
+    catalog = build(index, opportunities, skills, rng)
+    print(f"indexed {opportunities} opportunities in {time.perf_counter() - started:.1f}s")
+
+    profiles = [rng.sample(skills[:2000], rng.randint(3, 10)) for _ in range(users)]
+    indexed = timed(lambda user: index.recommend(user, k), profiles)
+    full_scan = timed(lambda user: brute_force(index, catalog, user, k), profiles)
+    print(f"inverted index : {indexed * 1000:8.2f} ms (median of {users} users, top {k})")
+    print(f"score all      : {full_scan * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--opportunities", type=int, default=100_000)
+    parser.add_argument("--skills", type=int, default=10_000)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--k", type=int, default=20)
+    args = parser.parse_args()
+    main(args.opportunities, args.skills, args.users, args.k)
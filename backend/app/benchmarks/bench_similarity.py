@@ -0,0 +1,105 @@
+"""Similar-user latency, vectorized user x term matrix vs a per-user loop.
+
+Fills a UserSimilarityIndex with ``--users`` synthetic profiles holding 3-12
+skills and 1-5 interests (Zipf-ish popularity), then times cosine top-k
+queries for random users against a pure-Python pass that scores every
+profile with set intersections. Also times profile edits, which append a
+row instead of rebuilding the matrix.
+
+Run from backend/app:
+
+    python -m benchmarks.bench_similarity --users 200000
+"""
+
+import argparse
+import heapq
+import itertools
+import json
+import math
+import random
+import statistics
+import time
+from types import SimpleNamespace
+
+from utils.similarity import UserSimilarityIndex, user_terms
+
+
+def profile(user_id: int, skills: list[str], interests: list[str], rng) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=user_id,
+        mode=rng.choice(("hustler", "builder")),
+        skills=json.dumps(skills),
+        interests=json.dumps(interests),
+    )
+
+
+def build(users: int, skill_count: int, rng) -> list[SimpleNamespace]:
+    skills = [f"skill{i}" for i in range(skill_count)]
+    interests = [f"topic{i}" for i in range(skill_count // 10)]
+    skill_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(skills))))
+    interest_weights = list(
+        itertools.accumulate(1 / (rank + 1) for rank in range(len(interests)))
+    )
+    return [
+        profile(
+            user_id,
+            rng.choices(skills, cum_weights=skill_weights, k=rng.randint(3, 12)),
+            rng.choices(interests, cum_weights=interest_weights, k=rng.randint(1, 5)),
+            rng,
+        )
+        for user_id in range(1, users + 1)
+    ]
+
+
+def brute_force(profiles: dict, user, k: int) -> list:
+    wanted = set(user_terms(user))
+    scored = []
+    for user_id, terms in profiles.items():
+        shared = len(wanted & terms)
+        if shared and user_id != user.id:
+            scored.append((shared / math.sqrt(len(wanted) * len(terms)), user_id))
+    return heapq.nlargest(k, scored)
+
+
+def timed(fn, items: list) -> float:
+    samples = []
+    for item in items:
+        started = time.perf_counter()
+        fn(item)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main(users: int, skill_count: int, queries: int, k: int) -> None:
+    rng = random.Random(42)
+    population = build(users, skill_count, rng)
+
+    index = UserSimilarityIndex()
+    started = time.perf_counter()
+    with index._lock:
+        index._fill(population)
+        index._loaded = True
+    print(f"indexed {users} users in {time.perf_counter() - started:.1f}s")
+
+    sample = rng.sample(population, queries)
+    profiles = {user.id: set(user_terms(user)) for user in population}
+    vectorized = timed(lambda user: index.similar(user, k), sample)
+    loop = timed(lambda user: brute_force(profiles, user, k), sample)
+    print(f"vectorized     : {vectorized * 1000:8.2f} ms (median of {queries} users, top {k})")
+    print(f"per-user loop  : {loop * 1000:8.2f} ms")
+
+    edits = [
+        profile(user.id, json.loads(user.skills)[:-1] + ["skill1"], [], rng) for user in sample
+    ]
+    update = timed(index.upsert, edits)
+    print(f"profile edit   : {update * 1000:8.3f} ms (median, compaction included)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=200_000)
+    parser.add_argument("--skills", type=int, default=5_000)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=20)
+    args = parser.parse_args()
+    main(args.users, args.skills, args.queries, args.k)
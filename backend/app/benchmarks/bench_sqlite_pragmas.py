@@ -0,0 +1,120 @@
+"""Concurrent read/write throughput on SQLite, default vs tuned PRAGMAs.
+
+Writer threads mimic create_post / like_post / apply_to_opportunity (short
+insert and update transactions) while reader threads page through posts.
+Each profile runs against a fresh database file for ``--seconds`` and
+reports committed operations per second plus "database is locked" errors.
+
+Run from backend/app:
+
+    python -m benchmarks.bench_sqlite_pragmas --writers 8 --readers 8 --seconds 10
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from functools import partial
+
+from sqlalchemy import create_engine, event, exc as sa_exc, insert, select, update
+
+from database import Base, apply_sqlite_pragmas, sqlite_pragmas
+from models.post import Post
+from models.user import User
+
+# Rollback journal with SQLite's defaults, except the same short busy wait
+# so both profiles retry on contention before giving up
+DEFAULT_PRAGMAS = {"journal_mode": "DELETE", "synchronous": "FULL", "busy_timeout": "100"}
+
+
+def make_engine(path: str, pragmas: dict):
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False, "timeout": 0.1},
+        pool_size=32,
+        max_overflow=0,
+    )
+    event.listen(engine, "connect", partial(apply_sqlite_pragmas, pragmas=pragmas))
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(User),
+            [
+                {"email": f"u{i}@example.com", "username": f"u{i}", "hashed_password": "x"}
+                for i in range(1, 101)
+            ],
+        )
+        conn.execute(
+            insert(Post),
+            [{"author_id": 1 + i % 100, "content": f"seed {i}"} for i in range(1000)],
+        )
+    return engine
+
+
+def run_profile(label: str, pragmas: dict, writers: int, readers: int, seconds: float):
+    path = f"{tempfile.mkdtemp(prefix='bench-pragmas-')}/bench.db"
+    engine = make_engine(path, pragmas)
+    counts = {"writes": 0, "reads": 0, "locked": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def bump(key: str) -> None:
+        with lock:
+            counts[key] += 1
+
+    def writer(worker: int) -> None:
+        n = 0
+        while time.perf_counter() < deadline:
+            n += 1
+            try:
+                with engine.begin() as conn:
+                    if n % 2:
+                        conn.execute(
+                            insert(Post).values(author_id=1 + worker, content=f"w{n}")
+                        )
+                    else:
+                        conn.execute(
+                            update(Post)
+                            .where(Post.id == 1 + (n * 7919) % 1000)
+                            .values(likes_count=Post.likes_count + 1)
+                        )
+                bump("writes")
+            except sa_exc.OperationalError:
+                bump("locked")
+
+    def reader() -> None:
+        while time.perf_counter() < deadline:
+            try:
+                with engine.connect() as conn:
+                    conn.execute(
+                        select(Post.id, Post.content)
+                        .order_by(Post.created_at.desc())
+                        .limit(50)
+                    ).all()
+                bump("reads")
+            except sa_exc.OperationalError:
+                bump("locked")
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    threads += [threading.Thread(target=reader) for _ in range(readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+
+    print(
+        f"{label:>7}: writes/s={counts['writes'] / seconds:8.0f} "
+        f"reads/s={counts['reads'] / seconds:8.0f} locked={counts['locked']}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+    tuned = dict(sqlite_pragmas(), busy_timeout=DEFAULT_PRAGMAS["busy_timeout"])
+    run_profile("default", DEFAULT_PRAGMAS, args.writers, args.readers, args.seconds)
+    run_profile("tuned", tuned, args.writers, args.readers, args.seconds)
@@ -0,0 +1,49 @@
+"""Per-request token verification cost with and without the token cache.
+
+Run from backend/app:
+
+    python -m benchmarks.bench_token_cache --clients 100 --requests 100000
+"""
+
+import argparse
+import random
+import time
+
+from utils.auth import (
+    create_access_token,
+    decode_access_token,
+    decode_access_token_cached,
+    token_cache,
+)
+
+
+def run(decode, tokens: list[str], requests: int) -> float:
+    rng = random.Random(0)
+    picks = [rng.choice(tokens) for _ in range(requests)]
+    start = time.perf_counter()
+    for token in picks:
+        decode(token)
+    return (time.perf_counter() - start) / requests
+
+
+def main(clients: int, requests: int):
+    tokens = [create_access_token(data={"sub": i}) for i in range(1, clients + 1)]
+
+    uncached = run(decode_access_token, tokens, requests)
+    token_cache.clear()
+    cached = run(decode_access_token_cached, tokens, requests)
+    stats = token_cache.stats()
+
+    print(f"clients={clients} requests={requests}")
+    print(f"  python-jose decode : {uncached * 1e6:8.2f} us/request")
+    print(f"  cached decode      : {cached * 1e6:8.2f} us/request")
+    print(f"  speedup            : {uncached / cached:8.1f}x")
+    print(f"  cache hits={stats['hits']} misses={stats['misses']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=100_000)
+    args = parser.parse_args()
+    main(args.clients, args.requests)
@@ -2,6 +2,15 @@ import os
 from typing import Optional  # For future use
 
 
+def _async_database_url(url: str) -> str:
+    """Map a sync database URL onto the matching async driver"""
+    if url.startswith("sqlite:"):
+        return "sqlite+aiosqlite:" + url[len("sqlite:") :]
+    if url.startswith("postgresql:"):
+        return "postgresql+asyncpg:" + url[len("postgresql:") :]
+    return url
+
+
 class Settings:
     # API Settings
     APP_NAME: str = "Workforce Solutions API"
@@ -12,8 +21,84 @@ class Settings:
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
 
+    # Verified-token cache (entries expire at the token's exp claim)
+    TOKEN_CACHE_SIZE: int = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+
+    # Authenticated-user cache, per process. Profile writes invalidate it in
+    # the process that served them; other workers catch up within the TTL
+    PRINCIPAL_CACHE_SIZE: int = int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000"))
+    PRINCIPAL_CACHE_TTL_SECONDS: int = int(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "5"))
+
+    # Password hashing pool (0 workers hashes inline on the threadpool)
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32"))
+
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./workforce_solutions.db")
+    # Connection pool (queue pools only; in-memory SQLite keeps its own pool)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "-1"))  # seconds, -1 = never
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "false").lower() in ("1", "true", "yes")
+    # SQLite PRAGMAs applied to every new connection; empty string skips one
+    SQLITE_JOURNAL_MODE: str = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_MMAP_SIZE: str = os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))
+    SQLITE_CACHE_SIZE: str = os.getenv("SQLITE_CACHE_SIZE", "-64000")  # negative = KiB
+    SQLITE_BUSY_TIMEOUT_MS: str = os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")
+    SQLITE_TEMP_STORE: str = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
+    # Serve the opportunities, posts and network routes from AsyncSession
+    USE_ASYNC_DB: bool = os.getenv("USE_ASYNC_DB", "false").lower() in ("1", "true", "yes")
+    ASYNC_DATABASE_URL: str = os.getenv(
+        "ASYNC_DATABASE_URL", _async_database_url(DATABASE_URL)
+    )
+
+    # Post likes: buffer deltas in memory and flush them in one UPDATE per interval
+    LIKE_WRITE_BEHIND: bool = os.getenv("LIKE_WRITE_BEHIND", "false").lower() in ("1", "true", "yes")
+    LIKE_FLUSH_INTERVAL_MS: int = int(os.getenv("LIKE_FLUSH_INTERVAL_MS", "200"))
+
+    # Home timelines: per-user ring buffer size, users kept in memory, and the
+    # follower count above which an author's posts are merged in at read time
+    TIMELINE_SIZE: int = int(os.getenv("TIMELINE_SIZE", "800"))
+    TIMELINE_MAX_USERS: int = int(os.getenv("TIMELINE_MAX_USERS", "10000"))
+    TIMELINE_FANOUT_LIMIT: int = int(os.getenv("TIMELINE_FANOUT_LIMIT", "1000"))
+    # Fan-out is per process; a first-page read rebuilds a timeline older than
+    # this, so posts made through other workers show up within it (0 disables)
+    TIMELINE_TTL_SECONDS: int = int(os.getenv("TIMELINE_TTL_SECONDS", "60"))
+
+    # In-memory recommendation index (GET /opportunities/recommended). It is per
+    # process, so it is reloaded this long after a load to pick up opportunities
+    # changed through other workers (0 disables)
+    RECOMMENDATION_INDEX_TTL_SECONDS: int = int(os.getenv("RECOMMENDATION_INDEX_TTL_SECONDS", "300"))
+    # Same for the user x term matrix behind GET /network/similar
+    SIMILARITY_INDEX_TTL_SECONDS: int = int(os.getenv("SIMILARITY_INDEX_TTL_SECONDS", "300"))
+    # And for the name/skill prefix index behind GET /network/autocomplete
+    AUTOCOMPLETE_INDEX_TTL_SECONDS: int = int(os.getenv("AUTOCOMPLETE_INDEX_TTL_SECONDS", "300"))
+
+    # Background job that recomputes drifted posts.comments_count (0 disables)
+    COMMENT_RECONCILE_INTERVAL_SECONDS: int = int(os.getenv("COMMENT_RECONCILE_INTERVAL_SECONDS", "3600"))
+    COMMENT_RECONCILE_BATCH_SIZE: int = int(os.getenv("COMMENT_RECONCILE_BATCH_SIZE", "1000"))
+
+    # Most user ids one /network/batch request may ask for
+    USER_BATCH_MAX_IDS: int = int(os.getenv("USER_BATCH_MAX_IDS", "500"))
+
+    # Most applications one bulk status update may change
+    APPLICATION_STATUS_BATCH_MAX: int = int(os.getenv("APPLICATION_STATUS_BATCH_MAX", "1000"))
+
+    # Builder dashboard summaries (GET /opportunities/mine/summary), per creator;
+    # applies and status changes invalidate explicitly
+    SUMMARY_CACHE_SIZE: int = int(os.getenv("SUMMARY_CACHE_SIZE", "10000"))
+    SUMMARY_CACHE_TTL_SECONDS: int = int(os.getenv("SUMMARY_CACHE_TTL_SECONDS", "300"))
+
+    # Bulk imports (POST /opportunities/import, manage.py import): rows per
+    # INSERT transaction, and how many failed rows a report lists
+    BULK_IMPORT_CHUNK_SIZE: int = int(os.getenv("BULK_IMPORT_CHUNK_SIZE", "1000"))
+    BULK_IMPORT_MAX_ERRORS: int = int(os.getenv("BULK_IMPORT_MAX_ERRORS", "1000"))
+
+    # Internal endpoints (/internal/*): callers must send this as X-Internal-Token.
+    # Unset, the endpoints answer 403 to everyone
+    INTERNAL_TOKEN: Optional[str] = os.getenv("INTERNAL_TOKEN")
 
     # CORS
     CORS_ORIGINS: list = [
@@ -1,7 +1,58 @@
-from sqlalchemy import create_engine
+import re
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from config import settings
+from utils.pool_metrics import PoolMetrics, instrumented_pool_class
+
+# Pool statistics, served by /internal/db-pool
+pool_metrics = {"sync": PoolMetrics(), "async": PoolMetrics()}
+
+
+def _pool_options(url: str, queue_pool: type[QueuePool], metrics: PoolMetrics) -> dict:
+    """Engine keyword arguments for the configured connection pool"""
+    options = {
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    # In-memory SQLite needs its single-connection pool, which has no queue
+    if ":memory:" not in url and "mode=memory" not in url:
+        options.update(
+            poolclass=instrumented_pool_class(queue_pool, metrics),
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+    return options
+
+
+def sqlite_pragmas() -> dict:
+    """PRAGMAs from settings, skipping any that are configured empty"""
+    pragmas = {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        "temp_store": settings.SQLITE_TEMP_STORE,
+    }
+    for name, value in pragmas.items():
+        # Values are interpolated into SQL, so only allow keywords and integers
+        if value and not re.fullmatch(r"-?\d+|[A-Za-z]+", value):
+            raise ValueError(f"Invalid SQLite PRAGMA value for {name}: {value!r}")
+    return {name: value for name, value in pragmas.items() if value}
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record, pragmas: dict | None = None):
+    """connect-event hook that tunes each new SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    for name, value in (sqlite_pragmas() if pragmas is None else pragmas).items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
 
 # Create engine
 engine = create_engine(
@@ -9,11 +60,33 @@ engine = create_engine(
     connect_args={"check_same_thread": False}
     if "sqlite" in settings.DATABASE_URL
     else {},
+    **_pool_options(settings.DATABASE_URL, QueuePool, pool_metrics["sync"]),
 )
+pool_metrics["sync"].attach(engine)
+if engine.dialect.name == "sqlite":
+    event.listen(engine, "connect", apply_sqlite_pragmas)
 
 # Create session
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine and session, only built when the async stack is enabled so the
+# sync deployment does not need an async driver installed
+async_engine = None
+AsyncSessionLocal = None
+if settings.USE_ASYNC_DB:
+    async_engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL,
+        **_pool_options(
+            settings.ASYNC_DATABASE_URL, AsyncAdaptedQueuePool, pool_metrics["async"]
+        ),
+    )
+    pool_metrics["async"].attach(async_engine.sync_engine)
+    if async_engine.dialect.name == "sqlite":
+        event.listen(async_engine.sync_engine, "connect", apply_sqlite_pragmas)
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+
 # Base class for models
 Base = declarative_base()
 
@@ -27,8 +100,50 @@ def get_db():
         db.close()
 
 
+# Dependency to get an async database session
+async def get_async_db():
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database is disabled; set USE_ASYNC_DB=true")
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 # Initialize database tables
 def init_db():
-    from models import user, opportunity, application
+    from models import user, opportunity, application, post, follow, comment, skill
+    from utils.skills import migrate_opportunity_skills
 
     Base.metadata.create_all(bind=engine)
+    create_missing_indexes()
+    create_search_indexes()
+    # One-time copy of legacy required_skills JSON; a no-op once migrated
+    with SessionLocal() as db:
+        migrate_opportunity_skills(db)
+
+
+def create_missing_indexes(bind=engine):
+    """Add indexes declared on tables that already existed (create_all skips them).
+
+    A unique index the existing rows violate stops startup: code such as
+    insert_application relies on it to reject duplicates. For applications,
+    ``manage.py dedupe-applications`` clears the way.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(bind=bind, checkfirst=True)
+            except IntegrityError as exc:
+                raise RuntimeError(
+                    f"Cannot create unique index {index.name}: {table.name} has duplicate "
+                    "rows. Run `python manage.py dedupe-applications` (for applications) "
+                    "or remove the duplicates, then start again."
+                ) from exc
+
+
+def create_search_indexes():
+    """Build full-text indexes missing from an existing database"""
+    from utils.search import full_text_indexes
+
+    with engine.begin() as conn:
+        for index in full_text_indexes:
+            index.ensure(conn)
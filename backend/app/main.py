@@ -2,16 +2,32 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from config import settings  # type: ignore
-from database import init_db  # type: ignore
-from routes import auth, profile, opportunities, network, posts  # type: ignore
+from database import SessionLocal, async_engine, init_db  # type: ignore
+from routes import auth, profile, opportunities, network, posts, comments, internal  # type: ignore
+from routes import opportunities_async, posts_async, network_async  # type: ignore
+from routes import with_async_twins  # type: ignore
+from utils.autocomplete import autocomplete_index  # type: ignore
+from utils.comments import comment_reconciler  # type: ignore
+from utils.hashing import hashing_pool  # type: ignore
+from utils.likes import like_aggregator  # type: ignore
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # on startup
     init_db()
+    with SessionLocal() as db:
+        autocomplete_index.load(db)
+    if settings.LIKE_WRITE_BEHIND:
+        like_aggregator.start()
+    comment_reconciler.start()
     yield
     # on shutdown
+    comment_reconciler.stop()
+    like_aggregator.stop()
+    hashing_pool.shutdown()
+    if async_engine is not None:
+        await async_engine.dispose()
 
 
 # Initialize FastAPI app
@@ -24,15 +40,25 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 
 # Include routers
 app.include_router(auth.router)
 app.include_router(profile.router)
-app.include_router(opportunities.router)
-app.include_router(network.router)
-app.include_router(posts.router)
+if settings.USE_ASYNC_DB:
+    app.include_router(
+        with_async_twins(opportunities.router, opportunities_async.router)
+    )
+    app.include_router(with_async_twins(network.router, network_async.router))
+    app.include_router(with_async_twins(posts.router, posts_async.router))
+else:
+    app.include_router(opportunities.router)
+    app.include_router(network.router)
+    app.include_router(posts.router)
+app.include_router(comments.router)
+app.include_router(internal.router)
 
 
 # Root endpoint
@@ -0,0 +1,127 @@
+"""Maintenance commands for the API database.
+
+Run from backend/app:
+
+    python manage.py migrate-skills
+    python manage.py purge-orphans
+    python manage.py dedupe-applications
+    python manage.py import opportunities listings.jsonl --creator-id 1
+    python manage.py import users accounts.csv --workers 8
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+
+from config import settings
+from database import Base, SessionLocal, create_missing_indexes, engine
+
+
+def migrate_skills(args) -> None:
+    """Copy legacy required_skills JSON into the skills tables"""
+    from models import skill  # noqa: F401  (registers the tables)
+    from utils.skills import migrate_opportunity_skills
+
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        migrated = migrate_opportunity_skills(db, batch_size=args.batch_size)
+    print(f"migrated skills for {migrated} opportunities")
+
+
+def purge_orphans(args) -> None:
+    """Delete applications, skill rows, likes and comments whose parent is gone"""
+    from models import user, opportunity, application, post, comment, skill  # noqa: F401
+    from utils.cascade import purge_orphans
+
+    with SessionLocal() as db:
+        purged = purge_orphans(db, batch_size=args.batch_size)
+    for table, count in purged.items():
+        print(f"purged {count} orphaned {table} rows")
+
+
+def dedupe_applications(args) -> None:
+    """Delete repeat applications, then add the unique (opportunity, applicant) index"""
+    from models import user, opportunity, application, post, comment, skill  # noqa: F401
+    from utils.applications import dedupe_applications
+
+    with SessionLocal() as db:
+        deleted = dedupe_applications(db)
+        db.commit()
+    print(f"deleted {deleted} duplicate applications")
+    create_missing_indexes()
+
+
+def import_rows(args) -> None:
+    """Stream a JSONL or CSV file of opportunities or users into the database"""
+    from models import user, opportunity, application, post, comment, skill  # noqa: F401
+    from models.user import User
+    from utils.auth import get_password_hash
+    from utils.bulk_import import (
+        IMPORT_EXTENSIONS,
+        OpportunityImport,
+        UserImport,
+        parse_rows,
+        run_import,
+    )
+
+    fmt = args.format or IMPORT_EXTENSIONS.get(os.path.splitext(args.path)[1].lower())
+    if fmt is None:
+        sys.exit(f"cannot tell the format of {args.path}; pass --format")
+
+    with ExitStack() as stack:
+        db = stack.enter_context(SessionLocal())
+        if args.kind == "opportunities":
+            if args.creator_id is None or db.get(User, args.creator_id) is None:
+                sys.exit("opportunities need --creator-id of an existing user")
+            importer = OpportunityImport(args.creator_id)
+        elif args.workers:
+            pool = stack.enter_context(ProcessPoolExecutor(max_workers=args.workers))
+            importer = UserImport(
+                lambda passwords: list(pool.map(get_password_hash, passwords, chunksize=16))
+            )
+        else:
+            importer = UserImport()
+        lines = stack.enter_context(open(args.path, newline="", encoding="utf-8-sig"))
+        report = run_import(
+            db, parse_rows(lines, fmt), importer, args.chunk_size, settings.BULK_IMPORT_MAX_ERRORS
+        )
+
+    for error in report.errors:
+        print(f"line {error.line}: {error.error}", file=sys.stderr)
+    print(f"imported {report.imported} {args.kind}, {report.failed} rows failed")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("migrate-skills", help=migrate_skills.__doc__)
+    command.add_argument("--batch-size", type=int, default=1000)
+    command.set_defaults(handler=migrate_skills)
+
+    command = commands.add_parser("purge-orphans", help=purge_orphans.__doc__)
+    command.add_argument("--batch-size", type=int, default=1000)
+    command.set_defaults(handler=purge_orphans)
+
+    command = commands.add_parser("dedupe-applications", help=dedupe_applications.__doc__)
+    command.set_defaults(handler=dedupe_applications)
+
+    command = commands.add_parser("import", help=import_rows.__doc__)
+    command.add_argument("kind", choices=("opportunities", "users"))
+    command.add_argument("path")
+    command.add_argument("--format", choices=("jsonl", "csv"))
+    command.add_argument("--creator-id", type=int, help="owner of imported opportunities")
+    command.add_argument("--chunk-size", type=int, default=settings.BULK_IMPORT_CHUNK_SIZE)
+    command.add_argument(
+        "--workers", type=int, default=0, help="processes for bcrypt when importing users"
+    )
+    command.set_defaults(handler=import_rows)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,19 @@
 from models.user import User
 from models.opportunity import Opportunity
 from models.application import Application
+from models.post import Post, PostLike
+from models.follow import Follow
+from models.comment import Comment
+from models.skill import Skill, opportunity_skills
 
-__all__ = ["User", "Opportunity", "Application"]
+__all__ = [
+    "User",
+    "Opportunity",
+    "Application",
+    "Post",
+    "PostLike",
+    "Follow",
+    "Comment",
+    "Skill",
+    "opportunity_skills",
+]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
@@ -8,12 +8,24 @@ class Application(Base):
     __tablename__ = "applications"
 
     id = Column(Integer, primary_key=True, index=True)
-    opportunity_id = Column(Integer, ForeignKey("opportunities.id"))
+    opportunity_id = Column(Integer, ForeignKey("opportunities.id", ondelete="CASCADE"))
     applicant_id = Column(Integer, ForeignKey("users.id"))
     message = Column(Text)
     status = Column(String, default="pending")  # pending, accepted, rejected
     created_at = Column(DateTime, default=datetime.now)
 
+    __table_args__ = (
+        # One application per applicant; apply relies on it instead of a pre-check
+        Index(
+            "ux_applications_opportunity_id_applicant_id",
+            "opportunity_id",
+            "applicant_id",
+            unique=True,
+        ),
+        # Per-status counts for an opportunity, read from the index alone
+        Index("ix_applications_opportunity_id_status", "opportunity_id", "status"),
+    )
+
     # Relationships
     opportunity = relationship("Opportunity", back_populates="applications")
     applicant = relationship("User", back_populates="applications")
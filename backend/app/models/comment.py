@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, DateTime, Text, ForeignKey, Index
+from datetime import datetime
+from database import Base  # type: ignore
+
+
+class Comment(Base):
+    __tablename__ = "comments"
+
+    id = Column(Integer, primary_key=True, index=True)
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), nullable=False)
+    author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    content = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.now)
+
+    __table_args__ = (
+        # Per-post listing in keyset order, and per-post counts for reconciliation
+        Index("ix_comments_post_id_created_at", "post_id", "created_at", "id"),
+    )
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index
+from datetime import datetime
+from database import Base  # type: ignore
+
+
+class Follow(Base):
+    """follower_id follows followee_id"""
+
+    __tablename__ = "follows"
+
+    follower_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    followee_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    created_at = Column(DateTime, default=datetime.now)
+
+    __table_args__ = (
+        # Fan-out on write looks up an author's followers
+        Index("ix_follows_followee_id", "followee_id"),
+        {"sqlite_with_rowid": False},
+    )
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 from database import Base
+from utils.search import FullTextIndex  # type: ignore
 
 
 class Opportunity(Base):
@@ -26,4 +27,23 @@ class Opportunity(Base):
     creator = relationship(
         "User", back_populates="opportunities_created", foreign_keys=[creator_id]
     )
-    applications = relationship("Application", back_populates="opportunity")
+    # Never loaded to cascade a delete: utils.cascade removes applications with
+    # one DELETE, and passive_deletes stops the ORM nulling them out row by row
+    applications = relationship(
+        "Application", back_populates="opportunity", passive_deletes=True
+    )
+
+    __table_args__ = (
+        # Keyset pagination of the board, filtered by status or not:
+        # ORDER BY created_at DESC, id DESC
+        Index("ix_opportunities_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_opportunities_created_at_id", "created_at", "id"),
+        # A creator's own opportunities (dashboard summary)
+        Index(
+            "ix_opportunities_creator_id_created_at_id", "creator_id", "created_at", "id"
+        ),
+    )
+
+
+# FTS5 index over title and description (GET /opportunities/search)
+opportunity_search = FullTextIndex(Opportunity.__table__, "title", "description")
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, DateTime, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
-from app.database import Base  # type: ignore [import-not-found]
+from database import Base  # type: ignore
+from utils.search import FullTextIndex  # type: ignore
 
 
 class Post(Base):
@@ -17,3 +18,29 @@ class Post(Base):
 
     # Relationships
     author = relationship("User", back_populates="posts")
+
+    __table_args__ = (
+        # Keyset pagination of the feed: ORDER BY created_at DESC, id DESC
+        Index("ix_posts_created_at_id", "created_at", "id"),
+        # Home timeline rebuilds and high-fanout authors: newest posts by author
+        Index("ix_posts_author_id_id", "author_id", "id"),
+    )
+
+
+# FTS5 index over post text, maintained by triggers (GET /posts/search)
+post_search = FullTextIndex(Post.__table__, "content")
+
+
+class PostLike(Base):
+    """One row per (post, user) like; the unique key makes liking idempotent"""
+
+    __tablename__ = "post_likes"
+
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    created_at = Column(DateTime, default=datetime.now)
+
+    __table_args__ = (
+        # The composite key is the row identity, so SQLite can skip the rowid
+        {"sqlite_with_rowid": False},
+    )
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Index, Table
+from database import Base  # type: ignore
+
+
+class Skill(Base):
+    __tablename__ = "skills"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, index=True, nullable=False)  # normalized, lowercase
+
+
+# Which skills an opportunity requires
+opportunity_skills = Table(
+    "opportunity_skills",
+    Base.metadata,
+    Column("opportunity_id", Integer, ForeignKey("opportunities.id", ondelete="CASCADE"), primary_key=True),
+    Column("skill_id", Integer, ForeignKey("skills.id", ondelete="CASCADE"), primary_key=True),
+    # Skill filters start from the skill and collect opportunity ids
+    Index("ix_opportunity_skills_skill_id_opportunity_id", "skill_id", "opportunity_id"),
+    sqlite_with_rowid=False,
+)
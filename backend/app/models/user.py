@@ -1,7 +1,7 @@
 from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
-from app.database import Base  # type: ignore [import-not-found]
+from database import Base  # type: ignore
 
 
 class User(Base):
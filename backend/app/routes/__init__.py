@@ -1,3 +1,34 @@
-from routes import auth, profile, opportunities, network
+from fastapi import APIRouter
+from routes import auth, profile, opportunities, network, posts, comments, internal
+from routes import opportunities_async, posts_async, network_async
 
-__all__ = ["auth", "profile", "opportunities", "network"]
+
+def with_async_twins(sync_router: APIRouter, async_router: APIRouter) -> APIRouter:
+    """Replace sync routes with their async twins (same path and methods).
+
+    Routes keep the sync router's declaration order, so static paths such as
+    ``/posts/search`` still win over ``/posts/{post_id}``. Sync routes without
+    a twin are kept as-is and async-only routes are appended.
+    """
+    twins = {
+        (route.path, frozenset(route.methods)): route for route in async_router.routes
+    }
+    merged = APIRouter()
+    for route in sync_router.routes:
+        merged.routes.append(twins.pop((route.path, frozenset(route.methods)), route))
+    merged.routes.extend(twins.values())
+    return merged
+
+
+__all__ = [
+    "auth",
+    "profile",
+    "opportunities",
+    "network",
+    "posts",
+    "internal",
+    "opportunities_async",
+    "posts_async",
+    "network_async",
+    "with_async_twins",
+]
@@ -1,32 +1,84 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from database import get_db
 from models.user import User
 from schemas.user import UserCreate, UserLogin, Token
-from utils.auth import verify_password, get_password_hash, create_access_token
+from utils.auth import create_access_token
+from utils.autocomplete import autocomplete_index
+from utils.hashing import HashingPoolBusy, hash_password_async, verify_password_async
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
-@router.post("/signup", response_model=Token, status_code=status.HTTP_201_CREATED)
-def signup(user_data: UserCreate, db: Session = Depends(get_db)):
-    """Register a new user"""
-    # Check if user exists
-    if db.query(User).filter(User.email == user_data.email).first():
-        raise HTTPException(status_code=400, detail="Email already registered")
-    if db.query(User).filter(User.username == user_data.username).first():
-        raise HTTPException(status_code=400, detail="Username already taken")
-
-    # Create new user
+def _hashing_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication service is busy, please retry",
+        headers={"Retry-After": "1"},
+    )
+
+
+def _check_available(db: Session, user_data: UserCreate) -> None:
+    """400 if the email or username is taken; releases the connection after"""
+    try:
+        if db.query(User).filter(User.email == user_data.email).first():
+            raise HTTPException(status_code=400, detail="Email already registered")
+        if db.query(User).filter(User.username == user_data.username).first():
+            raise HTTPException(status_code=400, detail="Username already taken")
+    finally:
+        db.close()
+
+
+def _insert_user(db: Session, user_data: UserCreate, hashed_password: str) -> User:
     new_user = User(
         email=user_data.email,
         username=user_data.username,
-        hashed_password=get_password_hash(user_data.password),
+        hashed_password=hashed_password,
         full_name=user_data.full_name,
     )
     db.add(new_user)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent signup took the email or username while we hashed
+        db.rollback()
+        _check_available(db, user_data)
+        raise
     db.refresh(new_user)
+    return new_user
+
+
+def _password_hash_for(db: Session, email: str) -> tuple[int, str] | None:
+    """(id, hashed password) of the user with this email; releases the connection after"""
+    try:
+        user = db.query(User).filter(User.email == email).first()
+        return (user.id, user.hashed_password) if user else None
+    finally:
+        db.close()
+
+
+@router.post("/signup", response_model=Token, status_code=status.HTTP_201_CREATED)
+async def signup(
+    user_data: UserCreate,
+    db: Session = Depends(get_db),
+    # Only checks out a connection for the insert, once bcrypt is done
+    write_db: Session = Depends(get_db, use_cache=False),
+):
+    """Register a new user.
+
+    Only the queries run on the threadpool; bcrypt is awaited on the hashing
+    pool, so no worker thread waits on it.
+    """
+    await run_in_threadpool(_check_available, db, user_data)
+    try:
+        hashed_password = await hash_password_async(user_data.password)
+    except HashingPoolBusy:
+        raise _hashing_busy()
+
+    new_user = await run_in_threadpool(_insert_user, write_db, user_data, hashed_password)
+    autocomplete_index.upsert(new_user)
 
     # Create access token
     access_token = create_access_token(data={"sub": new_user.id})
@@ -34,11 +86,19 @@ def signup(user_data: UserCreate, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=Token)
-def login(user_data: UserLogin, db: Session = Depends(get_db)):
+async def login(user_data: UserLogin, db: Session = Depends(get_db)):
     """Login user"""
-    user = db.query(User).filter(User.email == user_data.email).first()
-    if not user or not verify_password(user_data.password, user.hashed_password):
+    credentials = await run_in_threadpool(_password_hash_for, db, user_data.email)
+    if credentials is None:
+        raise HTTPException(status_code=401, detail="Invalid email or password")
+    user_id, hashed_password = credentials
+
+    try:
+        valid = await verify_password_async(user_data.password, hashed_password)
+    except HashingPoolBusy:
+        raise _hashing_busy()
+    if not valid:
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
-    access_token = create_access_token(data={"sub": user.id})
+    access_token = create_access_token(data={"sub": user_id})
     return {"access_token": access_token, "token_type": "bearer"}
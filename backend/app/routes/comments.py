@@ -0,0 +1,92 @@
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import datetime
+from database import get_db  # type: ignore
+from models.user import User  # type: ignore
+from models.post import Post  # type: ignore
+from models.comment import Comment  # type: ignore
+from schemas.comment import CommentCreate, CommentResponse  # type: ignore
+from utils.comments import change_comments_count  # type: ignore
+from utils.dependencies import get_current_user  # type: ignore
+from utils.pagination import decode_cursor, set_next_cursor  # type: ignore
+
+router = APIRouter(prefix="/posts/{post_id}/comments", tags=["Comments"])
+
+
+@router.post("", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
+def create_comment(
+    post_id: int,
+    comment_data: CommentCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Comment on a post; the post's comments_count moves in the same transaction"""
+    if db.execute(change_comments_count(post_id, 1)).rowcount == 0:
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Post not found")
+
+    comment = Comment(
+        post_id=post_id, author_id=current_user.id, content=comment_data.content
+    )
+    db.add(comment)
+    db.commit()
+    db.refresh(comment)
+    return comment
+
+
+@router.get("", response_model=List[CommentResponse])
+def get_comments(
+    post_id: int,
+    response: Response,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Get a post's comments, oldest first.
+
+    Full pages carry an X-Next-Cursor header; pass it back as ``cursor`` to
+    continue from the (post_id, created_at, id) index.
+    """
+    query = (
+        select(Comment)
+        .where(Comment.post_id == post_id)
+        .order_by(Comment.created_at, Comment.id)
+    )
+    if cursor:
+        created_at, comment_id = decode_cursor(cursor, datetime, int)
+        query = query.where(
+            tuple_(Comment.created_at, Comment.id) > (created_at, comment_id)
+        )
+
+    comments = db.scalars(query.limit(limit)).all()
+    if not comments and not cursor and not db.get(Post, post_id):
+        raise HTTPException(status_code=404, detail="Post not found")
+    set_next_cursor(response, comments, limit, "created_at", "id")
+    return comments
+
+
+@router.delete("/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_comment(
+    post_id: int,
+    comment_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Delete a comment (comment author or post author)"""
+    comment = db.get(Comment, comment_id)
+    if not comment or comment.post_id != post_id:
+        raise HTTPException(status_code=404, detail="Comment not found")
+    if comment.author_id != current_user.id:
+        post_author_id = db.scalar(select(Post.author_id).where(Post.id == post_id))
+        if post_author_id != current_user.id:
+            raise HTTPException(
+                status_code=403, detail="Not authorized to delete this comment"
+            )
+
+    db.delete(comment)
+    db.execute(change_comments_count(post_id, -1))
+    db.commit()
+    return None
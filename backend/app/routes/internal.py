@@ -0,0 +1,65 @@
+import hmac
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from typing import Optional
+from config import settings  # type: ignore
+from database import async_engine, get_db, pool_metrics  # type: ignore
+from schemas.bulk_import import BulkImportResult  # type: ignore
+from utils.bulk_import import (  # type: ignore
+    UserImport,
+    import_format,
+    parse_rows,
+    request_lines,
+    run_import,
+)
+
+
+def require_internal_token(x_internal_token: Optional[str] = Header(None)):
+    """Guard internal endpoints; with no settings.INTERNAL_TOKEN configured
+    they are closed to everyone"""
+    if not settings.INTERNAL_TOKEN or not hmac.compare_digest(
+        (x_internal_token or "").encode(), settings.INTERNAL_TOKEN.encode()
+    ):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["Internal"],
+    include_in_schema=False,
+    dependencies=[Depends(require_internal_token)],
+)
+
+
+@router.get("/db-pool")
+def get_db_pool_metrics():
+    """Connection pool gauges, checkout waits, hold times and timeouts"""
+    metrics = {"sync": pool_metrics["sync"].snapshot()}
+    if async_engine is not None:
+        metrics["async"] = pool_metrics["async"].snapshot()
+    return metrics
+
+
+@router.post("/import/users", response_model=BulkImportResult)
+async def import_users(request: Request, db: Session = Depends(get_db)):
+    """Bulk-create accounts from a streamed JSONL or CSV body of UserCreate rows.
+
+    Like every /internal route this needs the X-Internal-Token header and is
+    refused outright when no INTERNAL_TOKEN is configured. Every password is bcrypt-hashed here, one at a time; large migrations
+    should use ``manage.py import users --workers N`` instead.
+    """
+    fmt = import_format(request.headers.get("content-type"))
+    if fmt is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send application/x-ndjson or text/csv",
+        )
+    return await run_in_threadpool(
+        run_import,
+        db,
+        parse_rows(request_lines(request), fmt),
+        UserImport(),
+        settings.BULK_IMPORT_CHUNK_SIZE,
+        settings.BULK_IMPORT_MAX_ERRORS,
+    )
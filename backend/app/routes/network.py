@@ -1,12 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Dict, Optional, List
+from config import settings
 from database import get_db
 from models.user import User
 from models.application import Application
-from schemas.user import UserResponse
+from models.follow import Follow
+from schemas.user import (
+    AutocompleteResponse,
+    SimilarUserResponse,
+    UserBatchRequest,
+    UserResponse,
+)
 from schemas.application import ApplicationResponse
+from utils.autocomplete import autocomplete_index
 from utils.dependencies import get_current_user
+from utils.similarity import SIMILARITY_METRICS, user_similarity_index
+from utils.timeline import timeline_store
 
 router = APIRouter(prefix="/network", tags=["Network"])
 
@@ -29,6 +41,110 @@ def get_network(
     return users
 
 
+# SQLite integers are signed 64-bit; larger ids cannot be bound as parameters
+MAX_USER_ID = 2**63 - 1
+
+
+def _users_by_id(db: Session, ids: List[int]) -> Dict[int, User]:
+    """Users for ``ids`` keyed by id, in one IN query; unknown ids are left out.
+
+    Always read from the database (not the principal cache), so a batch is
+    never older than GET /network/{user_id}.
+    """
+    ids = list(dict.fromkeys(ids))
+    if len(ids) > settings.USER_BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.USER_BATCH_MAX_IDS} ids per request",
+        )
+    if any(not -MAX_USER_ID <= user_id <= MAX_USER_ID for user_id in ids):
+        raise HTTPException(status_code=400, detail="User id out of range")
+    if not ids:
+        return {}
+    return {user.id: user for user in db.query(User).filter(User.id.in_(ids))}
+
+
+@router.get("/batch", response_model=Dict[int, UserResponse])
+def get_users_batch(
+    ids: str = Query(..., description="Comma-separated user ids"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Profiles for several users at once, keyed by id"""
+    try:
+        user_ids = [int(user_id) for user_id in ids.split(",") if user_id.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be comma-separated integers")
+    return _users_by_id(db, user_ids)
+
+
+@router.post("/batch", response_model=Dict[int, UserResponse])
+def post_users_batch(
+    batch: UserBatchRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Profiles for several users at once, for id lists too long for a URL"""
+    return _users_by_id(db, batch.ids)
+
+
+@router.get("/autocomplete", response_model=AutocompleteResponse)
+def autocomplete(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(8, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Users whose username or name starts with ``q`` and the most popular
+    skills starting with it, answered from the in-memory prefix index"""
+    if not autocomplete_index.loaded:
+        autocomplete_index.load(db)
+    users, skills = autocomplete_index.suggest(q, limit, exclude_user=current_user.id)
+    return {
+        "users": [user._asdict() for user in users],
+        "skills": [skill._asdict() for skill in skills],
+    }
+
+
+@router.get("/similar", response_model=List[SimilarUserResponse])
+def get_similar_users(
+    metric: str = "cosine",
+    limit: int = 20,
+    mode: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Users whose skills and interests are closest to the current user's.
+
+    ``metric`` is ``cosine`` or ``jaccard``. Every user is scored in one
+    vectorized pass over the in-memory user x term matrix (see
+    utils.similarity); the top ``limit`` are loaded with a single query.
+    """
+    if metric not in SIMILARITY_METRICS:
+        raise HTTPException(status_code=400, detail="metric must be 'cosine' or 'jaccard'")
+    if not user_similarity_index.loaded:
+        user_similarity_index.load(db)
+    picks = user_similarity_index.similar(
+        current_user, limit, metric, mode if mode in ["hustler", "builder"] else None
+    )
+    if not picks:
+        return []
+
+    users = {
+        user.id: user
+        for user in db.query(User).filter(User.id.in_([pick.user_id for pick in picks]))
+    }
+    return [
+        SimilarUserResponse(
+            **UserResponse.model_validate(users[pick.user_id]).model_dump(),
+            score=pick.score,
+            shared=pick.shared,
+        )
+        for pick in picks
+        if pick.user_id in users
+    ]
+
+
 @router.get("/{user_id}", response_model=UserResponse)
 def get_user_profile(
     user_id: int,
@@ -42,6 +158,45 @@ def get_user_profile(
     return user
 
 
+@router.post("/{user_id}/follow", status_code=status.HTTP_204_NO_CONTENT)
+def follow_user(
+    user_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Follow a user; following them again is a no-op"""
+    if user_id == current_user.id:
+        raise HTTPException(status_code=400, detail="You cannot follow yourself")
+    if not db.get(User, user_id):
+        raise HTTPException(status_code=404, detail="User not found")
+
+    try:
+        db.add(Follow(follower_id=current_user.id, followee_id=user_id))
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+    # The home timeline now draws on a different set of authors
+    timeline_store.invalidate(current_user.id)
+    return None
+
+
+@router.delete("/{user_id}/follow", status_code=status.HTTP_204_NO_CONTENT)
+def unfollow_user(
+    user_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Stop following a user"""
+    db.execute(
+        delete(Follow).where(
+            Follow.follower_id == current_user.id, Follow.followee_id == user_id
+        )
+    )
+    db.commit()
+    timeline_store.invalidate(current_user.id)
+    return None
+
+
 @router.get("/applications/my", response_model=List[ApplicationResponse])
 def get_my_applications(
     current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
@@ -0,0 +1,67 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, List
+from database import get_async_db  # type: ignore
+from models.user import User  # type: ignore
+from models.application import Application  # type: ignore
+from schemas.user import UserResponse  # type: ignore
+from schemas.application import ApplicationResponse  # type: ignore
+from utils.dependencies import get_current_user_async  # type: ignore
+
+# Async twins of routes/network.py, used when settings.USE_ASYNC_DB is on
+router = APIRouter(prefix="/network", tags=["Network"])
+
+# Routes of routes/network.py with no twin: they keep the sync session on the
+# threadpool, where index loads and rebuilds cannot stall the event loop
+SYNC_ONLY = {
+    ("/network/batch", "GET"),
+    ("/network/batch", "POST"),
+    ("/network/autocomplete", "GET"),
+    ("/network/similar", "GET"),
+    ("/network/{user_id}/follow", "POST"),
+    ("/network/{user_id}/follow", "DELETE"),
+}
+
+
+@router.get("", response_model=List[UserResponse])
+async def get_network(
+    skip: int = 0,
+    limit: int = 50,
+    mode: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    """Get network directory of users"""
+    query = select(User).where(User.id != current_user.id)
+
+    if mode and mode in ["hustler", "builder"]:
+        query = query.where(User.mode == mode)
+
+    result = await db.scalars(query.offset(skip).limit(limit))
+    return result.all()
+
+
+@router.get("/{user_id}", response_model=UserResponse)
+async def get_user_profile(
+    user_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    """Get specific user profile"""
+    user = await db.get(User, user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return user
+
+
+@router.get("/applications/my", response_model=List[ApplicationResponse])
+async def get_my_applications(
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get current user's applications"""
+    result = await db.scalars(
+        select(Application).where(Application.applicant_id == current_user.id)
+    )
+    return result.all()
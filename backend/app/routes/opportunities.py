@@ -1,18 +1,70 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import Select, select, tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import Optional, List
 from datetime import datetime
 import json
+from config import settings  # type: ignore
 from database import get_db  # type: ignore
 from models.user import User  # type: ignore
-from models.opportunity import Opportunity  # type: ignore
+from models.opportunity import Opportunity, opportunity_search  # type: ignore
 from models.application import Application  # type: ignore
-from schemas.opportunity import OpportunityCreate, OpportunityResponse  # type: ignore
-from schemas.application import ApplicationCreate, ApplicationResponse  # type: ignore
+from schemas.opportunity import (  # type: ignore
+    OpportunityCreate,
+    OpportunityResponse,
+    OpportunitySearchResult,
+    OpportunitySummary,
+    RecommendedOpportunity,
+)
+from schemas.bulk_import import BulkImportResult  # type: ignore
+from schemas.application import (  # type: ignore
+    ApplicationCreate,
+    ApplicationDetail,
+    ApplicationResponse,
+    ApplicationStatusBatch,
+    ApplicationStatusResult,
+)
+from utils.applications import (  # type: ignore
+    application_details,
+    application_options,
+    DECISION_STATUSES,
+    insert_application,
+    parse_expand,
+    set_application_statuses,
+)
+from utils.bulk_import import (  # type: ignore
+    OpportunityImport,
+    import_format,
+    parse_rows,
+    request_lines,
+    run_import,
+)
+from utils.cascade import delete_opportunities  # type: ignore
+from utils.dashboard import summary_cache  # type: ignore
 from utils.dependencies import get_current_user  # type: ignore
+from utils.pagination import (  # type: ignore
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+    set_next_cursor,
+)
+from utils.search import fts_query, marked_html  # type: ignore
+from utils.recommendations import recommendation_index, user_skills  # type: ignore
+from utils.skills import (  # type: ignore
+    SKILL_MATCH_MODES,
+    parse_skills_param,
+    set_opportunity_skills,
+    skills_filter,
+    skills_filter_key,
+)
 
 router = APIRouter(prefix="/opportunities", tags=["Opportunities"])
 
+# BM25 weight of a title match relative to a description match
+TITLE_WEIGHT = 10.0
+
 
 @router.post(
     "", response_model=OpportunityResponse, status_code=status.HTTP_201_CREATED
@@ -35,32 +87,226 @@ def create_opportunity(
             creator_id=current_user.id,
         )
         db.add(new_opportunity)
+        db.flush()
+        set_opportunity_skills(db, new_opportunity.id, opportunity_data.required_skills)
         db.commit()
         db.refresh(new_opportunity)
+        recommendation_index.upsert(new_opportunity, opportunity_data.required_skills)
+        summary_cache.invalidate_creator(current_user.id)
         return new_opportunity
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/import", response_model=BulkImportResult)
+async def import_opportunities(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Bulk-create opportunities from a streamed JSONL or CSV body.
+
+    Send the file as the raw body with Content-Type application/x-ndjson or
+    text/csv. Rows are validated like POST /opportunities and inserted in
+    chunks; invalid rows are reported by line and do not stop the import.
+    """
+    fmt = import_format(request.headers.get("content-type"))
+    if fmt is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send application/x-ndjson or text/csv",
+        )
+    # Parsing and inserts run on a worker thread, pulling the body as they go
+    return await run_in_threadpool(
+        run_import,
+        db,
+        parse_rows(request_lines(request), fmt),
+        OpportunityImport(current_user.id),
+        settings.BULK_IMPORT_CHUNK_SIZE,
+        settings.BULK_IMPORT_MAX_ERRORS,
+    )
+
+
+def opportunity_list_query(
+    skip: int,
+    status: Optional[str],
+    skills: Optional[str],
+    skills_match: str,
+    cursor: Optional[str],
+) -> tuple[Select, tuple[str, str]]:
+    """The filtered, newest-first SELECT behind GET /opportunities (sync and
+    async) and the filter key its cursors carry"""
+    if skills_match not in SKILL_MATCH_MODES:
+        raise HTTPException(status_code=400, detail="skills_match must be 'any' or 'all'")
+    skill_names = parse_skills_param(skills)
+    filters = (status or "", skills_filter_key(skill_names, skills_match))
+
+    query = select(Opportunity).order_by(Opportunity.created_at.desc(), Opportunity.id.desc())
+    if status:
+        query = query.where(Opportunity.status == status)
+    if skill_names:
+        query = query.where(skills_filter(skill_names, skills_match))
+
+    if cursor:
+        cursor_status, cursor_skills, created_at, opportunity_id = decode_cursor(
+            cursor, str, str, datetime, int
+        )
+        if (cursor_status, cursor_skills) != filters:
+            raise HTTPException(status_code=400, detail="Cursor does not match filters")
+        query = query.where(
+            tuple_(Opportunity.created_at, Opportunity.id) < (created_at, opportunity_id)
+        )
+    else:
+        query = query.offset(skip)
+    return query, filters
+
+
 @router.get("", response_model=List[OpportunityResponse])
 def get_opportunities(
+    response: Response,
     skip: int = 0,
     limit: int = 50,
     status: Optional[str] = None,
+    skills: Optional[str] = None,
+    skills_match: str = "any",
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get list of opportunities"""
-    query = db.query(Opportunity)
+    """Get list of opportunities, newest first.
+
+    ``skills`` is a comma-separated list; ``skills_match=any`` keeps
+    opportunities requiring at least one of them, ``all`` those requiring
+    every one. Full pages carry an X-Next-Cursor header; pass it back as
+    ``cursor`` (with the same filters) to seek on the (status, created_at,
+    id) index instead of skipping rows. ``skip`` is ignored when a cursor is
+    given.
+    """
+    query, filters = opportunity_list_query(skip, status, skills, skills_match, cursor)
+    opportunities = db.scalars(query.limit(limit)).all()
+    set_next_cursor(response, opportunities, limit, "created_at", "id", prefix=filters)
+    return opportunities
+
+
+@router.get("/mine/summary", response_model=List[OpportunitySummary])
+def get_my_opportunities_summary(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """The current user's opportunities, newest first, with pending,
+    accepted and rejected application counts.
+
+    Computed by one GROUP BY query and cached per creator until an apply,
+    status change or edit touches one of their opportunities.
+    """
+    return summary_cache.get(db, current_user.id)
 
-    if status:
-        query = query.filter(Opportunity.status == status)
 
-    opportunities = (
-        query.order_by(Opportunity.created_at.desc()).offset(skip).limit(limit).all()
+@router.get("/recommended", response_model=List[RecommendedOpportunity])
+def get_recommended_opportunities(
+    limit: int = 20,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Open opportunities ranked for the current user, best fit first.
+
+    The score is the share of an opportunity's required skills the user has,
+    boosted by bounty size and by how soon the deadline is (see
+    utils.recommendations). Candidates come from the in-memory skill index,
+    so only opportunities sharing a skill with the user are scored.
+    """
+    if not recommendation_index.loaded:
+        recommendation_index.load(db)
+    picks = recommendation_index.recommend(
+        user_skills(current_user), limit, exclude_creator=current_user.id
     )
-    return opportunities
+    if not picks:
+        return []
+
+    opportunities = {
+        opportunity.id: opportunity
+        for opportunity in db.scalars(
+            select(Opportunity).where(
+                Opportunity.id.in_([pick.opportunity_id for pick in picks])
+            )
+        )
+    }
+    return [
+        RecommendedOpportunity(
+            **OpportunityResponse.model_validate(opportunities[pick.opportunity_id]).model_dump(),
+            score=pick.score,
+            matched_skills=pick.matched_skills,
+        )
+        for pick in picks
+        if pick.opportunity_id in opportunities
+    ]
+
+
+@router.get("/search", response_model=List[OpportunitySearchResult])
+def search_opportunities(
+    response: Response,
+    q: str = Query(..., min_length=1),
+    status: Optional[str] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Full-text search over titles and descriptions, best match first.
+
+    Every word of ``q`` must appear; title hits weigh TITLE_WEIGHT times a
+    description hit in the BM25 rank. Combine with ``status`` to search one
+    column of the board. Full pages carry an X-Next-Cursor header.
+
+    Highlights are HTML-escaped with only <mark> tags added. The cursor is a
+    (rank, id) keyset, and BM25 ranks depend on corpus statistics, so rows
+    inserted or edited between pages shift the scores: a later page can
+    repeat or skip a result. Clients that need an exact walk should refetch
+    from the first page.
+    """
+    if db.get_bind().dialect.name != "sqlite":
+        raise HTTPException(status_code=501, detail="Search requires SQLite FTS5")
+    if not fts_query(q):
+        return []
+
+    fts = opportunity_search.table
+    rank = opportunity_search.rank(TITLE_WEIGHT, 1.0)
+    query = (
+        select(
+            Opportunity,
+            rank.label("rank"),
+            opportunity_search.highlight("title").label("title_highlight"),
+            opportunity_search.snippet("description").label("description_snippet"),
+        )
+        .join(fts, fts.c.rowid == Opportunity.id)
+        .where(opportunity_search.match(q))
+        .order_by(rank, Opportunity.id)
+        .limit(limit)
+    )
+    if status:
+        query = query.where(Opportunity.status == status)
+    if cursor:
+        cursor_status, after_rank, after_id = decode_cursor(cursor, str, float, int)
+        if cursor_status != (status or ""):
+            raise HTTPException(status_code=400, detail="Cursor does not match status")
+        query = query.where(tuple_(rank, Opportunity.id) > (after_rank, after_id))
+
+    rows = db.execute(query).all()
+    if len(rows) >= limit:
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            status or "", last.rank, last.Opportunity.id
+        )
+    return [
+        OpportunitySearchResult(
+            **OpportunityResponse.model_validate(row.Opportunity).model_dump(),
+            rank=row.rank,
+            title_highlight=marked_html(row.title_highlight),
+            description_snippet=marked_html(row.description_snippet),
+        )
+        for row in rows
+    ]
 
 
 @router.get("/{opportunity_id}", response_model=OpportunityResponse)
@@ -102,9 +348,12 @@ def update_opportunity(
     opportunity.bounty_amount = opportunity_data.bounty_amount
     opportunity.deadline = opportunity_data.deadline
     opportunity.updated_at = datetime.now()
+    set_opportunity_skills(db, opportunity.id, opportunity_data.required_skills)
 
     db.commit()
     db.refresh(opportunity)
+    recommendation_index.upsert(opportunity, opportunity_data.required_skills)
+    summary_cache.invalidate_creator(current_user.id)
     return opportunity
 
 
@@ -123,8 +372,10 @@ def delete_opportunity(
             status_code=403, detail="Not authorized to delete this opportunity"
         )
 
-    db.delete(opportunity)
+    delete_opportunities(db, [opportunity_id])
     db.commit()
+    recommendation_index.remove(opportunity_id)
+    summary_cache.invalidate_creator(current_user.id)
     return None
 
 
@@ -139,45 +390,49 @@ def apply_to_opportunity(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """Apply to an opportunity"""
-    # Check if opportunity exists
-    opportunity = db.query(Opportunity).filter(Opportunity.id == opportunity_id).first()
-    if not opportunity:
-        raise HTTPException(status_code=404, detail="Opportunity not found")
+    """Apply to an opportunity.
 
-    # Check if already applied
-    existing_application = (
-        db.query(Application)
-        .filter(
-            Application.opportunity_id == opportunity_id,
-            Application.applicant_id == current_user.id,
+    One INSERT ... SELECT ... RETURNING plus the commit: a missing
+    opportunity inserts nothing and a repeat application trips the unique
+    (opportunity_id, applicant_id) index, so concurrent applies cannot
+    create duplicates.
+    """
+    try:
+        new_application = db.scalar(
+            insert_application(opportunity_id, current_user.id, application_data.message)
         )
-        .first()
-    )
-    if existing_application:
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(
             status_code=400, detail="Already applied to this opportunity"
         )
-
-    # Create application
-    new_application = Application(
-        opportunity_id=opportunity_id,
-        applicant_id=current_user.id,
-        message=application_data.message,
-    )
-    db.add(new_application)
+    if new_application is None:
+        raise HTTPException(status_code=404, detail="Opportunity not found")
+    # RETURNING filled in every column; snapshot it so commit's expiry
+    # does not cost a reload
+    response = ApplicationResponse.model_validate(new_application)
     db.commit()
-    db.refresh(new_application)
-    return new_application
+    summary_cache.invalidate_opportunity(opportunity_id)
+    return response
 
 
-@router.get("/{opportunity_id}/applications", response_model=List[ApplicationResponse])
+@router.get(
+    "/{opportunity_id}/applications",
+    response_model=List[ApplicationDetail],
+    response_model_exclude_unset=True,
+)
 def get_opportunity_applications(
     opportunity_id: int,
+    expand: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """Get applications for an opportunity (creator only)"""
+    """Get applications for an opportunity (creator only).
+
+    ``expand=applicant`` embeds a summary of each applicant's profile,
+    loaded in the same query as the applications.
+    """
+    expansions = parse_expand(expand)
     opportunity = db.query(Opportunity).filter(Opportunity.id == opportunity_id).first()
     if not opportunity:
         raise HTTPException(status_code=404, detail="Opportunity not found")
@@ -187,9 +442,62 @@ def get_opportunity_applications(
         )
 
     applications = (
-        db.query(Application).filter(Application.opportunity_id == opportunity_id).all()
+        db.query(Application)
+        .options(*application_options(expansions))
+        .filter(Application.opportunity_id == opportunity_id)
+        .all()
     )
-    return applications
+    return application_details(applications, expansions)
+
+
+@router.put(
+    "/{opportunity_id}/applications/status",
+    response_model=List[ApplicationStatusResult],
+    response_model_exclude_none=True,
+)
+def update_application_statuses(
+    opportunity_id: int,
+    batch: ApplicationStatusBatch,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Accept or reject many applications to one opportunity (creator only).
+
+    Ownership is checked once and every listed application is changed by a
+    single UPDATE in one transaction. The response has one result per id,
+    in request order; ids that are not applications to this opportunity
+    come back with ``updated: false``.
+    """
+    if batch.status not in DECISION_STATUSES:
+        raise HTTPException(status_code=400, detail="Invalid status")
+    ids = list(dict.fromkeys(batch.ids))
+    if len(ids) > settings.APPLICATION_STATUS_BATCH_MAX:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.APPLICATION_STATUS_BATCH_MAX} applications per request",
+        )
+
+    creator_id = db.scalar(
+        select(Opportunity.creator_id).where(Opportunity.id == opportunity_id)
+    )
+    if creator_id is None:
+        raise HTTPException(status_code=404, detail="Opportunity not found")
+    if creator_id != current_user.id:
+        raise HTTPException(
+            status_code=403, detail="Not authorized to update these applications"
+        )
+
+    updated = set(db.scalars(set_application_statuses(opportunity_id, ids, batch.status)))
+    db.commit()
+    summary_cache.invalidate_creator(creator_id)
+    return [
+        ApplicationStatusResult(id=application_id, updated=True, status=batch.status)
+        if application_id in updated
+        else ApplicationStatusResult(
+            id=application_id, updated=False, detail="Application not found"
+        )
+        for application_id in ids
+    ]
 
 
 @router.get("/my-applications", response_model=List[ApplicationResponse])
@@ -240,5 +548,6 @@ def update_application_status(
 
     application.status = new_status
     db.commit()
+    summary_cache.invalidate_creator(current_user.id)
     db.refresh(application)
     return application
@@ -0,0 +1,272 @@
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, List
+from datetime import datetime
+import json
+from database import get_async_db  # type: ignore
+from models.user import User  # type: ignore
+from models.opportunity import Opportunity  # type: ignore
+from models.application import Application  # type: ignore
+from schemas.opportunity import OpportunityCreate, OpportunityResponse  # type: ignore
+from schemas.application import (  # type: ignore
+    ApplicationCreate,
+    ApplicationDetail,
+    ApplicationResponse,
+)
+from routes.opportunities import opportunity_list_query  # type: ignore
+from utils.applications import (  # type: ignore
+    application_details,
+    application_options,
+    insert_application,
+    parse_expand,
+)
+from utils.cascade import delete_opportunities  # type: ignore
+from utils.dashboard import summary_cache  # type: ignore
+from utils.dependencies import get_current_user_async  # type: ignore
+from utils.pagination import set_next_cursor  # type: ignore
+from utils.recommendations import recommendation_index  # type: ignore
+from utils.skills import set_opportunity_skills  # type: ignore
+
+# Async twins of routes/opportunities.py, used when settings.USE_ASYNC_DB is on
+router = APIRouter(prefix="/opportunities", tags=["Opportunities"])
+
+# Routes of routes/opportunities.py with no twin: they keep the sync session on the
+# threadpool, where index loads and rebuilds cannot stall the event loop
+SYNC_ONLY = {
+    ("/opportunities/import", "POST"),
+    ("/opportunities/mine/summary", "GET"),
+    ("/opportunities/recommended", "GET"),
+    ("/opportunities/search", "GET"),
+    ("/opportunities/{opportunity_id}/applications/status", "PUT"),
+}
+
+
+async def _get_opportunity_or_404(db: AsyncSession, opportunity_id: int) -> Opportunity:
+    opportunity = await db.get(Opportunity, opportunity_id)
+    if not opportunity:
+        raise HTTPException(status_code=404, detail="Opportunity not found")
+    return opportunity
+
+
+@router.post(
+    "", response_model=OpportunityResponse, status_code=status.HTTP_201_CREATED
+)
+async def create_opportunity(
+    opportunity_data: OpportunityCreate,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Create a new opportunity"""
+    try:
+        new_opportunity = Opportunity(
+            title=opportunity_data.title,
+            description=opportunity_data.description,
+            required_skills=json.dumps(opportunity_data.required_skills)
+            if opportunity_data.required_skills
+            else None,
+            bounty_amount=opportunity_data.bounty_amount,
+            deadline=opportunity_data.deadline,
+            creator_id=current_user.id,
+        )
+        db.add(new_opportunity)
+        await db.flush()
+        await db.run_sync(
+            set_opportunity_skills, new_opportunity.id, opportunity_data.required_skills
+        )
+        await db.commit()
+        await db.refresh(new_opportunity)
+        recommendation_index.upsert(new_opportunity, opportunity_data.required_skills)
+        summary_cache.invalidate_creator(current_user.id)
+        return new_opportunity
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("", response_model=List[OpportunityResponse])
+async def get_opportunities(
+    response: Response,
+    skip: int = 0,
+    limit: int = 50,
+    status: Optional[str] = None,
+    skills: Optional[str] = None,
+    skills_match: str = "any",
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    """Get list of opportunities (see routes.opportunities.get_opportunities)"""
+    query, filters = opportunity_list_query(skip, status, skills, skills_match, cursor)
+    opportunities = (await db.scalars(query.limit(limit))).all()
+    set_next_cursor(response, opportunities, limit, "created_at", "id", prefix=filters)
+    return opportunities
+
+
+@router.get("/{opportunity_id}", response_model=OpportunityResponse)
+async def get_opportunity(
+    opportunity_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    """Get specific opportunity"""
+    return await _get_opportunity_or_404(db, opportunity_id)
+
+
+@router.put("/{opportunity_id}", response_model=OpportunityResponse)
+async def update_opportunity(
+    opportunity_id: int,
+    opportunity_data: OpportunityCreate,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Update opportunity (creator only)"""
+    opportunity = await _get_opportunity_or_404(db, opportunity_id)
+    if opportunity.creator_id != current_user.id:
+        raise HTTPException(
+            status_code=403, detail="Not authorized to update this opportunity"
+        )
+
+    opportunity.title = opportunity_data.title
+    opportunity.description = opportunity_data.description
+    opportunity.required_skills = (
+        json.dumps(opportunity_data.required_skills)
+        if opportunity_data.required_skills
+        else None
+    )
+    opportunity.bounty_amount = opportunity_data.bounty_amount
+    opportunity.deadline = opportunity_data.deadline
+    opportunity.updated_at = datetime.now()
+    await db.run_sync(
+        set_opportunity_skills, opportunity.id, opportunity_data.required_skills
+    )
+
+    await db.commit()
+    await db.refresh(opportunity)
+    recommendation_index.upsert(opportunity, opportunity_data.required_skills)
+    summary_cache.invalidate_creator(current_user.id)
+    return opportunity
+
+
+@router.delete("/{opportunity_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_opportunity(
+    opportunity_id: int,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Delete opportunity (creator only)"""
+    opportunity = await _get_opportunity_or_404(db, opportunity_id)
+    if opportunity.creator_id != current_user.id:
+        raise HTTPException(
+            status_code=403, detail="Not authorized to delete this opportunity"
+        )
+
+    await db.run_sync(delete_opportunities, [opportunity_id])
+    await db.commit()
+    recommendation_index.remove(opportunity_id)
+    summary_cache.invalidate_creator(current_user.id)
+    return None
+
+
+@router.post(
+    "/{opportunity_id}/apply",
+    response_model=ApplicationResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def apply_to_opportunity(
+    opportunity_id: int,
+    application_data: ApplicationCreate,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Apply to an opportunity"""
+    try:
+        new_application = await db.scalar(
+            insert_application(opportunity_id, current_user.id, application_data.message)
+        )
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=400, detail="Already applied to this opportunity"
+        )
+    if new_application is None:
+        raise HTTPException(status_code=404, detail="Opportunity not found")
+    # RETURNING filled in every column; snapshot it so commit's expiry
+    # does not cost a reload
+    response = ApplicationResponse.model_validate(new_application)
+    await db.commit()
+    summary_cache.invalidate_opportunity(opportunity_id)
+    return response
+
+
+@router.get(
+    "/{opportunity_id}/applications",
+    response_model=List[ApplicationDetail],
+    response_model_exclude_unset=True,
+)
+async def get_opportunity_applications(
+    opportunity_id: int,
+    expand: Optional[str] = None,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get applications for an opportunity (creator only)"""
+    expansions = parse_expand(expand)
+    opportunity = await _get_opportunity_or_404(db, opportunity_id)
+    if opportunity.creator_id != current_user.id:
+        raise HTTPException(
+            status_code=403, detail="Not authorized to view applications"
+        )
+
+    result = await db.scalars(
+        select(Application)
+        .options(*application_options(expansions))
+        .where(Application.opportunity_id == opportunity_id)
+    )
+    return application_details(result.all(), expansions)
+
+
+@router.get("/my-applications", response_model=List[ApplicationResponse])
+async def get_my_applications(
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get all applications for current user's opportunities"""
+    result = await db.scalars(
+        select(Application)
+        .join(Opportunity)
+        .where(Opportunity.creator_id == current_user.id)
+    )
+    return result.all()
+
+
+@router.put(
+    "/applications/{application_id}/status",
+    response_model=ApplicationResponse,
+)
+async def update_application_status(
+    application_id: int,
+    new_status: str,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Update application status (accept/reject) - creator only"""
+    application = await db.get(Application, application_id)
+    if not application:
+        raise HTTPException(status_code=404, detail="Application not found")
+
+    opportunity = await _get_opportunity_or_404(db, application.opportunity_id)
+    if opportunity.creator_id != current_user.id:
+        raise HTTPException(
+            status_code=403, detail="Not authorized to update this application"
+        )
+
+    if new_status not in ["accepted", "rejected"]:
+        raise HTTPException(status_code=400, detail="Invalid status")
+
+    application.status = new_status
+    await db.commit()
+    summary_cache.invalidate_creator(current_user.id)
+    await db.refresh(application)
+    return application
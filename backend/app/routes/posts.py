@@ -1,16 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import Select, delete, insert, select, tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from datetime import datetime
+import sys
+from config import settings  # type: ignore
 from database import get_db  # type: ignore
 from models.user import User  # type: ignore
-from models.post import Post  # type: ignore
-from schemas.post import PostCreate, PostResponse  # type: ignore
+from models.post import Post, PostLike, post_search  # type: ignore
+from schemas.post import PostCreate, PostResponse, PostSearchResult  # type: ignore
+from utils.cascade import delete_posts  # type: ignore
 from utils.dependencies import get_current_user  # type: ignore
+from utils.likes import (  # type: ignore
+    increment_likes,
+    like_aggregator,
+    liked_post_ids,
+    post_response,
+)
+from utils.pagination import (  # type: ignore
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+    set_next_cursor,
+)
+from utils.search import fts_query, marked_html  # type: ignore
+from utils.timeline import followers_of, read_timeline, timeline_store  # type: ignore
 
 router = APIRouter(prefix="/posts", tags=["Posts"])
 
 
+def _liked_by(db: Session, post_id: int, user_id: int) -> bool:
+    return db.get(PostLike, (post_id, user_id)) is not None
+
+
 @router.post("", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
 def create_post(
     post_data: PostCreate,
@@ -26,24 +49,138 @@ def create_post(
         db.add(new_post)
         db.commit()
         db.refresh(new_post)
-        return new_post
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=400, detail=str(e))
 
+    followers = db.scalars(
+        followers_of(current_user.id, timeline_store.fanout_limit + 1)
+    ).all()
+    timeline_store.fan_out(current_user.id, new_post.id, followers)
+    return new_post
+
+
+def post_list_query(skip: int, cursor: Optional[str]) -> Select:
+    """The newest-first SELECT behind GET /posts (sync and async)"""
+    query = select(Post).order_by(Post.created_at.desc(), Post.id.desc())
+    if cursor:
+        created_at, post_id = decode_cursor(cursor, datetime, int)
+        return query.where(tuple_(Post.created_at, Post.id) < (created_at, post_id))
+    return query.offset(skip)
+
 
 @router.get("", response_model=List[PostResponse])
 def get_posts(
+    response: Response,
     skip: int = 0,
     limit: int = 50,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get list of posts"""
-    posts = (
-        db.query(Post).order_by(Post.created_at.desc()).offset(skip).limit(limit).all()
+    """Get list of posts, newest first.
+
+    Full pages carry an X-Next-Cursor header; pass it back as ``cursor`` to
+    seek straight to the next page on the (created_at, id) index instead of
+    skipping rows. ``skip`` is ignored when a cursor is given.
+    """
+    posts = db.scalars(post_list_query(skip, cursor).limit(limit)).all()
+    set_next_cursor(response, posts, limit, "created_at", "id")
+    # liked_by_me for the whole page in one query
+    liked = (
+        set(db.scalars(liked_post_ids(current_user.id, [post.id for post in posts])))
+        if posts
+        else set()
     )
-    return posts
+    return [post_response(post, post.id in liked) for post in posts]
+
+
+@router.get("/search", response_model=List[PostSearchResult])
+def search_posts(
+    response: Response,
+    q: str = Query(..., min_length=1),
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Full-text search over post content, best BM25 match first.
+
+    Every word of ``q`` must appear (stemmed, case-insensitive). The
+    highlight is HTML-escaped content with only <mark> tags added. Full pages
+    carry an X-Next-Cursor header to pass back as ``cursor``.
+    """
+    if db.get_bind().dialect.name != "sqlite":
+        raise HTTPException(status_code=501, detail="Search requires SQLite FTS5")
+    if not fts_query(q):
+        return []
+
+    fts = post_search.table
+    rank = post_search.rank()
+    query = (
+        select(Post, rank.label("rank"), post_search.highlight("content"))
+        .join(fts, fts.c.rowid == Post.id)
+        .where(post_search.match(q))
+        .order_by(rank, Post.id)
+        .limit(limit)
+    )
+    if cursor:
+        after_rank, after_id = decode_cursor(cursor, float, int)
+        query = query.where(tuple_(rank, Post.id) > (after_rank, after_id))
+
+    rows = db.execute(query).all()
+    if len(rows) >= limit:
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.rank, last.Post.id)
+    liked = (
+        set(db.scalars(liked_post_ids(current_user.id, [row.Post.id for row in rows])))
+        if rows
+        else set()
+    )
+    return [
+        PostSearchResult(
+            **post_response(post, post.id in liked).model_dump(),
+            rank=post_rank,
+            highlight=marked_html(highlight),
+        )
+        for post, post_rank, highlight in rows
+    ]
+
+
+@router.get("/home", response_model=List[PostResponse])
+def get_home_timeline(
+    response: Response,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Get the current user's home feed: their own posts and those of people
+    they follow, newest first.
+
+    Served from the in-memory timeline (see utils.timeline), so a page costs
+    one primary-key lookup for the posts. Full pages carry an X-Next-Cursor
+    header to pass back as ``cursor``.
+    """
+    before_seq, before_id = (
+        decode_cursor(cursor, int, int) if cursor else (None, sys.maxsize)
+    )
+    post_ids, next_seq, next_before_id = read_timeline(
+        db, current_user.id, before_seq, before_id, limit
+    )
+    if len(post_ids) >= limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(next_seq, next_before_id)
+    if not post_ids:
+        return []
+
+    posts = {post.id: post for post in db.scalars(select(Post).where(Post.id.in_(post_ids)))}
+    liked = set(db.scalars(liked_post_ids(current_user.id, post_ids)))
+    # Deleted posts can linger in timelines; they are skipped here
+    return [
+        post_response(posts[post_id], post_id in liked)
+        for post_id in post_ids
+        if post_id in posts
+    ]
 
 
 @router.get("/{post_id}", response_model=PostResponse)
@@ -56,7 +193,7 @@ def get_post(
     post = db.query(Post).filter(Post.id == post_id).first()
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
-    return post
+    return post_response(post, _liked_by(db, post_id, current_user.id))
 
 
 @router.put("/{post_id}", response_model=PostResponse)
@@ -79,7 +216,7 @@ def update_post(
     post.updated_at = datetime.now()
     db.commit()
     db.refresh(post)
-    return post
+    return post_response(post, _liked_by(db, post_id, current_user.id))
 
 
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -97,7 +234,7 @@ def delete_post(
             status_code=403, detail="Not authorized to delete this post"
         )
 
-    db.delete(post)
+    delete_posts(db, [post_id])
     db.commit()
     return None
 
@@ -108,12 +245,80 @@ def like_post(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """Like a post"""
-    post = db.query(Post).filter(Post.id == post_id).first()
+    """Like a post; liking it again is a no-op.
+
+    The post_likes row and the counter change in one transaction: the unique
+    (post_id, user_id) key rejects repeats, and the counter is bumped with a
+    single UPDATE ... RETURNING so concurrent likes never lose increments.
+    With LIKE_WRITE_BEHIND the counter delta is buffered instead and the
+    response carries the projected count.
+    """
+    if settings.LIKE_WRITE_BEHIND:
+        post = db.get(Post, post_id)
+        if not post:
+            raise HTTPException(status_code=404, detail="Post not found")
+        try:
+            db.execute(insert(PostLike).values(post_id=post_id, user_id=current_user.id))
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            return post_response(post, True, like_aggregator.pending(post_id))
+        return post_response(post, True, like_aggregator.add(post_id))
+
+    try:
+        db.execute(insert(PostLike).values(post_id=post_id, user_id=current_user.id))
+    except IntegrityError:
+        db.rollback()
+        post = db.get(Post, post_id)
+        if not post:
+            raise HTTPException(status_code=404, detail="Post not found")
+        return post_response(post, True)
+
+    post = db.scalars(
+        increment_likes.returning(Post), {"post_id": post_id, "delta": 1}
+    ).one_or_none()
     if not post:
+        db.rollback()
         raise HTTPException(status_code=404, detail="Post not found")
+    # Serialize before commit expires the row, which would cost a re-SELECT
+    result = post_response(post, True)
+    db.commit()
+    return result
+
+
+@router.delete("/{post_id}/like", response_model=PostResponse)
+def unlike_post(
+    post_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Remove the current user's like; a no-op if they had not liked it"""
+    removed = db.execute(
+        delete(PostLike).where(
+            PostLike.post_id == post_id, PostLike.user_id == current_user.id
+        )
+    ).rowcount
+
+    if settings.LIKE_WRITE_BEHIND:
+        post = db.get(Post, post_id)
+        if not post:
+            db.rollback()
+            raise HTTPException(status_code=404, detail="Post not found")
+        db.commit()
+        pending = (
+            like_aggregator.add(post_id, -1) if removed else like_aggregator.pending(post_id)
+        )
+        return post_response(post, False, pending)
 
-    post.likes_count += 1
+    if removed:
+        post = db.scalars(
+            increment_likes.returning(Post), {"post_id": post_id, "delta": -1}
+        ).one_or_none()
+    else:
+        post = db.get(Post, post_id)
+    if not post:
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Post not found")
+    result = post_response(post, False)
     db.commit()
-    db.refresh(post)
-    return post
+    return result
@@ -0,0 +1,225 @@
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import delete, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import datetime
+from config import settings  # type: ignore
+from database import get_async_db  # type: ignore
+from models.user import User  # type: ignore
+from models.post import Post, PostLike  # type: ignore
+from schemas.post import PostCreate, PostResponse  # type: ignore
+from routes.posts import post_list_query  # type: ignore
+from utils.cascade import delete_posts  # type: ignore
+from utils.dependencies import get_current_user_async  # type: ignore
+from utils.likes import (  # type: ignore
+    increment_likes,
+    like_aggregator,
+    liked_post_ids,
+    post_response,
+)
+from utils.pagination import set_next_cursor  # type: ignore
+from utils.timeline import followers_of, timeline_store  # type: ignore
+
+# Async twins of routes/posts.py, used when settings.USE_ASYNC_DB is on
+router = APIRouter(prefix="/posts", tags=["Posts"])
+
+# Routes of routes/posts.py with no twin: they keep the sync session on the
+# threadpool, where index loads and rebuilds cannot stall the event loop
+SYNC_ONLY = {
+    ("/posts/search", "GET"),
+    ("/posts/home", "GET"),
+}
+
+
+async def _get_post_or_404(db: AsyncSession, post_id: int) -> Post:
+    post = await db.get(Post, post_id)
+    if not post:
+        raise HTTPException(status_code=404, detail="Post not found")
+    return post
+
+
+async def _liked_by(db: AsyncSession, post_id: int, user_id: int) -> bool:
+    return await db.get(PostLike, (post_id, user_id)) is not None
+
+
+@router.post("", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
+async def create_post(
+    post_data: PostCreate,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Create a new post"""
+    try:
+        new_post = Post(
+            author_id=current_user.id,
+            content=post_data.content,
+        )
+        db.add(new_post)
+        await db.commit()
+        await db.refresh(new_post)
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+
+    followers = (
+        await db.scalars(followers_of(current_user.id, timeline_store.fanout_limit + 1))
+    ).all()
+    timeline_store.fan_out(current_user.id, new_post.id, followers)
+    return new_post
+
+
+@router.get("", response_model=List[PostResponse])
+async def get_posts(
+    response: Response,
+    skip: int = 0,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    """Get list of posts, newest first (see routes.posts.get_posts)"""
+    posts = (await db.scalars(post_list_query(skip, cursor).limit(limit))).all()
+    set_next_cursor(response, posts, limit, "created_at", "id")
+    liked = (
+        set(
+            await db.scalars(
+                liked_post_ids(current_user.id, [post.id for post in posts])
+            )
+        )
+        if posts
+        else set()
+    )
+    return [post_response(post, post.id in liked) for post in posts]
+
+
+@router.get("/{post_id}", response_model=PostResponse)
+async def get_post(
+    post_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    """Get specific post"""
+    post = await _get_post_or_404(db, post_id)
+    return post_response(post, await _liked_by(db, post_id, current_user.id))
+
+
+@router.put("/{post_id}", response_model=PostResponse)
+async def update_post(
+    post_id: int,
+    post_data: PostCreate,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Update post (author only)"""
+    post = await _get_post_or_404(db, post_id)
+    if post.author_id != current_user.id:
+        raise HTTPException(
+            status_code=403, detail="Not authorized to update this post"
+        )
+
+    post.content = post_data.content
+    post.updated_at = datetime.now()
+    await db.commit()
+    await db.refresh(post)
+    return post_response(post, await _liked_by(db, post_id, current_user.id))
+
+
+@router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_post(
+    post_id: int,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Delete post (author only)"""
+    post = await _get_post_or_404(db, post_id)
+    if post.author_id != current_user.id:
+        raise HTTPException(
+            status_code=403, detail="Not authorized to delete this post"
+        )
+
+    await db.run_sync(delete_posts, [post_id])
+    await db.commit()
+    return None
+
+
+@router.post("/{post_id}/like", response_model=PostResponse)
+async def like_post(
+    post_id: int,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Like a post; liking it again is a no-op (see routes.posts.like_post)"""
+    if settings.LIKE_WRITE_BEHIND:
+        post = await _get_post_or_404(db, post_id)
+        try:
+            await db.execute(
+                insert(PostLike).values(post_id=post_id, user_id=current_user.id)
+            )
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            return post_response(post, True, like_aggregator.pending(post_id))
+        return post_response(post, True, like_aggregator.add(post_id))
+
+    try:
+        await db.execute(
+            insert(PostLike).values(post_id=post_id, user_id=current_user.id)
+        )
+    except IntegrityError:
+        await db.rollback()
+        return post_response(await _get_post_or_404(db, post_id), True)
+
+    post = (
+        await db.scalars(
+            increment_likes.returning(Post), {"post_id": post_id, "delta": 1}
+        )
+    ).one_or_none()
+    if not post:
+        await db.rollback()
+        raise HTTPException(status_code=404, detail="Post not found")
+    result = post_response(post, True)
+    await db.commit()
+    return result
+
+
+@router.delete("/{post_id}/like", response_model=PostResponse)
+async def unlike_post(
+    post_id: int,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Remove the current user's like; a no-op if they had not liked it"""
+    removed = (
+        await db.execute(
+            delete(PostLike).where(
+                PostLike.post_id == post_id, PostLike.user_id == current_user.id
+            )
+        )
+    ).rowcount
+
+    if settings.LIKE_WRITE_BEHIND:
+        post = await db.get(Post, post_id)
+        if not post:
+            await db.rollback()
+            raise HTTPException(status_code=404, detail="Post not found")
+        await db.commit()
+        pending = (
+            like_aggregator.add(post_id, -1) if removed else like_aggregator.pending(post_id)
+        )
+        return post_response(post, False, pending)
+
+    if removed:
+        post = (
+            await db.scalars(
+                increment_likes.returning(Post), {"post_id": post_id, "delta": -1}
+            )
+        ).one_or_none()
+    else:
+        post = await db.get(Post, post_id)
+    if not post:
+        await db.rollback()
+        raise HTTPException(status_code=404, detail="Post not found")
+    result = post_response(post, False)
+    await db.commit()
+    return result
@@ -5,7 +5,9 @@ import json
 from database import get_db  # type: ignore
 from models.user import User  # type: ignore
 from schemas.user import UserResponse, UserProfile, UserModeToggle  # type: ignore
-from utils.dependencies import get_current_user  # type: ignore
+from utils.autocomplete import autocomplete_index  # type: ignore
+from utils.dependencies import get_current_user, invalidate_principal  # type: ignore
+from utils.similarity import user_similarity_index  # type: ignore
 
 router = APIRouter(prefix="/profile", tags=["Profile"])
 
@@ -23,19 +25,24 @@ def update_profile(
     db: Session = Depends(get_db),
 ):
     """Update user profile"""
+    # current_user may be a detached cache snapshot; write through the session
+    user = db.get(User, current_user.id)
     if profile_data.bio is not None:
-        current_user.bio = profile_data.bio
+        user.bio = profile_data.bio
     if profile_data.skills is not None:
-        current_user.skills = json.dumps(profile_data.skills)
+        user.skills = json.dumps(profile_data.skills)
     if profile_data.interests is not None:
-        current_user.interests = json.dumps(profile_data.interests)
+        user.interests = json.dumps(profile_data.interests)
     if profile_data.profile_image is not None:
-        current_user.profile_image = profile_data.profile_image
+        user.profile_image = profile_data.profile_image
 
-    current_user.updated_at = datetime.now(timezone.utc)
+    user.updated_at = datetime.now(timezone.utc)
     db.commit()
-    db.refresh(current_user)
-    return current_user
+    invalidate_principal(user.id)
+    db.refresh(user)
+    user_similarity_index.upsert(user)
+    autocomplete_index.upsert(user)
+    return user
 
 
 @router.post("/mode", response_model=UserResponse)
@@ -45,8 +52,12 @@ def toggle_mode(
     db: Session = Depends(get_db),
 ):
     """Toggle user mode between hustler and builder"""
-    current_user.mode = mode_data.mode
-    current_user.updated_at = datetime.now(timezone.utc)
+    user = db.get(User, current_user.id)
+    user.mode = mode_data.mode
+    user.updated_at = datetime.now(timezone.utc)
     db.commit()
-    db.refresh(current_user)
-    return current_user
+    invalidate_principal(user.id)
+    db.refresh(user)
+    user_similarity_index.upsert(user)
+    autocomplete_index.upsert(user)
+    return user
@@ -8,6 +8,7 @@ from schemas.user import (
 )
 from schemas.opportunity import OpportunityCreate, OpportunityResponse
 from schemas.application import ApplicationCreate, ApplicationResponse
+from schemas.comment import CommentCreate, CommentResponse
 
 __all__ = [
     "UserCreate",
@@ -20,4 +21,6 @@ __all__ = [
     "OpportunityResponse",
     "ApplicationCreate",
     "ApplicationResponse",
+    "CommentCreate",
+    "CommentResponse",
 ]
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
+from typing import List, Optional
 
 
 class ApplicationCreate(BaseModel):
@@ -15,3 +16,31 @@ class ApplicationResponse(BaseModel):
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class ApplicantSummary(BaseModel):
+    id: int
+    username: str
+    full_name: str
+    email: str
+    profile_image: Optional[str]
+    mode: str
+
+    model_config = {"from_attributes": True}
+
+
+class ApplicationDetail(ApplicationResponse):
+    # Only present with ?expand=applicant
+    applicant: Optional[ApplicantSummary] = None
+
+
+class ApplicationStatusBatch(BaseModel):
+    ids: List[int]
+    status: str
+
+
+class ApplicationStatusResult(BaseModel):
+    id: int
+    updated: bool
+    status: Optional[str] = None  # the application's status after the request
+    detail: Optional[str] = None  # why it was not updated
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from typing import List
+
+
+class ImportRowError(BaseModel):
+    line: int  # 1-based line of the input file (for CSV, where the row ends)
+    error: str
+
+
+class BulkImportResult(BaseModel):
+    imported: int
+    failed: int
+    errors: List[ImportRowError]  # the first BULK_IMPORT_MAX_ERRORS failures
+
+    model_config = {"from_attributes": True}
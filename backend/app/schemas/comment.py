@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+
+
+class CommentCreate(BaseModel):
+    content: str = Field(..., min_length=1)
+
+
+class CommentResponse(BaseModel):
+    id: int
+    post_id: int
+    author_id: int
+    content: str
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
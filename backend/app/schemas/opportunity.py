@@ -33,3 +33,25 @@ class OpportunityResponse(BaseModel):
     deadline: Optional[datetime]
 
     model_config = {"from_attributes": True}
+
+
+class OpportunitySearchResult(OpportunityResponse):
+    rank: float  # weighted BM25, lower is a better match
+    title_highlight: str  # HTML-escaped title with matched terms wrapped in <mark>
+    description_snippet: str  # escaped excerpt of the description around the matches
+
+
+class RecommendedOpportunity(OpportunityResponse):
+    score: float  # higher is a better fit
+    matched_skills: List[str]  # the user's skills this opportunity asks for
+
+
+class OpportunitySummary(BaseModel):
+    id: int
+    title: str
+    status: str
+    created_at: datetime
+    pending: int
+    accepted: int
+    rejected: int
+    total: int  # every application, whatever its status
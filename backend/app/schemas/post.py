@@ -13,8 +13,14 @@ class PostResponse(BaseModel):
     content: str
     likes_count: int = 0
     comments_count: int = 0
+    liked_by_me: bool = False
     created_at: datetime
     updated_at: datetime
 
     class Config:
         from_attributes = True
+
+
+class PostSearchResult(PostResponse):
+    rank: float  # BM25, lower is a better match
+    highlight: str  # HTML-escaped content with matched terms wrapped in <mark>
@@ -41,6 +41,33 @@ class UserResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class UserBatchRequest(BaseModel):
+    ids: List[int]
+
+
+class SimilarUserResponse(UserResponse):
+    score: float  # cosine or Jaccard similarity, 0-1
+    shared: List[str]  # common terms, e.g. "skill:python" or "interest:ai"
+
+
+class UserSuggestion(BaseModel):
+    id: int
+    username: str
+    full_name: Optional[str]
+    profile_image: Optional[str]
+    mode: Optional[str]
+
+
+class SkillSuggestion(BaseModel):
+    name: str
+    users: int  # profiles listing the skill
+
+
+class AutocompleteResponse(BaseModel):
+    users: List[UserSuggestion]
+    skills: List[SkillSuggestion]
+
+
 class Token(BaseModel):
     access_token: str
     token_type: str
@@ -5,12 +5,18 @@ os.environ["SECRET_KEY"] = "test-secret-key-fixed-for-tests-12345"
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 from main import app  # type: ignore
 from database import Base, get_db  # type: ignore
 from config import settings  # type: ignore
+from utils.autocomplete import autocomplete_index  # type: ignore
+from utils.dashboard import summary_cache  # type: ignore
+from utils.dependencies import principal_cache  # type: ignore
+from utils.recommendations import recommendation_index  # type: ignore
+from utils.similarity import user_similarity_index  # type: ignore
+from utils.timeline import timeline_store  # type: ignore
 
 # Ensure settings use the test secret key
 settings.SECRET_KEY = "test-secret-key-fixed-for-tests-12345"
@@ -51,5 +57,27 @@ def client(db_session: Session):
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    # Each test gets a fresh database, so cached users from earlier tests are stale
+    principal_cache.clear()
+    timeline_store.clear()
+    recommendation_index.clear()
+    user_similarity_index.clear()
+    autocomplete_index.clear()
+    summary_cache.clear()
     yield TestClient(app)
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def query_counter():
+    """
+    Record every SQL statement executed on the test engine.
+    """
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
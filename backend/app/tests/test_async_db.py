@@ -0,0 +1,265 @@
+"""Test cases for the async database stack (USE_ASYNC_DB)"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from database import Base, get_async_db, get_db  # type: ignore
+from routes import (  # type: ignore
+    auth,
+    network,
+    network_async,
+    opportunities,
+    opportunities_async,
+    posts,
+    posts_async,
+    with_async_twins,
+)
+from utils.autocomplete import autocomplete_index  # type: ignore
+from utils.dashboard import summary_cache  # type: ignore
+from utils.dependencies import principal_cache  # type: ignore
+from utils.recommendations import recommendation_index  # type: ignore
+from utils.similarity import user_similarity_index  # type: ignore
+from utils.timeline import timeline_store  # type: ignore
+
+
+@pytest.fixture(scope="function")
+def async_client(tmp_path):
+    """
+    Serve the async twins against a file-backed SQLite database, with the
+    sync auth routes sharing the same file.
+    """
+    db_path = tmp_path / "async.db"
+    sync_engine = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=sync_engine)
+    # NullPool: TestClient may run requests on different event loops
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool
+    )
+    SyncSession = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
+    AsyncSession = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+
+    app = FastAPI()
+    app.include_router(auth.router)
+    app.include_router(
+        with_async_twins(opportunities.router, opportunities_async.router)
+    )
+    app.include_router(with_async_twins(network.router, network_async.router))
+    app.include_router(with_async_twins(posts.router, posts_async.router))
+
+    def override_get_db():
+        db = SyncSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_get_async_db():
+        async with AsyncSession() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    principal_cache.clear()
+    timeline_store.clear()
+    recommendation_index.clear()
+    user_similarity_index.clear()
+    autocomplete_index.clear()
+    summary_cache.clear()
+    with TestClient(app) as client:
+        yield client
+    sync_engine.dispose()
+
+
+def get_user_headers(client: TestClient, email: str, username: str) -> dict:
+    """Create a user and return auth headers."""
+    response = client.post(
+        "/auth/signup",
+        json={
+            "email": email,
+            "username": username,
+            "password": "password123",
+            "full_name": f"{username} User",
+        },
+    )
+    token = response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_async_twins_replace_sync_routes():
+    merged = with_async_twins(posts.router, posts_async.router)
+    endpoints = {
+        (route.path, tuple(sorted(route.methods))): route.endpoint
+        for route in merged.routes
+    }
+    assert endpoints[("/posts", ("GET",))] is posts_async.get_posts
+    assert endpoints[("/posts/{post_id}/like", ("POST",))] is posts_async.like_post
+
+
+def test_async_twins_keep_sync_route_order():
+    merged = with_async_twins(opportunities.router, opportunities_async.router)
+    assert [route.path for route in merged.routes] == [
+        route.path for route in opportunities.router.routes
+    ]
+
+
+@pytest.mark.parametrize(
+    "sync_module, async_module",
+    [
+        (opportunities, opportunities_async),
+        (network, network_async),
+        (posts, posts_async),
+    ],
+)
+def test_every_sync_route_has_a_twin_or_is_sync_only(sync_module, async_module):
+    twins = {
+        (route.path, method) for route in async_module.router.routes for method in route.methods
+    }
+    routes = {
+        (route.path, method) for route in sync_module.router.routes for method in route.methods
+    }
+    assert routes - twins == async_module.SYNC_ONLY
+    assert twins <= routes
+
+
+def test_async_post_lifecycle(async_client: TestClient):
+    headers = get_user_headers(async_client, "author@example.com", "author1")
+
+    create_response = async_client.post(
+        "/posts", headers=headers, json={"content": "Async post"}
+    )
+    assert create_response.status_code == 201
+    post_id = create_response.json()["id"]
+
+    like_response = async_client.post(f"/posts/{post_id}/like", headers=headers)
+    assert like_response.json()["likes_count"] == 1
+    like_response = async_client.post(f"/posts/{post_id}/like", headers=headers)
+    assert like_response.json()["likes_count"] == 1
+
+    update_response = async_client.put(
+        f"/posts/{post_id}", headers=headers, json={"content": "Edited"}
+    )
+    assert update_response.json()["content"] == "Edited"
+
+    list_response = async_client.get("/posts", headers=headers)
+    assert [post["id"] for post in list_response.json()] == [post_id]
+    assert list_response.json()[0]["liked_by_me"] is True
+
+    unlike_response = async_client.delete(f"/posts/{post_id}/like", headers=headers)
+    assert unlike_response.json()["likes_count"] == 0
+
+    delete_response = async_client.delete(f"/posts/{post_id}", headers=headers)
+    assert delete_response.status_code == 204
+    assert async_client.get(f"/posts/{post_id}", headers=headers).status_code == 404
+
+
+def test_async_apply_to_opportunity(async_client: TestClient):
+    creator_headers = get_user_headers(async_client, "creator@example.com", "creator")
+    applicant_headers = get_user_headers(
+        async_client, "applicant@example.com", "applicant"
+    )
+
+    opp_response = async_client.post(
+        "/opportunities",
+        headers=creator_headers,
+        json={
+            "title": "Async opportunity",
+            "description": "An opportunity served by the async stack.",
+            "required_skills": ["python"],
+        },
+    )
+    assert opp_response.status_code == 201
+    opportunity_id = opp_response.json()["id"]
+
+    by_skill = async_client.get(
+        "/opportunities", headers=applicant_headers, params={"skills": "Python"}
+    )
+    assert [opp["id"] for opp in by_skill.json()] == [opportunity_id]
+
+    apply_json = {"message": "I would love to work on this."}
+    apply_response = async_client.post(
+        f"/opportunities/{opportunity_id}/apply",
+        headers=applicant_headers,
+        json=apply_json,
+    )
+    assert apply_response.status_code == 201
+
+    duplicate = async_client.post(
+        f"/opportunities/{opportunity_id}/apply",
+        headers=applicant_headers,
+        json=apply_json,
+    )
+    assert duplicate.status_code == 400
+
+    applications = async_client.get(
+        f"/opportunities/{opportunity_id}/applications", headers=creator_headers
+    )
+    assert len(applications.json()) == 1
+    assert "applicant" not in applications.json()[0]
+
+    expanded = async_client.get(
+        f"/opportunities/{opportunity_id}/applications",
+        headers=creator_headers,
+        params={"expand": "applicant"},
+    )
+    assert expanded.json()[0]["applicant"]["id"] == apply_response.json()["applicant_id"]
+
+
+def test_async_network(async_client: TestClient):
+    headers = get_user_headers(async_client, "me@example.com", "meuser")
+    get_user_headers(async_client, "other@example.com", "other")
+
+    response = async_client.get("/network", headers=headers)
+    assert response.status_code == 200
+    assert [user["username"] for user in response.json()] == ["other"]
+
+    other_id = response.json()[0]["id"]
+    profile = async_client.get(f"/network/{other_id}", headers=headers)
+    assert profile.json()["username"] == "other"
+    assert async_client.get("/network/999999", headers=headers).status_code == 404
+
+
+def test_async_follow_feeds_home_timeline(async_client: TestClient):
+    me = get_user_headers(async_client, "me@example.com", "meuser")
+    other = get_user_headers(async_client, "other@example.com", "other")
+    async_client.post("/posts", json={"content": "Hello from other"}, headers=other)
+    other_id = async_client.get("/network", headers=me).json()[0]["id"]
+
+    assert async_client.get("/posts/home", headers=me).json() == []
+    assert async_client.post(f"/network/{other_id}/follow", headers=me).status_code == 204
+    home = async_client.get("/posts/home", headers=me).json()
+    assert [post["content"] for post in home] == ["Hello from other"]
+
+    search = async_client.get("/posts/search", params={"q": "hello"}, headers=me)
+    assert [post["content"] for post in search.json()] == ["Hello from other"]
+
+    assert async_client.delete(f"/network/{other_id}/follow", headers=me).status_code == 204
+    assert async_client.get("/posts/home", headers=me).json() == []
+
+
+def test_async_import_and_summary(async_client: TestClient):
+    headers = get_user_headers(async_client, "me@example.com", "meuser")
+    body = (
+        '{"title": "Build a landing page", "description": "Marketing site for a launch"}\n'
+        '{"title": "Bad"}\n'
+    )
+    response = async_client.post(
+        "/opportunities/import",
+        content=body,
+        headers={**headers, "Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    assert response.json()["imported"] == 1
+    assert [error["line"] for error in response.json()["errors"]] == [2]
+
+    summary = async_client.get("/opportunities/mine/summary", headers=headers)
+    assert [row["title"] for row in summary.json()] == ["Build a landing page"]
+    search = async_client.get("/opportunities/search", params={"q": "landing"}, headers=headers)
+    assert [row["title"] for row in search.json()] == ["Build a landing page"]
@@ -1,7 +1,12 @@
+import threading
+import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 from models.user import User
 from utils.auth import get_password_hash
+from utils.hashing import HashingPoolBusy, PasswordHashingPool
+import routes.auth
+import utils.hashing as hashing
 
 
 def test_signup_success(client: TestClient):
@@ -117,3 +122,85 @@ def test_login_invalid_password(client: TestClient, db_session: Session):
     )
     assert response.status_code == 401
     assert response.json()["detail"] == "Invalid email or password"
+
+
+def test_signup_race_on_same_email(client: TestClient, db_session: Session, monkeypatch):
+    async def hash_while_another_signup_lands(password: str) -> str:
+        db_session.add(User(email="test@example.com", username="racer", hashed_password="x"))
+        db_session.commit()
+        return get_password_hash(password)
+
+    monkeypatch.setattr(routes.auth, "hash_password_async", hash_while_another_signup_lands)
+    response = client.post(
+        "/auth/signup",
+        json={
+            "email": "test@example.com",
+            "username": "testuser",
+            "password": "password123",
+            "full_name": "Test User",
+        },
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email already registered"
+    assert db_session.query(User).count() == 1
+
+
+@pytest.fixture
+def saturated_hashing_pool(monkeypatch):
+    pool = PasswordHashingPool(max_workers=0, max_pending=0)
+    # Occupy the only slot so every new submission is rejected
+    release = threading.Event()
+    pool.submit(release.wait)
+    monkeypatch.setattr(hashing, "hashing_pool", pool)
+    yield pool
+    release.set()
+    pool.shutdown()
+
+
+def test_signup_hashing_pool_busy(client: TestClient, saturated_hashing_pool):
+    response = client.post(
+        "/auth/signup",
+        json={
+            "email": "test@example.com",
+            "username": "testuser",
+            "password": "password123",
+            "full_name": "Test User",
+        },
+    )
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_login_hashing_pool_busy(
+    client: TestClient, db_session: Session, saturated_hashing_pool
+):
+    user = User(
+        email="test@example.com",
+        username="testuser",
+        hashed_password=get_password_hash("password123"),
+        full_name="Test User",
+    )
+    db_session.add(user)
+    db_session.commit()
+
+    response = client.post(
+        "/auth/login",
+        json={"email": "test@example.com", "password": "password123"},
+    )
+    assert response.status_code == 503
+
+
+def test_hashing_pool_rejects_when_full():
+    pool = PasswordHashingPool(max_workers=0, max_pending=1)
+    release = threading.Event()
+    try:
+        running = [pool.submit(release.wait) for _ in range(2)]
+        with pytest.raises(HashingPoolBusy):
+            pool.submit(get_password_hash, "password123")
+    finally:
+        release.set()
+        pool.shutdown()
+    assert all(future.result() for future in running)
+    # Slots are handed back as work finishes
+    pool.submit(get_password_hash, "password123").result()
+    pool.shutdown()
@@ -0,0 +1,148 @@
+"""Test cases for the in-process caches"""
+
+from datetime import timedelta
+
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt  # type: ignore
+from sqlalchemy.orm import Session
+from config import settings  # type: ignore
+from models.opportunity import Opportunity  # type: ignore
+from models.user import User  # type: ignore
+from utils.auth import create_access_token, decode_access_token_cached, token_cache
+from utils.cache import TTLCache
+from utils.dashboard import CreatorSummaryCache  # type: ignore
+from utils.dependencies import get_current_user, principal_cache  # type: ignore
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_hit_and_miss():
+    cache = TTLCache(maxsize=10, ttl=60)
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_ttl_cache_expires_entries():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, clock=clock)
+    cache.set("a", 1, expires_at=clock.now + 5)
+    clock.now += 4
+    assert cache.get("a") == 1
+    clock.now += 1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_decode_access_token_cached_reuses_verification():
+    token_cache.clear()
+    token = create_access_token(data={"sub": 42})
+
+    first = decode_access_token_cached(token)
+    second = decode_access_token_cached(token)
+
+    assert first is not None and first["sub"] == 42
+    assert second is first
+    assert token_cache.stats()["hits"] == 1
+    assert token_cache.stats()["misses"] == 1
+
+
+def test_decode_access_token_cached_rejects_invalid_token():
+    token_cache.clear()
+    assert decode_access_token_cached("not-a-token") is None
+    assert len(token_cache) == 0
+
+
+def test_decode_access_token_cached_skips_expired_token():
+    token_cache.clear()
+    expired = jwt.encode(
+        claims={"sub": "1", "exp": 1},
+        key=settings.SECRET_KEY,
+        algorithm=settings.ALGORITHM,
+    )
+    assert decode_access_token_cached(expired) is None
+    assert len(token_cache) == 0
+
+
+def test_cached_token_expires_with_exp_claim():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, clock=clock)
+    exp = clock.now + timedelta(minutes=1).total_seconds()
+    cache.set("token", {"sub": 1, "exp": exp}, expires_at=exp)
+    clock.now = exp
+    assert cache.get("token") is None
+
+
+def test_ttl_cache_drops_set_that_raced_with_invalidation():
+    cache = TTLCache(maxsize=10, ttl=60)
+    generation = cache.generation
+    cache.delete("user")  # invalidated while the caller was loading
+    cache.set("user", "stale", generation=generation)
+    assert cache.get("user") is None
+
+
+def test_ttl_cache_contains_ignores_expired_entries():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, ttl=60, clock=clock)
+    cache.set("key", "value")
+    assert "key" in cache
+    clock.now += 61
+    assert "key" not in cache
+    assert cache.stats()["hits"] == cache.stats()["misses"] == 0
+
+
+def test_summary_cache_opportunity_map_stays_bounded(db_session: Session):
+    db_session.add_all(
+        Opportunity(title=f"Gig {i}", description="x", creator_id=1 + i % 5)
+        for i in range(10)
+    )
+    db_session.commit()
+    cache = CreatorSummaryCache(maxsize=2, ttl=60)
+    for creator_id in range(1, 6):
+        assert len(cache.get(db_session, creator_id)) == 2
+    # Only the two creators still cached keep opportunity entries
+    assert set(cache._creators.values()) == {4, 5}
+
+    cache.invalidate_creator(5)
+    assert set(cache._creators.values()) == {4}
+    opportunity_id = next(iter(cache._creators))
+    cache.invalidate_opportunity(opportunity_id)
+    assert cache._creators == {}
+
+
+def test_principal_cache_hits_are_private_copies(db_session: Session):
+    principal_cache.clear()
+    db_session.add(User(email="p@example.com", username="principal", hashed_password="x"))
+    db_session.commit()
+    user_id = db_session.query(User).one().id
+    credentials = HTTPAuthorizationCredentials(
+        scheme="Bearer", credentials=create_access_token(data={"sub": user_id})
+    )
+
+    get_current_user(credentials, db_session)  # miss: loads and caches
+    first = get_current_user(credentials, db_session)
+    second = get_current_user(credentials, db_session)
+    assert first is not second
+    first.bio = "changed by one request"
+    assert second.bio is None
+    assert get_current_user(credentials, db_session).bio is None
+    principal_cache.clear()
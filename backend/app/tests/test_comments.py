@@ -0,0 +1,131 @@
+"""Test cases for Comments functionality"""
+
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlalchemy.orm import sessionmaker
+from models.post import Post  # type: ignore
+from utils.comments import CommentCountReconciler  # type: ignore
+
+
+def get_user_headers(client: TestClient, email: str, username: str) -> dict:
+    """Create a user and return auth headers."""
+    client.post(
+        "/auth/signup",
+        json={
+            "email": email,
+            "username": username,
+            "password": "password123",
+            "full_name": f"{username} User",
+        },
+    )
+    response = client.post(
+        "/auth/login",
+        json={"email": email, "password": "password123"},
+    )
+    token = response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def create_post(client: TestClient, headers: dict) -> int:
+    response = client.post("/posts", headers=headers, json={"content": "Discuss"})
+    return response.json()["id"]
+
+
+def test_create_comment_updates_count(client: TestClient):
+    """Test that commenting bumps the post's comments_count"""
+    headers = get_user_headers(client, "author@example.com", "author1")
+    post_id = create_post(client, headers)
+
+    response = client.post(
+        f"/posts/{post_id}/comments", headers=headers, json={"content": "First!"}
+    )
+    assert response.status_code == 201
+    data = response.json()
+    assert data["post_id"] == post_id
+    assert data["content"] == "First!"
+
+    post = client.get(f"/posts/{post_id}", headers=headers).json()
+    assert post["comments_count"] == 1
+
+
+def test_create_comment_post_not_found(client: TestClient):
+    """Test commenting on a non-existent post"""
+    headers = get_user_headers(client, "author@example.com", "author1")
+    response = client.post(
+        "/posts/999999/comments", headers=headers, json={"content": "Hello"}
+    )
+    assert response.status_code == 404
+
+
+def test_get_comments_cursor_pagination(client: TestClient):
+    """Test that comments page oldest first via X-Next-Cursor"""
+    headers = get_user_headers(client, "author@example.com", "author1")
+    post_id = create_post(client, headers)
+    comment_ids = [
+        client.post(
+            f"/posts/{post_id}/comments", headers=headers, json={"content": f"c{i}"}
+        ).json()["id"]
+        for i in range(5)
+    ]
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        response = client.get(f"/posts/{post_id}/comments", headers=headers, params=params)
+        assert response.status_code == 200
+        seen += [comment["id"] for comment in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        params = {"limit": 2, "cursor": cursor}
+    assert seen == comment_ids
+
+    response = client.get("/posts/999999/comments", headers=headers)
+    assert response.status_code == 404
+
+
+def test_delete_comment_permissions_and_count(client: TestClient):
+    """Test that comment or post authors can delete, and the count follows"""
+    author_headers = get_user_headers(client, "author@example.com", "author1")
+    commenter_headers = get_user_headers(client, "commenter@example.com", "commenter1")
+    other_headers = get_user_headers(client, "other@example.com", "other1")
+    post_id = create_post(client, author_headers)
+    comment_ids = [
+        client.post(
+            f"/posts/{post_id}/comments",
+            headers=commenter_headers,
+            json={"content": f"c{i}"},
+        ).json()["id"]
+        for i in range(2)
+    ]
+
+    url = f"/posts/{post_id}/comments"
+    assert client.delete(f"{url}/{comment_ids[0]}", headers=other_headers).status_code == 403
+    assert client.delete(f"{url}/{comment_ids[0]}", headers=commenter_headers).status_code == 204
+    assert client.delete(f"{url}/{comment_ids[1]}", headers=author_headers).status_code == 204
+    assert client.delete(f"{url}/{comment_ids[1]}", headers=author_headers).status_code == 404
+
+    post = client.get(f"/posts/{post_id}", headers=author_headers).json()
+    assert post["comments_count"] == 0
+
+
+def test_reconcile_fixes_drifted_counts(client: TestClient, db_session):
+    """Test that the reconciliation job repairs counts that drifted"""
+    headers = get_user_headers(client, "author@example.com", "author1")
+    post_ids = [create_post(client, headers) for _ in range(3)]
+    for _ in range(2):
+        client.post(f"/posts/{post_ids[0]}/comments", headers=headers, json={"content": "x"})
+
+    db_session.execute(update(Post).where(Post.id == post_ids[0]).values(comments_count=7))
+    db_session.execute(update(Post).where(Post.id == post_ids[2]).values(comments_count=3))
+    db_session.commit()
+
+    reconciler = CommentCountReconciler(
+        sessionmaker(bind=db_session.get_bind()), interval_seconds=0, batch_size=2
+    )
+    assert reconciler.run_once() == 2
+    assert reconciler.run_once() == 0
+
+    db_session.expire_all()
+    counts = [db_session.get(Post, post_id).comments_count for post_id in post_ids]
+    assert counts == [2, 0, 0]
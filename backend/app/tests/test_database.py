@@ -0,0 +1,140 @@
+"""Test cases for database engine configuration"""
+
+import pytest
+from sqlalchemy import create_engine, event, inspect, select, text
+from sqlalchemy.orm import sessionmaker
+from config import settings  # type: ignore
+from database import (  # type: ignore
+    Base,
+    apply_sqlite_pragmas,
+    create_missing_indexes,
+    sqlite_pragmas,
+)
+from models.application import Application  # type: ignore
+from models.post import post_search  # type: ignore
+from utils.applications import dedupe_applications  # type: ignore
+from utils.cascade import purge_orphans  # type: ignore
+
+
+def test_sqlite_pragmas_applied_on_connect(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'tuned.db'}")
+    event.listen(engine, "connect", apply_sqlite_pragmas)
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == int(
+            settings.SQLITE_BUSY_TIMEOUT_MS
+        )
+        assert conn.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+    engine.dispose()
+
+
+def test_sqlite_pragmas_skip_empty_values(monkeypatch):
+    monkeypatch.setattr(settings, "SQLITE_MMAP_SIZE", "")
+    assert "mmap_size" not in sqlite_pragmas()
+
+
+def test_sqlite_pragmas_reject_unsafe_values(monkeypatch):
+    monkeypatch.setattr(settings, "SQLITE_JOURNAL_MODE", "WAL; DROP TABLE users")
+    with pytest.raises(ValueError):
+        sqlite_pragmas()
+
+
+def test_search_index_backfilled_on_existing_database(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        # A database created before the FTS index existed
+        conn.execute(text("DROP TABLE posts_fts"))
+        for suffix in ("ai", "ad", "au"):
+            conn.execute(text(f"DROP TRIGGER posts_fts_{suffix}"))
+        conn.execute(text("INSERT INTO posts (author_id, content) VALUES (1, 'legacy row')"))
+
+    with engine.begin() as conn:
+        assert post_search.ensure(conn) is True
+        assert post_search.ensure(conn) is False
+        matches = conn.execute(
+            select(post_search.table.c.rowid).where(post_search.match("legacy"))
+        ).scalars().all()
+    assert matches == [1]
+    engine.dispose()
+
+
+def test_duplicate_applications_removed_before_unique_index(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    Base.metadata.create_all(bind=engine)
+    unique_index = next(
+        index for index in Application.__table__.indexes if index.unique
+    )
+    with engine.begin() as conn:
+        # A database from before applications were unique per applicant
+        unique_index.drop(conn)
+        for opportunity_id, applicant_id, status in (
+            (1, 1, "pending"),
+            (1, 1, "accepted"),
+            (1, 2, "pending"),
+            (2, 1, "rejected"),
+            (1, 1, "rejected"),
+            (2, 1, "pending"),
+        ):
+            conn.execute(
+                text(
+                    "INSERT INTO applications (opportunity_id, applicant_id, message, status) "
+                    f"VALUES ({opportunity_id}, {applicant_id}, 'hi', '{status}')"
+                )
+            )
+
+    # Startup refuses to run without the index rather than deleting anything
+    with pytest.raises(RuntimeError, match="manage.py dedupe-applications"):
+        create_missing_indexes(engine)
+
+    with sessionmaker(bind=engine)() as db:
+        assert dedupe_applications(db) == 3
+        db.commit()
+    create_missing_indexes(engine)
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT id, opportunity_id, applicant_id, status FROM applications ORDER BY id")
+        ).all()
+        indexes = {index["name"] for index in inspect(conn).get_indexes("applications")}
+    # Decisions win over pending rows, whatever their order
+    assert rows == [(2, 1, 1, "accepted"), (3, 1, 2, "pending"), (4, 2, 1, "rejected")]
+    assert unique_index.name in indexes
+    engine.dispose()
+
+
+def test_purge_orphans_in_batches(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'orphans.db'}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO opportunities (id, title, description) VALUES (1, 'Kept', 'x')"))
+        conn.execute(text("INSERT INTO posts (id, content) VALUES (1, 'Kept')"))
+        # Leftovers of parents deleted before cascades: opportunity 2 and post 2
+        # are gone, and the old ORM delete nulled some applications instead
+        for opportunity_id, applicant_id in ((1, 1), (2, 1), (2, 2), (2, 3), ("NULL", 4)):
+            conn.execute(
+                text(
+                    "INSERT INTO applications (opportunity_id, applicant_id, message) "
+                    f"VALUES ({opportunity_id}, {applicant_id}, 'hi')"
+                )
+            )
+        conn.execute(text("INSERT INTO opportunity_skills VALUES (1, 1), (2, 1), (2, 2)"))
+        conn.execute(text("INSERT INTO post_likes (post_id, user_id) VALUES (1, 1), (2, 1), (2, 2)"))
+        conn.execute(
+            text("INSERT INTO comments (post_id, author_id, content) VALUES (1, 1, 'a'), (2, 1, 'b')")
+        )
+
+    with sessionmaker(bind=engine)() as db:
+        assert purge_orphans(db, batch_size=2) == {
+            "applications": 4,
+            "opportunity_skills": 2,
+            "post_likes": 2,
+            "comments": 1,
+        }
+        assert purge_orphans(db, batch_size=2) == dict.fromkeys(
+            ("applications", "opportunity_skills", "post_likes", "comments"), 0
+        )
+    with engine.connect() as conn:
+        for table in ("applications", "opportunity_skills", "post_likes", "comments"):
+            assert conn.scalar(text(f"SELECT count(*) FROM {table}")) == 1
+    engine.dispose()
@@ -0,0 +1,155 @@
+"""Test cases for internal endpoints and pool instrumentation"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc as sa_exc, text
+from sqlalchemy.pool import QueuePool
+from config import settings  # type: ignore
+from models.user import User  # type: ignore
+from utils.bulk_import import UserImport, parse_rows, run_import  # type: ignore
+from utils.pool_metrics import PoolMetrics, instrumented_pool_class  # type: ignore
+
+
+@pytest.fixture
+def metered_engine(tmp_path):
+    metrics = PoolMetrics()
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=instrumented_pool_class(QueuePool, metrics),
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+    metrics.attach(engine)
+    yield engine, metrics
+    engine.dispose()
+
+
+def test_pool_metrics_count_checkouts_and_holds(metered_engine):
+    engine, metrics = metered_engine
+    for _ in range(3):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    snapshot = metrics.snapshot()
+    assert snapshot["checkouts"] == 3
+    assert snapshot["checkins"] == 3
+    assert snapshot["connects"] == 1
+    assert snapshot["checked_out"] == 0
+    assert snapshot["pool_class"] == "InstrumentedQueuePool"
+
+
+def test_pool_metrics_record_overflow_and_timeouts(metered_engine):
+    engine, metrics = metered_engine
+    first = engine.connect()
+    second = engine.connect()  # served from overflow
+    with pytest.raises(sa_exc.TimeoutError):
+        engine.connect()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["checked_out"] == 2
+    assert snapshot["overflow"] == 1
+    assert snapshot["overflow_checkouts"] == 1
+    assert snapshot["peak_overflow"] == 1
+    assert snapshot["timeouts"] == 1
+    first.close()
+    second.close()
+
+
+@pytest.fixture
+def internal_headers(monkeypatch) -> dict:
+    monkeypatch.setattr(settings, "INTERNAL_TOKEN", "s3cret")
+    return {"X-Internal-Token": "s3cret"}
+
+
+def test_db_pool_endpoint(client: TestClient, internal_headers: dict):
+    response = client.get("/internal/db-pool", headers=internal_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert "checkouts" in data["sync"]
+    assert "p99_ms" in data["sync"]["wait"]
+
+
+def test_db_pool_endpoint_requires_token(client: TestClient, internal_headers: dict):
+    assert client.get("/internal/db-pool").status_code == 403
+    wrong = client.get("/internal/db-pool", headers={"X-Internal-Token": "guess"})
+    assert wrong.status_code == 403
+
+
+def test_internal_endpoints_closed_without_configured_token(
+    client: TestClient, monkeypatch
+):
+    monkeypatch.setattr(settings, "INTERNAL_TOKEN", None)
+    assert client.get("/internal/db-pool").status_code == 403
+    response = client.get("/internal/db-pool", headers={"X-Internal-Token": ""})
+    assert response.status_code == 403
+
+
+def test_bulk_import_users(client: TestClient, internal_headers: dict):
+    client.post(
+        "/auth/signup",
+        json={
+            "email": "taken@example.com",
+            "username": "taken",
+            "password": "password123",
+            "full_name": "Already Here",
+        },
+    )
+    body = (
+        "email,username,password,full_name\n"
+        "new@example.com,newbie,password123,New User\n"
+        "taken@example.com,other,password123,Email Taken\n"
+        "fresh@example.com,newbie,password123,Name Taken In File\n"
+        "nope,nobody,password123,Bad Email\n"
+    )
+    response = client.post(
+        "/internal/import/users",
+        headers={**internal_headers, "Content-Type": "text/csv"},
+        content=body.encode(),
+    )
+    report = response.json()
+    assert (report["imported"], report["failed"]) == (1, 3)
+    assert [error["line"] for error in report["errors"]] == [3, 4, 5]
+    assert report["errors"][0]["error"] == "Email already registered"
+    assert report["errors"][1]["error"] == "Username already taken"
+
+    login = client.post(
+        "/auth/login", json={"email": "new@example.com", "password": "password123"}
+    )
+    assert login.status_code == 200
+
+
+def test_bulk_import_users_refused_without_token(
+    client: TestClient, db_session, monkeypatch
+):
+    body = '{"email": "x@example.com", "username": "xuser", "password": "password123"}\n'
+    for token, headers in ((None, {}), ("s3cret", {}), ("s3cret", {"X-Internal-Token": "no"})):
+        monkeypatch.setattr(settings, "INTERNAL_TOKEN", token)
+        response = client.post(
+            "/internal/import/users",
+            headers={**headers, "Content-Type": "application/x-ndjson"},
+            content=body.encode(),
+        )
+        assert response.status_code == 403
+    assert db_session.query(User).count() == 0
+
+
+def test_bulk_import_retries_conflicting_chunk_row_by_row(db_session):
+    def hash_and_race(passwords):
+        # A signup lands between the duplicate check and the chunk's INSERT
+        db_session.add(User(email="bob@example.com", username="racer", hashed_password="x"))
+        db_session.commit()
+        return ["hashed"] * len(passwords)
+
+    lines = [
+        '{"email": "%s@example.com", "username": "%s", "password": "password123", "full_name": "X"}\n'
+        % (name, name)
+        for name in ("ann", "bob", "cat")
+    ]
+    report = run_import(
+        db_session, parse_rows(lines, "jsonl"), UserImport(hash_and_race), 10, 10
+    )
+    assert (report.imported, report.failed) == (2, 1)
+    assert report.errors[0].line == 2
+    assert report.errors[0].error.startswith("conflicts with an existing row")
+    assert db_session.query(User).count() == 3
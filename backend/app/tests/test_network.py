@@ -0,0 +1,204 @@
+from types import SimpleNamespace
+from fastapi.testclient import TestClient
+from config import settings  # type: ignore
+from models.user import User  # type: ignore
+from utils.autocomplete import AutocompleteIndex  # type: ignore
+from utils.similarity import UserSimilarityIndex  # type: ignore
+
+
+def signup(client: TestClient, name: str, skills: list, interests: list) -> tuple[int, dict]:
+    """Create a user with a profile and return their id and auth headers"""
+    client.post(
+        "/auth/signup",
+        json={
+            "email": f"{name}@example.com",
+            "username": name,
+            "password": "password123",
+            "full_name": name.title(),
+        },
+    )
+    response = client.post(
+        "/auth/login", json={"email": f"{name}@example.com", "password": "password123"}
+    )
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    response = client.put(
+        "/profile/me", headers=headers, json={"skills": skills, "interests": interests}
+    )
+    return response.json()["id"], headers
+
+
+def test_similar_users_ranked_and_incremental(client: TestClient):
+    """Test that /network/similar ranks by overlap and follows profile edits"""
+    _, headers = signup(client, "seeker", ["python", "react", "sql"], ["ai"])
+    twin, _ = signup(client, "twin", ["python", "react", "sql"], ["ai", "music"])
+    partial, partial_headers = signup(client, "partial", ["Python"], [])
+    signup(client, "stranger", ["welding"], ["fishing"])
+
+    def similar(**params):
+        response = client.get("/network/similar", headers=headers, params=params)
+        assert response.status_code == 200
+        return response.json()
+
+    results = similar()
+    assert [user["id"] for user in results] == [twin, partial]
+    assert results[0]["score"] > results[1]["score"]
+    assert sorted(results[0]["shared"]) == [
+        "interest:ai",
+        "skill:python",
+        "skill:react",
+        "skill:sql",
+    ]
+    # Jaccard: 4 shared of 5 distinct terms
+    assert similar(metric="jaccard")[0]["score"] == 0.8
+
+    # The matrix follows profile edits made after it was loaded
+    client.put(
+        "/profile/me",
+        headers=partial_headers,
+        json={"skills": ["python", "react", "sql"], "interests": ["ai"]},
+    )
+    results = similar()
+    assert results[0]["id"] == partial
+    assert results[0]["score"] == 1.0
+
+    client.post("/profile/mode", headers=partial_headers, json={"mode": "builder"})
+    assert [user["id"] for user in similar(mode="builder")] == [partial]
+
+    response = client.get("/network/similar", headers=headers, params={"metric": "l2"})
+    assert response.status_code == 400
+
+
+def test_similarity_index_compacts_dead_rows():
+    """Test that replaced rows are dropped once they pass the compaction ratio"""
+    index = UserSimilarityIndex(compact_ratio=0.4)
+    index._loaded = True
+
+    def user(user_id, skills, mode="hustler"):
+        return SimpleNamespace(
+            id=user_id, mode=mode, skills=",".join(skills), interests=None
+        )
+
+    for user_id in range(1, 5):
+        index.upsert(user(user_id, ["go", f"own{user_id}"]))
+    index.upsert(user(2, ["rust"]))
+    index.upsert(user(3, ["go"]))
+    assert index._rows == 6 and index._dead == 2
+
+    index.upsert(user(4, ["go", "rust"]))  # third dead row crosses the ratio
+    assert index._rows == 4 and index._dead == 0
+
+    picks = index.similar(user(9, ["go", "rust"]), 10)
+    assert [pick.user_id for pick in picks] == [4, 2, 3, 1]
+    assert picks[0].score == 1.0
+    assert index.similar(user(9, ["cobol"]), 10) == []
+
+
+def test_similarity_index_reloads_after_ttl(db_session):
+    """Profiles edited through another worker show up once the matrix expires"""
+    now = [0.0]
+    index = UserSimilarityIndex(ttl=300, clock=lambda: now[0])
+    index.load(db_session)
+    db_session.add(User(email="o@example.com", username="other", hashed_password="x", skills="go"))
+    db_session.commit()
+    me = SimpleNamespace(id=999, mode=None, skills="go", interests=None)
+
+    now[0] = 299.0
+    assert index.loaded and index.similar(me, 10) == []
+    now[0] = 300.0
+    assert not index.loaded
+    index.load(db_session)
+    assert len(index.similar(me, 10)) == 1
+
+
+def test_autocomplete_users_and_skills(client: TestClient):
+    """Test that /network/autocomplete matches name prefixes and ranks skills"""
+    _, headers = signup(client, "alice", ["python", "pytorch"], [])
+    bob, bob_headers = signup(client, "bob", ["python", "pandas"], [])
+    bobby, _ = signup(client, "bobby", ["python", "pytorch"], [])
+    robert, _ = signup(client, "robert", ["perl"], [])
+
+    def suggest(q, **params):
+        response = client.get(
+            "/network/autocomplete", headers=headers, params={"q": q, **params}
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    # Username and any word of the full name match, case-insensitively
+    assert [user["id"] for user in suggest("BOB")["users"]] == [bob, bobby]
+    assert [user["id"] for user in suggest("rob")["users"]] == [robert]
+    assert suggest("al")["users"] == []  # never suggests yourself
+
+    assert suggest("p")["skills"] == [
+        {"name": "python", "users": 3},
+        {"name": "pytorch", "users": 2},
+        {"name": "pandas", "users": 1},
+        {"name": "perl", "users": 1},
+    ]
+    assert [skill["name"] for skill in suggest("py", limit=1)["skills"]] == ["python"]
+
+    # Profile edits move skill counts without a reload
+    client.put("/profile/me", headers=bob_headers, json={"skills": ["pytorch"]})
+    skills = suggest("p")["skills"]
+    assert skills[0] == {"name": "pytorch", "users": 3}
+    assert "pandas" not in [skill["name"] for skill in skills]
+
+    # Signups are indexed as they happen
+    carol, _ = signup(client, "carol", [], [])
+    assert [user["id"] for user in suggest("car")["users"]] == [carol]
+
+    response = client.get("/network/autocomplete", headers=headers, params={"q": ""})
+    assert response.status_code == 422
+
+
+def test_batch_user_lookup(client: TestClient, query_counter: list, monkeypatch):
+    """Test that /network/batch resolves many users with one IN query"""
+    me, headers = signup(client, "batcher", [], [])
+    others = [signup(client, f"member{i}", [], [])[0] for i in range(3)]
+    ids = [me, *others, 999999]
+
+    # Warm the principal cache for the caller, as any earlier request would
+    client.get("/profile/me", headers=headers)
+    query_counter.clear()
+    response = client.get(
+        "/network/batch", headers=headers, params={"ids": ",".join(map(str, ids))}
+    )
+    assert response.status_code == 200
+    users = response.json()
+    assert sorted(users) == sorted(str(user_id) for user_id in ids[:-1])
+    assert users[str(others[0])]["username"] == "member0"
+    user_queries = [sql for sql in query_counter if "FROM users" in sql]
+    assert len(user_queries) == 1 and " IN " in user_queries[0]
+
+    response = client.post("/network/batch", headers=headers, json={"ids": others})
+    assert response.status_code == 200
+    assert sorted(response.json()) == sorted(str(user_id) for user_id in others)
+
+    bad = client.get("/network/batch", headers=headers, params={"ids": "1,two"})
+    assert bad.status_code == 400
+    huge = client.get(
+        "/network/batch", headers=headers, params={"ids": "1,99999999999999999999"}
+    )
+    assert huge.status_code == 400
+    huge = client.post("/network/batch", headers=headers, json={"ids": [-(2**64)]})
+    assert huge.status_code == 400
+
+    monkeypatch.setattr(settings, "USER_BATCH_MAX_IDS", 2)
+    response = client.post("/network/batch", headers=headers, json={"ids": others})
+    assert response.status_code == 400
+
+
+def test_autocomplete_index_reloads_after_ttl(db_session):
+    """Users who signed up through another worker show up once the index expires"""
+    now = [0.0]
+    index = AutocompleteIndex(ttl=300, clock=lambda: now[0])
+    index.load(db_session)
+    db_session.add(User(email="n@example.com", username="newcomer", hashed_password="x"))
+    db_session.commit()
+
+    now[0] = 299.0
+    assert index.loaded and index.suggest("new", 5)[0] == []
+    now[0] = 300.0
+    assert not index.loaded
+    index.load(db_session)
+    assert [user.username for user in index.suggest("new", 5)[0]] == ["newcomer"]
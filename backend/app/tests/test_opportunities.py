@@ -1,8 +1,23 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+import json
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
-from sqlalchemy.orm import Session
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import Session, sessionmaker
+from config import settings  # type: ignore
+from database import Base, apply_sqlite_pragmas  # type: ignore
+from models.application import Application  # type: ignore
 from models.user import User  # type: ignore
 from models.opportunity import Opportunity  # type: ignore
+from models.skill import opportunity_skills  # type: ignore
+from routes.opportunities import apply_to_opportunity  # type: ignore
+from schemas.application import ApplicationCreate  # type: ignore
 from utils.auth import get_password_hash  # type: ignore
+from utils.dependencies import principal_cache  # type: ignore
+from utils.recommendations import RecommendationIndex  # type: ignore
+from utils.skills import migrate_opportunity_skills, set_opportunity_skills  # type: ignore
 
 
 def get_creator_headers(client: TestClient) -> dict:
@@ -164,6 +179,53 @@ def test_delete_opportunity(client: TestClient):
     assert get_response.status_code == 404
 
 
+def test_delete_opportunity_cascades_set_based(
+    client: TestClient, db_session: Session, query_counter: list
+):
+    """Test that applications and skill rows go with one DELETE per table"""
+    creator_headers = get_creator_headers(client)
+    opportunity_id = create_skilled_opportunity(
+        client, creator_headers, "Crowded opportunity", ["python", "sql"]
+    )
+    kept_id = create_skilled_opportunity(
+        client, creator_headers, "Kept opportunity", ["python"]
+    )
+    for i in range(5):
+        token = client.post(
+            "/auth/signup",
+            json={
+                "email": f"cascade{i}@example.com",
+                "username": f"cascade{i}",
+                "password": "password123",
+                "full_name": f"Cascade {i}",
+            },
+        ).json()["access_token"]
+        for target in (opportunity_id, kept_id):
+            client.post(
+                f"/opportunities/{target}/apply",
+                headers={"Authorization": f"Bearer {token}"},
+                json={"message": "Count me in for this one."},
+            )
+
+    query_counter.clear()
+    response = client.delete(f"/opportunities/{opportunity_id}", headers=creator_headers)
+    assert response.status_code == 204
+    deletes = [statement for statement in query_counter if statement.startswith("DELETE")]
+    assert len(deletes) == 3
+    assert not any(
+        statement.startswith("SELECT") and "FROM applications" in statement
+        for statement in query_counter
+    )
+
+    def count(column, target: int) -> int:
+        return db_session.scalar(select(func.count()).where(column == target))
+
+    assert count(Application.opportunity_id, opportunity_id) == 0
+    assert count(opportunity_skills.c.opportunity_id, opportunity_id) == 0
+    assert count(Application.opportunity_id, kept_id) == 5
+    assert count(opportunity_skills.c.opportunity_id, kept_id) == 1
+
+
 def test_apply_to_opportunity(client: TestClient):
     creator_headers = get_creator_headers(client)
     applicant_headers = get_applicant_headers(client)
@@ -217,3 +279,694 @@ def test_get_opportunity_applications(client: TestClient):
     assert isinstance(data, list)
     assert len(data) == 1
     assert data[0]["message"] == "Test application."
+
+
+def test_get_opportunities_cursor_pagination(client: TestClient):
+    headers = get_creator_headers(client)
+    for i in range(5):
+        client.post(
+            "/opportunities",
+            headers=headers,
+            json={
+                "title": f"Paged opportunity {i}",
+                "description": "An opportunity used to test cursor paging.",
+            },
+        )
+
+    titles = []
+    cursor = None
+    while True:
+        url = "/opportunities?limit=2&status=open"
+        if cursor:
+            url += f"&cursor={cursor}"
+        response = client.get(url, headers=headers)
+        assert response.status_code == 200
+        titles += [opp["title"] for opp in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert titles == [f"Paged opportunity {i}" for i in range(4, -1, -1)]
+
+
+def test_get_opportunities_cursor_must_match_status(client: TestClient):
+    headers = get_creator_headers(client)
+    for i in range(2):
+        client.post(
+            "/opportunities",
+            headers=headers,
+            json={
+                "title": f"Paged opportunity {i}",
+                "description": "An opportunity used to test cursor paging.",
+            },
+        )
+
+    response = client.get("/opportunities?limit=1&status=open", headers=headers)
+    cursor = response.headers["X-Next-Cursor"]
+    mismatched = client.get(
+        f"/opportunities?limit=1&status=closed&cursor={cursor}", headers=headers
+    )
+    assert mismatched.status_code == 400
+
+
+def create_opportunity(client: TestClient, headers: dict, title: str, description: str) -> int:
+    response = client.post(
+        "/opportunities",
+        headers=headers,
+        json={"title": title, "description": description},
+    )
+    return response.json()["id"]
+
+
+def test_search_opportunities_ranks_title_matches_first(client: TestClient):
+    headers = get_creator_headers(client)
+    in_description = create_opportunity(
+        client,
+        headers,
+        "Backend engineer wanted",
+        "Help us migrate services to kubernetes and keep the lights on.",
+    )
+    in_title = create_opportunity(
+        client,
+        headers,
+        "Kubernetes cluster setup",
+        "Stand up a small cluster for a side project with monitoring.",
+    )
+    create_opportunity(
+        client, headers, "Logo design", "Design a logo for a small coffee roastery."
+    )
+
+    response = client.get(
+        "/opportunities/search", headers=headers, params={"q": "kubernetes"}
+    )
+    assert response.status_code == 200
+    results = response.json()
+    assert [opp["id"] for opp in results] == [in_title, in_description]
+    assert results[0]["title_highlight"] == "<mark>Kubernetes</mark> cluster setup"
+    assert "<mark>kubernetes</mark>" in results[1]["description_snippet"]
+
+
+def test_search_opportunities_escapes_html(client: TestClient):
+    headers = get_creator_headers(client)
+    create_opportunity(
+        client,
+        headers,
+        "<img src=x onerror=alert(1)> gig",
+        "Paid <script>steal()</script> gig for a trusted contractor.",
+    )
+
+    response = client.get("/opportunities/search", headers=headers, params={"q": "gig"})
+    result = response.json()[0]
+    assert result["title_highlight"] == "&lt;img src=x onerror=alert(1)&gt; <mark>gig</mark>"
+    snippet = result["description_snippet"]
+    assert "<script>" not in snippet
+    assert "&lt;script&gt;steal()&lt;/script&gt; <mark>gig</mark>" in snippet
+
+
+def test_search_opportunities_with_status_and_sync(client: TestClient, db_session: Session):
+    headers = get_creator_headers(client)
+    open_id = create_opportunity(
+        client, headers, "Rust parser work", "Write a parser for a small config language."
+    )
+    closed_id = create_opportunity(
+        client, headers, "Rust CLI cleanup", "Tidy up an old command line tool codebase."
+    )
+    db_session.get(Opportunity, closed_id).status = "closed"
+    db_session.commit()
+
+    def search(**params):
+        response = client.get("/opportunities/search", headers=headers, params=params)
+        return [opp["id"] for opp in response.json()]
+
+    assert sorted(search(q="rust")) == [open_id, closed_id]
+    assert search(q="rust", status="open") == [open_id]
+
+    # The index follows updates and deletes
+    client.put(
+        f"/opportunities/{open_id}",
+        headers=headers,
+        json={"title": "Go parser work", "description": "Write a parser for a small config language."},
+    )
+    assert search(q="rust") == [closed_id]
+    client.delete(f"/opportunities/{closed_id}", headers=headers)
+    assert search(q="rust") == []
+    assert search(q="go parser") == [open_id]
+
+
+def test_search_opportunities_cursor_pagination(client: TestClient):
+    headers = get_creator_headers(client)
+    ids = [
+        create_opportunity(
+            client, headers, f"Data labeling batch {i}", "Label images for a vision dataset."
+        )
+        for i in range(5)
+    ]
+
+    seen = []
+    cursors = []
+    params = {"q": "labeling", "limit": 2, "status": "open"}
+    while True:
+        response = client.get("/opportunities/search", headers=headers, params=params)
+        seen += [opp["id"] for opp in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        cursors.append(cursor)
+        params = {**params, "cursor": cursor}
+    assert sorted(seen) == ids
+
+    mismatched = client.get(
+        "/opportunities/search",
+        headers=headers,
+        params={"q": "labeling", "cursor": cursors[0]},
+    )
+    assert mismatched.status_code == 400
+
+
+def create_skilled_opportunity(client: TestClient, headers: dict, title: str, skills: list) -> int:
+    response = client.post(
+        "/opportunities",
+        headers=headers,
+        json={
+            "title": title,
+            "description": "An opportunity used to test skill filters.",
+            "required_skills": skills,
+        },
+    )
+    return response.json()["id"]
+
+
+def test_get_opportunities_skills_filter(client: TestClient):
+    headers = get_creator_headers(client)
+    both = create_skilled_opportunity(client, headers, "Full stack", ["Python", "React"])
+    python_only = create_skilled_opportunity(client, headers, "Scripting", ["python"])
+    create_skilled_opportunity(client, headers, "Design work", ["figma"])
+
+    def ids(**params):
+        response = client.get("/opportunities", headers=headers, params=params)
+        assert response.status_code == 200
+        return sorted(opp["id"] for opp in response.json())
+
+    assert ids(skills="python") == [both, python_only]
+    assert ids(skills="python, REACT") == [both, python_only]
+    assert ids(skills="python,react", skills_match="all") == [both]
+    assert ids(skills="python,rust", skills_match="all") == []
+    assert ids(skills="rust") == []
+
+    response = client.get(
+        "/opportunities", headers=headers, params={"skills": "python", "skills_match": "most"}
+    )
+    assert response.status_code == 400
+
+    # The legacy string field is still returned as before
+    opportunity = client.get(f"/opportunities/{both}", headers=headers).json()
+    assert opportunity["required_skills"] == '["Python", "React"]'
+
+
+def test_update_opportunity_replaces_skills(client: TestClient):
+    headers = get_creator_headers(client)
+    opportunity_id = create_skilled_opportunity(client, headers, "Data pipeline", ["sql"])
+    client.put(
+        f"/opportunities/{opportunity_id}",
+        headers=headers,
+        json={
+            "title": "Data pipeline",
+            "description": "An opportunity used to test skill filters.",
+            "required_skills": ["spark"],
+        },
+    )
+
+    def ids(skills):
+        response = client.get("/opportunities", headers=headers, params={"skills": skills})
+        return [opp["id"] for opp in response.json()]
+
+    assert ids("sql") == []
+    assert ids("spark") == [opportunity_id]
+    client.delete(f"/opportunities/{opportunity_id}", headers=headers)
+    assert ids("spark") == []
+
+
+def test_migrate_legacy_required_skills(client: TestClient, db_session: Session):
+    headers = get_creator_headers(client)
+    creator = db_session.query(User).filter(User.username == "creator").first()
+    legacy = Opportunity(
+        title="Legacy row",
+        description="Created before skills were normalized.",
+        required_skills='["Go", "Docker"]',
+        creator_id=creator.id,
+    )
+    db_session.add(legacy)
+    db_session.commit()
+
+    assert migrate_opportunity_skills(db_session) == 1
+    assert migrate_opportunity_skills(db_session) == 0
+
+    response = client.get(
+        "/opportunities",
+        headers=headers,
+        params={"skills": "go,docker", "skills_match": "all"},
+    )
+    assert [opp["id"] for opp in response.json()] == [legacy.id]
+
+
+def test_recommended_opportunities_ranked_and_incremental(client: TestClient):
+    creator_headers = get_creator_headers(client)
+    applicant_headers = get_applicant_headers(client)
+    client.put(
+        "/profile/me",
+        headers=applicant_headers,
+        json={"skills": ["Python", "SQL"]},
+    )
+
+    def create(title, skills, bounty=None):
+        response = client.post(
+            "/opportunities",
+            headers=creator_headers,
+            json={
+                "title": title,
+                "description": "An opportunity used to test recommendations.",
+                "required_skills": skills,
+                "bounty_amount": bounty,
+            },
+        )
+        return response.json()["id"]
+
+    full_match = create("Reporting service", ["python", "sql"])
+    half_match = create("Web app", ["python", "react"])
+    rich_half_match = create("Paid web app", ["python", "react"], bounty=5000)
+    create("Mobile app", ["swift"])
+
+    def recommended():
+        response = client.get("/opportunities/recommended", headers=applicant_headers)
+        assert response.status_code == 200
+        return response.json()
+
+    results = recommended()
+    assert [opp["id"] for opp in results] == [full_match, rich_half_match, half_match]
+    assert results[0]["matched_skills"] == ["python", "sql"]
+    assert results[1]["score"] > results[2]["score"]
+
+    # The index follows writes made after it was loaded
+    newcomer = create("Data cleanup", ["sql"])
+    assert newcomer in [opp["id"] for opp in recommended()]
+    client.delete(f"/opportunities/{full_match}", headers=creator_headers)
+    client.put(
+        f"/opportunities/{half_match}",
+        headers=creator_headers,
+        json={
+            "title": "Web app",
+            "description": "An opportunity used to test recommendations.",
+            "required_skills": ["react"],
+        },
+    )
+    assert [opp["id"] for opp in recommended()] == [newcomer, rich_half_match]
+
+    # Creators are not recommended their own opportunities
+    assert client.get("/opportunities/recommended", headers=creator_headers).json() == []
+
+
+def test_recommendation_index_skips_past_deadlines(db_session: Session):
+    index = RecommendationIndex()
+    index.load(db_session)
+    now = datetime.now()
+    soon = Opportunity(id=1, status="open", creator_id=9, deadline=now + timedelta(days=1))
+    later = Opportunity(id=2, status="open", creator_id=9, deadline=now + timedelta(days=60))
+    expired = Opportunity(id=3, status="open", creator_id=9, deadline=now - timedelta(days=1))
+    closed = Opportunity(id=4, status="closed", creator_id=9)
+    for opportunity in (soon, later, expired, closed):
+        index.upsert(opportunity, ["go"])
+
+    assert [pick.opportunity_id for pick in index.recommend(["go"], 10)] == [1, 2]
+    assert index.recommend(["go"], 10, exclude_creator=9) == []
+
+
+def test_recommendation_index_reloads_after_ttl(db_session: Session):
+    """Changes made by another worker show up once the index expires"""
+    now = [0.0]
+    index = RecommendationIndex(ttl=300, clock=lambda: now[0])
+    index.load(db_session)
+    db_session.add(Opportunity(title="Other worker", description="x", creator_id=9))
+    db_session.flush()
+    opportunity_id = db_session.query(Opportunity).one().id
+    set_opportunity_skills(db_session, opportunity_id, ["go"])
+    db_session.commit()
+
+    now[0] = 299.0
+    assert index.loaded and index.recommend(["go"], 10) == []
+    now[0] = 300.0
+    assert not index.loaded
+    index.load(db_session)
+    assert [pick.opportunity_id for pick in index.recommend(["go"], 10)] == [opportunity_id]
+
+
+def test_get_applications_expand_applicant_constant_queries(
+    client: TestClient, query_counter: list
+):
+    """Test that ?expand=applicant embeds profiles without a query per applicant"""
+    creator_headers = get_creator_headers(client)
+    opportunity_id = client.post(
+        "/opportunities",
+        headers=creator_headers,
+        json={"title": "Expand Test", "description": "Testing embedded applicants."},
+    ).json()["id"]
+
+    def apply(name: str) -> None:
+        token = client.post(
+            "/auth/signup",
+            json={
+                "email": f"{name}@example.com",
+                "username": name,
+                "password": "password123",
+                "full_name": name.title(),
+            },
+        ).json()["access_token"]
+        client.post(
+            f"/opportunities/{opportunity_id}/apply",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"message": f"{name} would like to help out."},
+        )
+
+    def expanded() -> tuple[list, int]:
+        query_counter.clear()
+        response = client.get(
+            f"/opportunities/{opportunity_id}/applications",
+            headers=creator_headers,
+            params={"expand": "applicant"},
+        )
+        assert response.status_code == 200
+        return response.json(), len(query_counter)
+
+    apply("first")
+    data, one_application = expanded()
+    assert data[0]["applicant"]["username"] == "first"
+    assert data[0]["applicant"]["full_name"] == "First"
+
+    for i in range(5):
+        apply(f"extra{i}")
+    data, six_applications = expanded()
+    assert len(data) == 6
+    assert sorted(app["applicant"]["username"] for app in data)[0] == "extra0"
+    # The opportunity check and one joined SELECT, however many applicants
+    assert six_applications == one_application == 2
+
+    plain = client.get(
+        f"/opportunities/{opportunity_id}/applications", headers=creator_headers
+    ).json()
+    assert "applicant" not in plain[0]
+
+    bad = client.get(
+        f"/opportunities/{opportunity_id}/applications",
+        headers=creator_headers,
+        params={"expand": "opportunity"},
+    )
+    assert bad.status_code == 400
+
+
+def test_apply_is_a_single_statement(client: TestClient, query_counter: list):
+    """Test that apply, repeat apply and a missing opportunity each cost one statement"""
+    creator_headers = get_creator_headers(client)
+    applicant_headers = get_applicant_headers(client)
+    opportunity_id = client.post(
+        "/opportunities",
+        headers=creator_headers,
+        json={"title": "One Shot", "description": "Testing the apply statement count."},
+    ).json()["id"]
+    client.get("/profile/me", headers=applicant_headers)  # warm the principal cache
+
+    def apply(target: int):
+        query_counter.clear()
+        return client.post(
+            f"/opportunities/{target}/apply",
+            headers=applicant_headers,
+            json={"message": "Counting my statements."},
+        )
+
+    response = apply(opportunity_id)
+    assert response.status_code == 201
+    assert response.json()["status"] == "pending"
+    assert len(query_counter) == 1 and query_counter[0].startswith("INSERT")
+
+    response = apply(opportunity_id)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Already applied to this opportunity"
+    assert len(query_counter) == 1
+
+    assert apply(999999).status_code == 404
+    assert len(query_counter) == 1
+
+
+def test_concurrent_applies_to_one_opportunity(tmp_path):
+    """Hundreds of parallel applies leave exactly one application per applicant"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'applies.db'}",
+        connect_args={"check_same_thread": False},
+        pool_size=16,
+    )
+    event.listen(engine, "connect", apply_sqlite_pragmas)
+    Base.metadata.create_all(bind=engine)
+    SessionFile = sessionmaker(bind=engine)
+    with SessionFile() as db:
+        opportunity = Opportunity(
+            title="Hot bounty", description="Everyone wants it", creator_id=1
+        )
+        db.add(opportunity)
+        db.commit()
+        opportunity_id = opportunity.id
+
+    def apply(attempt: int) -> int:
+        with SessionFile() as db:
+            try:
+                apply_to_opportunity(
+                    opportunity_id=opportunity_id,
+                    application_data=ApplicationCreate(message="Pick me, pick me!"),
+                    current_user=SimpleNamespace(id=attempt % 50 + 1),
+                    db=db,
+                )
+                return 201
+            except HTTPException as exc:
+                return exc.status_code
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        statuses = list(pool.map(apply, range(500)))
+
+    assert statuses.count(201) == 50
+    assert statuses.count(400) == 450
+    with SessionFile() as db:
+        assert db.scalar(select(func.count()).select_from(Application)) == 50
+    engine.dispose()
+
+
+def test_bulk_application_status_update(
+    client: TestClient, query_counter: list, monkeypatch
+):
+    """Test that many applications change with one ownership check and one UPDATE"""
+    # Keep the creator's principal cached however long the signups below take
+    monkeypatch.setattr(principal_cache, "ttl", 3600)
+    creator_headers = get_creator_headers(client)
+    applicant_headers = get_applicant_headers(client)
+
+    def create(title: str) -> int:
+        return client.post(
+            "/opportunities",
+            headers=creator_headers,
+            json={"title": title, "description": "Testing bulk status updates."},
+        ).json()["id"]
+
+    opportunity_id, other_id = create("Triage"), create("Elsewhere")
+    application_ids = []
+    for i in range(20):
+        token = client.post(
+            "/auth/signup",
+            json={
+                "email": f"bulk{i}@example.com",
+                "username": f"bulk{i}",
+                "password": "password123",
+                "full_name": f"Bulk {i}",
+            },
+        ).json()["access_token"]
+        application_ids.append(
+            client.post(
+                f"/opportunities/{opportunity_id}/apply",
+                headers={"Authorization": f"Bearer {token}"},
+                json={"message": "Please consider me."},
+            ).json()["id"]
+        )
+    elsewhere = client.post(
+        f"/opportunities/{other_id}/apply",
+        headers=applicant_headers,
+        json={"message": "Applying somewhere else."},
+    ).json()["id"]
+
+    query_counter.clear()
+    response = client.put(
+        f"/opportunities/{opportunity_id}/applications/status",
+        headers=creator_headers,
+        json={"ids": application_ids[:15] + [elsewhere, 999999], "status": "accepted"},
+    )
+    assert response.status_code == 200
+    results = response.json()
+    assert results[:15] == [
+        {"id": application_id, "updated": True, "status": "accepted"}
+        for application_id in application_ids[:15]
+    ]
+    assert results[15:] == [
+        {"id": elsewhere, "updated": False, "detail": "Application not found"},
+        {"id": 999999, "updated": False, "detail": "Application not found"},
+    ]
+    # The ownership check and one UPDATE, however many ids
+    assert len(query_counter) == 2 and query_counter[1].startswith("UPDATE")
+
+    statuses = {
+        app["id"]: app["status"]
+        for app in client.get(
+            f"/opportunities/{opportunity_id}/applications", headers=creator_headers
+        ).json()
+    }
+    assert [statuses[i] for i in application_ids] == ["accepted"] * 15 + ["pending"] * 5
+    other = client.get(f"/opportunities/{other_id}/applications", headers=creator_headers)
+    assert other.json()[0]["status"] == "pending"
+
+    def put(headers: dict, body: dict, target: int = opportunity_id):
+        return client.put(
+            f"/opportunities/{target}/applications/status", headers=headers, json=body
+        )
+
+    reject_all = {"ids": application_ids, "status": "rejected"}
+    assert put(applicant_headers, reject_all).status_code == 403
+    assert put(creator_headers, {**reject_all, "status": "maybe"}).status_code == 400
+    assert put(creator_headers, reject_all, target=999999).status_code == 404
+
+
+def test_my_opportunities_summary_cached_and_invalidated(
+    client: TestClient, query_counter: list
+):
+    """Test the dashboard summary counts, its cache, and invalidation on writes"""
+    creator_headers = get_creator_headers(client)
+
+    def create(title: str) -> int:
+        return client.post(
+            "/opportunities",
+            headers=creator_headers,
+            json={"title": title, "description": "Testing the dashboard summary."},
+        ).json()["id"]
+
+    def apply(opportunity_id: int, name: str) -> int:
+        token = client.post(
+            "/auth/signup",
+            json={
+                "email": f"{name}@example.com",
+                "username": name,
+                "password": "password123",
+                "full_name": name.title(),
+            },
+        ).json()["access_token"]
+        return client.post(
+            f"/opportunities/{opportunity_id}/apply",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"message": "Counting on the dashboard."},
+        ).json()["id"]
+
+    def summary() -> list:
+        response = client.get("/opportunities/mine/summary", headers=creator_headers)
+        assert response.status_code == 200
+        return [
+            (row["id"], row["pending"], row["accepted"], row["rejected"], row["total"])
+            for row in response.json()
+        ]
+
+    quiet, busy = create("Quiet one"), create("Busy one")
+    applications = [apply(busy, f"dash{i}") for i in range(3)]
+    assert summary() == [(busy, 3, 0, 0, 3), (quiet, 0, 0, 0, 0)]
+
+    # Served from the cache until something changes
+    query_counter.clear()
+    summary()
+    assert query_counter == []
+
+    client.put(
+        f"/opportunities/{busy}/applications/status",
+        headers=creator_headers,
+        json={"ids": applications[:2], "status": "accepted"},
+    )
+    assert summary() == [(busy, 1, 2, 0, 3), (quiet, 0, 0, 0, 0)]
+
+    apply(quiet, "latecomer")
+    assert summary() == [(busy, 1, 2, 0, 3), (quiet, 1, 0, 0, 1)]
+
+    newest = create("Newest one")
+    assert summary()[0] == (newest, 0, 0, 0, 0)
+
+    # Other users only see their own opportunities
+    assert client.get(
+        "/opportunities/mine/summary", headers=get_applicant_headers(client)
+    ).json() == []
+
+
+def test_bulk_import_opportunities_jsonl(client: TestClient, monkeypatch):
+    """Test a streamed JSONL import: chunked inserts, skills, per-row errors"""
+    monkeypatch.setattr(settings, "BULK_IMPORT_CHUNK_SIZE", 2)
+    headers = get_creator_headers(client)
+    rows = [
+        {
+            "title": f"Imported {i}",
+            "description": "Migrated from another job board.",
+            "required_skills": ["Python", "Go"] if i % 2 else None,
+        }
+        for i in range(5)
+    ]
+    body = [json.dumps(row) + "\n" for row in rows]
+    body[2:2] = ['{"title": "Bad", "description": "short"}\n', "\n", "not json\n"]
+
+    def chunks():
+        # Split mid-line, as the network would
+        data = "".join(body).encode()
+        for start in range(0, len(data), 7):
+            yield data[start:start + 7]
+
+    response = client.post(
+        "/opportunities/import",
+        headers={**headers, "Content-Type": "application/x-ndjson"},
+        content=chunks(),
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert report["imported"] == 5
+    assert report["failed"] == 2
+    assert [error["line"] for error in report["errors"]] == [3, 5]
+    assert report["errors"][0]["error"].startswith("title: String should have at least 5")
+
+    listed = client.get("/opportunities", headers=headers, params={"skills": "go"}).json()
+    assert sorted(opp["title"] for opp in listed) == ["Imported 1", "Imported 3"]
+    summary = client.get("/opportunities/mine/summary", headers=headers).json()
+    assert len(summary) == 5
+
+
+def test_bulk_import_opportunities_csv(client: TestClient):
+    headers = get_creator_headers(client)
+    body = (
+        "title,description,required_skills,bounty_amount\n"
+        'CSV listing,"A description, with a comma, long enough","python,react",250\n'
+        "Tiny,too short,,\n"
+        'Second listing,"Multi-line\ndescription that is long enough",,\n'
+    )
+    response = client.post(
+        "/opportunities/import",
+        headers={**headers, "Content-Type": "text/csv; charset=utf-8"},
+        content=body.encode(),
+    )
+    report = response.json()
+    assert (report["imported"], report["failed"]) == (2, 1)
+    assert report["errors"][0]["line"] == 3
+
+    listed = client.get("/opportunities", headers=headers).json()
+    by_title = {opp["title"]: opp for opp in listed}
+    assert by_title["CSV listing"]["bounty_amount"] == 250
+    assert json.loads(by_title["CSV listing"]["required_skills"]) == ["python", "react"]
+    assert by_title["Second listing"]["description"].startswith("Multi-line\n")
+
+    unsupported = client.post(
+        "/opportunities/import",
+        headers={**headers, "Content-Type": "application/json"},
+        content=b"[]",
+    )
+    assert unsupported.status_code == 415
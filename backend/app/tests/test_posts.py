@@ -1,6 +1,18 @@
 """Test cases for Posts functionality"""
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+from config import settings  # type: ignore
+from database import Base, apply_sqlite_pragmas  # type: ignore
+from models.post import Post  # type: ignore
+import routes.posts  # type: ignore
+from routes.posts import like_post  # type: ignore
+from utils.likes import LikeAggregator  # type: ignore
+from utils.timeline import TimelineStore, timeline_store  # type: ignore
 
 
 def get_user_headers(client: TestClient, email: str, username: str) -> dict:
@@ -228,7 +240,7 @@ def test_like_post(client: TestClient):
 
 
 def test_like_post_multiple_times(client: TestClient):
-    """Test that a user can like a post multiple times"""
+    """Test that liking a post again does not count twice"""
     author_headers = get_user_headers(client, "author@example.com", "author1")
     liker_headers = get_user_headers(client, "liker@example.com", "liker1")
 
@@ -242,11 +254,60 @@ def test_like_post_multiple_times(client: TestClient):
 
     # Like the post multiple times
     client.post(f"/posts/{post_id}/like", headers=liker_headers)
-    _ = client.post(f"/posts/{post_id}/like", headers=liker_headers)
+    second = client.post(f"/posts/{post_id}/like", headers=liker_headers)
+    assert second.status_code == 200
+    assert second.json()["likes_count"] == 1
 
     # Check likes are counted correctly
     get_response = client.get(f"/posts/{post_id}", headers=liker_headers)
     assert get_response.status_code == 200
+    assert get_response.json()["likes_count"] == 1
+    assert get_response.json()["liked_by_me"] is True
+
+
+def test_unlike_post(client: TestClient):
+    """Test removing a like"""
+    author_headers = get_user_headers(client, "author@example.com", "author1")
+    liker_headers = get_user_headers(client, "liker@example.com", "liker1")
+    post_id = client.post(
+        "/posts", headers=author_headers, json={"content": "Like then unlike"}
+    ).json()["id"]
+    client.post(f"/posts/{post_id}/like", headers=author_headers)
+    client.post(f"/posts/{post_id}/like", headers=liker_headers)
+
+    response = client.delete(f"/posts/{post_id}/like", headers=liker_headers)
+    assert response.status_code == 200
+    assert response.json()["likes_count"] == 1
+    assert response.json()["liked_by_me"] is False
+
+    # Unliking again changes nothing
+    response = client.delete(f"/posts/{post_id}/like", headers=liker_headers)
+    assert response.json()["likes_count"] == 1
+
+    response = client.delete("/posts/999999/like", headers=liker_headers)
+    assert response.status_code == 404
+
+
+def test_get_posts_liked_by_me_single_lookup(client: TestClient, query_counter):
+    """liked_by_me for a page costs one post_likes query, not one per post"""
+    author_headers = get_user_headers(client, "author@example.com", "author1")
+    liker_headers = get_user_headers(client, "liker@example.com", "liker1")
+    post_ids = [
+        client.post(
+            "/posts", headers=author_headers, json={"content": f"Post {i}"}
+        ).json()["id"]
+        for i in range(6)
+    ]
+    for post_id in post_ids[::2]:
+        client.post(f"/posts/{post_id}/like", headers=liker_headers)
+
+    query_counter.clear()
+    response = client.get("/posts", headers=liker_headers)
+    assert response.status_code == 200
+    flags = {post["id"]: post["liked_by_me"] for post in response.json()}
+    assert flags == {post_id: post_id in post_ids[::2] for post_id in post_ids}
+    like_queries = [sql for sql in query_counter if "post_likes" in sql]
+    assert len(like_queries) == 1
 
 
 def test_like_post_not_found(client: TestClient):
@@ -256,6 +317,144 @@ def test_like_post_not_found(client: TestClient):
     assert response.status_code == 404
 
 
+def file_session_factory(tmp_path):
+    """Session factory on a file database, so threads really run concurrently."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'likes.db'}",
+        connect_args={"check_same_thread": False},
+        pool_size=16,
+    )
+    event.listen(engine, "connect", apply_sqlite_pragmas)
+    Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(bind=engine)
+
+
+def test_like_post_concurrent_likes_not_lost(tmp_path):
+    """1000 parallel likes all land (no read-modify-write lost updates)"""
+    engine, SessionFile = file_session_factory(tmp_path)
+    with SessionFile() as db:
+        post = Post(author_id=1, content="Hot post")
+        db.add(post)
+        db.commit()
+        post_id = post.id
+
+    def like(user_id):
+        with SessionFile() as db:
+            user = SimpleNamespace(id=user_id)
+            return like_post(post_id=post_id, current_user=user, db=db).likes_count
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        counts = list(pool.map(like, range(1, 1001)))
+
+    # Every response saw its own increment
+    assert sorted(counts) == list(range(1, 1001))
+    with SessionFile() as db:
+        assert db.get(Post, post_id).likes_count == 1000
+    engine.dispose()
+
+
+def test_like_aggregator_batches_concurrent_likes(tmp_path):
+    """Buffered likes from many threads are written in one batched flush"""
+    engine, SessionFile = file_session_factory(tmp_path)
+    with SessionFile() as db:
+        db.add_all([Post(author_id=1, content="a"), Post(author_id=1, content="b")])
+        db.commit()
+
+    aggregator = LikeAggregator(SessionFile, interval_ms=50)
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(lambda i: aggregator.add(1 + i % 2), range(1000)))
+    assert aggregator.pending(1) == 500
+
+    assert aggregator.flush() == 2
+    assert aggregator.pending(1) == 0
+    with SessionFile() as db:
+        assert db.get(Post, 1).likes_count == 500
+        assert db.get(Post, 2).likes_count == 500
+    engine.dispose()
+
+
+def test_like_aggregator_counts_rows_updated(tmp_path, caplog):
+    """flush() reports rows actually updated, and a failing tick is logged"""
+    engine, SessionFile = file_session_factory(tmp_path)
+    with SessionFile() as db:
+        db.add(Post(author_id=1, content="a"))
+        db.commit()
+
+    aggregator = LikeAggregator(SessionFile, interval_ms=10)
+    aggregator.add(1)
+    aggregator.add(999)  # deleted before the flush
+    assert aggregator.flush() == 1
+
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE posts"))
+    aggregator.add(1)
+    with caplog.at_level("ERROR", logger="utils.likes"):
+        aggregator.start()
+        time.sleep(0.1)
+        aggregator.stop()
+    assert "Flushing buffered likes failed" in caplog.text
+    assert aggregator.pending(1) == 1
+    engine.dispose()
+
+
+def test_like_aggregator_counts_inflight_deltas(tmp_path):
+    """Deltas taken by a flush stay pending until the flush commits"""
+    engine, SessionFile = file_session_factory(tmp_path)
+    with SessionFile() as db:
+        db.add(Post(author_id=1, content="a"))
+        db.commit()
+
+    aggregator = LikeAggregator(SessionFile, interval_ms=10)
+    seen = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record_pending(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("UPDATE posts"):
+            seen.append(aggregator.pending(1))
+
+    aggregator.add(1)
+    aggregator.add(1)
+    assert aggregator.flush() == 1
+    assert seen == [2]
+    assert aggregator.pending(1) == 0
+    with SessionFile() as db:
+        assert db.get(Post, 1).likes_count == 2
+    engine.dispose()
+
+
+def test_like_post_write_behind_returns_projected_count(
+    client: TestClient, db_session, monkeypatch
+):
+    """With write-behind on, the response includes buffered likes"""
+    author_headers = get_user_headers(client, "author@example.com", "author1")
+    create_response = client.post(
+        "/posts",
+        headers=author_headers,
+        json={"content": "Buffered likes"},
+    )
+    post_id = create_response.json()["id"]
+
+    aggregator = LikeAggregator(sessionmaker(bind=db_session.get_bind()), interval_ms=50)
+    monkeypatch.setattr(routes.posts, "like_aggregator", aggregator)
+    monkeypatch.setattr(settings, "LIKE_WRITE_BEHIND", True)
+    for expected, name in enumerate(("liker1", "liker2", "liker3"), start=1):
+        headers = get_user_headers(client, f"{name}@example.com", name)
+        response = client.post(f"/posts/{post_id}/like", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["likes_count"] == expected
+    # A repeat like is not buffered again
+    response = client.post(f"/posts/{post_id}/like", headers=headers)
+    assert response.json()["likes_count"] == 3
+
+    # Nothing is written until the flush
+    stored = client.get(f"/posts/{post_id}", headers=author_headers)
+    assert stored.json()["likes_count"] == 0
+    aggregator.flush()
+    db_session.expire_all()  # the tests share one session across requests
+    stored = client.get(f"/posts/{post_id}", headers=author_headers)
+    assert stored.json()["likes_count"] == 3
+
+
 def test_post_author_information(client: TestClient):
     """Test that post includes author information"""
     headers = get_user_headers(client, "author@example.com", "author1")
@@ -292,3 +491,287 @@ def test_post_timestamps(client: TestClient):
     assert "updated_at" in data
     assert data["created_at"] is not None
     assert data["updated_at"] is not None
+
+
+def test_get_posts_cursor_pagination(client: TestClient):
+    """Test walking the feed with X-Next-Cursor"""
+    headers = get_user_headers(client, "author@example.com", "author1")
+    for i in range(5):
+        client.post("/posts", headers=headers, json={"content": f"Post {i}"})
+
+    first_page = client.get("/posts?limit=2", headers=headers)
+    cursor = first_page.headers["X-Next-Cursor"]
+    second_page = client.get(f"/posts?limit=2&cursor={cursor}", headers=headers)
+    cursor = second_page.headers["X-Next-Cursor"]
+    last_page = client.get(f"/posts?limit=2&cursor={cursor}", headers=headers)
+
+    contents = [
+        post["content"]
+        for page in (first_page, second_page, last_page)
+        for post in page.json()
+    ]
+    assert contents == ["Post 4", "Post 3", "Post 2", "Post 1", "Post 0"]
+    assert "X-Next-Cursor" not in last_page.headers
+
+
+def test_get_posts_cursor_stable_under_new_posts(client: TestClient):
+    """Test that posts created mid-scroll do not shift the next page"""
+    headers = get_user_headers(client, "author@example.com", "author1")
+    for i in range(4):
+        client.post("/posts", headers=headers, json={"content": f"Post {i}"})
+
+    first_page = client.get("/posts?limit=2", headers=headers)
+    client.post("/posts", headers=headers, json={"content": "Breaking news"})
+    cursor = first_page.headers["X-Next-Cursor"]
+    second_page = client.get(f"/posts?limit=2&cursor={cursor}", headers=headers)
+
+    assert [post["content"] for post in second_page.json()] == ["Post 1", "Post 0"]
+
+
+def test_get_posts_invalid_cursor(client: TestClient):
+    """Test that a malformed cursor is rejected"""
+    headers = get_user_headers(client, "author@example.com", "author1")
+    response = client.get("/posts?cursor=not-a-cursor", headers=headers)
+    assert response.status_code == 400
+
+
+def get_user_id(client: TestClient, headers: dict) -> int:
+    return client.get("/profile/me", headers=headers).json()["id"]
+
+
+def create_posts(client: TestClient, headers: dict, *contents: str) -> list[int]:
+    return [
+        client.post("/posts", headers=headers, json={"content": content}).json()["id"]
+        for content in contents
+    ]
+
+
+def test_home_timeline_shows_followed_authors(client: TestClient):
+    """Home feed holds own and followed posts only, newest first"""
+    reader_headers = get_user_headers(client, "reader@example.com", "reader1")
+    followed_headers = get_user_headers(client, "followed@example.com", "followed1")
+    stranger_headers = get_user_headers(client, "stranger@example.com", "stranger1")
+    followed_id = get_user_id(client, followed_headers)
+
+    response = client.post(f"/network/{followed_id}/follow", headers=reader_headers)
+    assert response.status_code == 204
+    # Warm the reader's timeline so later posts arrive by fan-out
+    assert client.get("/posts/home", headers=reader_headers).json() == []
+
+    own = create_posts(client, reader_headers, "mine")
+    followed = create_posts(client, followed_headers, "theirs 1", "theirs 2")
+    create_posts(client, stranger_headers, "unrelated")
+
+    response = client.get("/posts/home", headers=reader_headers)
+    assert response.status_code == 200
+    assert [post["id"] for post in response.json()] == followed[::-1] + own
+
+
+def test_home_timeline_cursor_pagination(client: TestClient):
+    """Pages chain through the X-Next-Cursor header without repeats"""
+    reader_headers = get_user_headers(client, "reader@example.com", "reader1")
+    post_ids = create_posts(client, reader_headers, *(f"Post {i}" for i in range(5)))
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/posts/home", headers=reader_headers, params=params)
+        seen += [post["id"] for post in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert seen == post_ids[::-1]
+
+
+def test_home_timeline_rebuilds_on_cold_start(client: TestClient):
+    """A timeline missing from memory is rebuilt from the database"""
+    reader_headers = get_user_headers(client, "reader@example.com", "reader1")
+    followed_headers = get_user_headers(client, "followed@example.com", "followed1")
+    client.post(
+        f"/network/{get_user_id(client, followed_headers)}/follow",
+        headers=reader_headers,
+    )
+    post_ids = create_posts(client, followed_headers, "one", "two")
+
+    timeline_store.clear()
+    response = client.get("/posts/home", headers=reader_headers)
+    assert [post["id"] for post in response.json()] == post_ids[::-1]
+
+    # Unfollowing drops the timeline, and the rebuild leaves their posts out
+    client.delete(
+        f"/network/{get_user_id(client, followed_headers)}/follow",
+        headers=reader_headers,
+    )
+    assert client.get("/posts/home", headers=reader_headers).json() == []
+
+
+def test_home_timeline_high_fanout_merged_on_read(client: TestClient, monkeypatch):
+    """Posts by authors over the fan-out limit are pulled in at read time"""
+    monkeypatch.setattr(timeline_store, "fanout_limit", 1)
+    star_headers = get_user_headers(client, "star@example.com", "star1")
+    star_id = get_user_id(client, star_headers)
+    fan_headers = [
+        get_user_headers(client, f"fan{i}@example.com", f"fan{i}") for i in range(2)
+    ]
+    for headers in fan_headers:
+        client.post(f"/network/{star_id}/follow", headers=headers)
+        client.get("/posts/home", headers=headers)
+
+    star_posts = create_posts(client, star_headers, "big news")
+    own = create_posts(client, fan_headers[0], "fan reply")
+
+    response = client.get("/posts/home", headers=fan_headers[0], params={"limit": 1})
+    assert [post["id"] for post in response.json()] == own
+    cursor = response.headers["X-Next-Cursor"]
+    response = client.get(
+        "/posts/home", headers=fan_headers[0], params={"limit": 1, "cursor": cursor}
+    )
+    assert [post["id"] for post in response.json()] == star_posts
+    response = client.get("/posts/home", headers=fan_headers[1])
+    assert [post["id"] for post in response.json()] == star_posts
+
+
+def test_follow_user_validation(client: TestClient):
+    """Following yourself or a missing user is rejected"""
+    headers = get_user_headers(client, "reader@example.com", "reader1")
+    user_id = get_user_id(client, headers)
+    assert client.post(f"/network/{user_id}/follow", headers=headers).status_code == 400
+    assert client.post("/network/999999/follow", headers=headers).status_code == 404
+
+
+def test_timeline_store_ring_keeps_newest():
+    """A full ring overwrites its oldest entries"""
+    store = TimelineStore(capacity=3, max_users=1, fanout_limit=10)
+    store.install(1, [10, 11], followees={2}, high_fanout=set())
+    for post_id in (12, 13, 14):
+        store.fan_out(2, post_id, [1])
+
+    entries, _ = store.page(1, None, 10)
+    assert [post_id for _, post_id in entries] == [14, 13, 12]
+    entries, _ = store.page(1, entries[1][0], 10)
+    assert [post_id for _, post_id in entries] == [12]
+
+    # Installing a second user evicts the first (max_users=1)
+    store.install(2, [], followees=set(), high_fanout=set())
+    assert not store.is_warm(1)
+    assert store.page(1, None, 10) is None
+
+
+def test_timeline_store_first_page_expires_after_ttl():
+    """A stale timeline is rebuilt on a first-page read; later pages keep it"""
+    now = [0.0]
+    store = TimelineStore(
+        capacity=5, max_users=10, fanout_limit=10, ttl=60, clock=lambda: now[0]
+    )
+    store.install(1, [10, 11, 12], followees=set(), high_fanout=set())
+    entries, _ = store.page(1, None, 2)
+    now[0] = 60.0
+    assert store.page(1, None, 2) is None
+    entries, _ = store.page(1, entries[-1][0], 2)
+    assert [post_id for _, post_id in entries] == [10]
+
+
+def test_timeline_store_rebuild_keeps_concurrent_fan_out():
+    """A post fanned out while a rebuild queries survives the install"""
+    store = TimelineStore(capacity=5, max_users=10, fanout_limit=10)
+    store.install(1, [10], followees={2}, high_fanout=set())
+    fanned_out = store.begin_rebuild(1)
+    # Committed after the rebuild's snapshot, so its query returned only [10]
+    store.fan_out(2, 11, [1])
+    store.install(1, [10], {2}, set(), fanned_out)
+    store.end_rebuild(1, fanned_out)
+
+    entries, _ = store.page(1, None, 10)
+    assert [post_id for _, post_id in entries] == [11, 10]
+    store.fan_out(2, 12, [1])
+    assert fanned_out == [11]
+
+
+def test_home_timeline_rebuilds_after_invalidation_race(client: TestClient, monkeypatch):
+    """A timeline dropped between the rebuild and the read is rebuilt again"""
+    headers = get_user_headers(client, "reader@example.com", "reader1")
+    own = create_posts(client, headers, "mine")
+    timeline_store.clear()
+
+    page = timeline_store.page
+    misses = iter([True])
+
+    def racing_page(user_id, before_seq, limit):
+        if timeline_store.is_warm(user_id) and next(misses, False):
+            timeline_store.invalidate(user_id)
+        return page(user_id, before_seq, limit)
+
+    monkeypatch.setattr(timeline_store, "page", racing_page)
+    response = client.get("/posts/home", headers=headers)
+    assert response.status_code == 200
+    assert [post["id"] for post in response.json()] == own
+
+
+def test_search_posts_ranked_and_highlighted(client: TestClient):
+    """Search ranks by BM25 and highlights matched terms"""
+    headers = get_user_headers(client, "author@example.com", "author1")
+    strong, weak, _ = create_posts(
+        client,
+        headers,
+        "Python python Python",
+        "Looking for a python developer to join a long running rust project",
+        "Rust only",
+    )
+
+    response = client.get("/posts/search", headers=headers, params={"q": "PYTHON"})
+    assert response.status_code == 200
+    results = response.json()
+    assert [post["id"] for post in results] == [strong, weak]
+    assert results[0]["highlight"] == "<mark>Python</mark> <mark>python</mark> <mark>Python</mark>"
+    assert results[0]["rank"] <= results[1]["rank"]
+
+
+def test_search_posts_highlight_escapes_html(client: TestClient):
+    """Stored markup comes back escaped; only the <mark> tags are HTML"""
+    headers = get_user_headers(client, "author@example.com", "author1")
+    create_posts(client, headers, '<script>alert("hi")</script> & hello <b>world</b>')
+
+    response = client.get("/posts/search", headers=headers, params={"q": "hello"})
+    assert response.json()[0]["highlight"] == (
+        "&lt;script&gt;alert(&quot;hi&quot;)&lt;/script&gt; &amp; "
+        "<mark>hello</mark> &lt;b&gt;world&lt;/b&gt;"
+    )
+
+
+def test_search_posts_tracks_updates_and_deletes(client: TestClient):
+    """The FTS index follows post edits and deletions"""
+    headers = get_user_headers(client, "author@example.com", "author1")
+    (post_id,) = create_posts(client, headers, "Original wording")
+
+    def search(q):
+        response = client.get("/posts/search", headers=headers, params={"q": q})
+        return [post["id"] for post in response.json()]
+
+    assert search("original") == [post_id]
+    client.put(f"/posts/{post_id}", headers=headers, json={"content": "Edited text"})
+    assert search("original") == []
+    assert search("edited") == [post_id]
+    client.delete(f"/posts/{post_id}", headers=headers)
+    assert search("edited") == []
+
+
+def test_search_posts_cursor_and_syntax(client: TestClient):
+    """Search pages through X-Next-Cursor and tolerates FTS syntax in q"""
+    headers = get_user_headers(client, "author@example.com", "author1")
+    post_ids = create_posts(client, headers, *(f"hiring {i}" for i in range(5)))
+
+    seen = []
+    params = {"q": "hiring", "limit": 2}
+    while True:
+        response = client.get("/posts/search", headers=headers, params=params)
+        seen += [post["id"] for post in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        params = {**params, "cursor": cursor}
+    assert sorted(seen) == post_ids
+
+    for q in ('"unbalanced', "hiring AND", "NEAR(", "***"):
+        response = client.get("/posts/search", headers=headers, params={"q": q})
+        assert response.status_code == 200
@@ -91,3 +91,38 @@ def test_toggle_mode_unauthenticated(client: TestClient):
     response = client.post("/profile/mode", json={"mode": "builder"})
     assert response.status_code == 403
     assert response.json()["detail"] == "Not authenticated"
+
+
+def test_get_my_profile_served_from_cache(client: TestClient, query_counter: list):
+    headers = get_auth_headers(client)
+    client.get("/profile/me", headers=headers)  # warm the principal cache
+
+    query_counter.clear()
+    response = client.get("/profile/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["username"] == "profileuser"
+    assert query_counter == []
+
+
+def test_update_profile_invalidates_cache(client: TestClient):
+    headers = get_auth_headers(client)
+    client.get("/profile/me", headers=headers)  # warm the principal cache
+
+    client.put("/profile/me", headers=headers, json={"bio": "Fresh bio"})
+    response = client.get("/profile/me", headers=headers)
+    assert response.json()["bio"] == "Fresh bio"
+
+
+def test_toggle_mode_invalidates_cache(client: TestClient):
+    headers = get_auth_headers(client)
+    client.get("/profile/me", headers=headers)  # warm the principal cache
+
+    client.post("/profile/mode", headers=headers, json={"mode": "builder"})
+    response = client.get("/profile/me", headers=headers)
+    assert response.json()["mode"] == "builder"
+
+    # A second write starting from the cached snapshot must still persist
+    client.put("/profile/me", headers=headers, json={"bio": "Builder bio"})
+    response = client.get("/profile/me", headers=headers)
+    assert response.json()["mode"] == "builder"
+    assert response.json()["bio"] == "Builder bio"
@@ -1,9 +1,22 @@
 from utils.auth import verify_password, get_password_hash, create_access_token
-from utils.dependencies import get_current_user
+from utils.hashing import HashingPoolBusy, hash_password_async, verify_password_async
 
 __all__ = [
     "verify_password",
     "get_password_hash",
     "create_access_token",
     "get_current_user",
+    "HashingPoolBusy",
+    "hash_password_async",
+    "verify_password_async",
 ]
+
+
+def __getattr__(name: str):
+    # utils.dependencies imports database, which imports utils.pool_metrics;
+    # loading it on first use keeps that from being a circular import
+    if name == "get_current_user":
+        from utils.dependencies import get_current_user
+
+        return get_current_user
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
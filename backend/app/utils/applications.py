@@ -0,0 +1,110 @@
+from fastapi import HTTPException
+from sqlalchemy import case, delete, func, insert, literal, select, update
+from sqlalchemy.orm import Session, joinedload
+from models.application import Application  # type: ignore
+from models.opportunity import Opportunity  # type: ignore
+from schemas.application import (  # type: ignore
+    ApplicantSummary,
+    ApplicationDetail,
+    ApplicationResponse,
+)
+
+APPLICATION_EXPANSIONS = ("applicant",)
+DECISION_STATUSES = ("accepted", "rejected")
+
+
+def insert_application(opportunity_id: int, applicant_id: int, message: str):
+    """Single-statement apply: INSERT ... SELECT ... RETURNING.
+
+    The SELECT from opportunities makes the insert a no-op (no row
+    returned) when the opportunity does not exist, and the unique
+    (opportunity_id, applicant_id) index raises IntegrityError for a repeat
+    application, so neither needs a separate lookup or a race-prone
+    check-then-insert.
+    """
+    return (
+        insert(Application)
+        .from_select(
+            ["opportunity_id", "applicant_id", "message"],
+            select(Opportunity.id, literal(applicant_id), literal(message)).where(
+                Opportunity.id == opportunity_id
+            ),
+        )
+        .returning(Application)
+    )
+
+
+def set_application_statuses(opportunity_id: int, ids: list[int], new_status: str):
+    """One UPDATE for every listed application of an opportunity, returning
+    the ids it changed; ids from other opportunities are left alone"""
+    return (
+        update(Application)
+        .where(Application.opportunity_id == opportunity_id, Application.id.in_(ids))
+        .values(status=new_status)
+        .returning(Application.id)
+    )
+
+
+def parse_expand(expand: str | None) -> set[str]:
+    """Split a ``?expand=applicant`` query value, rejecting unknown names"""
+    names = {name.strip() for name in expand.split(",") if name.strip()} if expand else set()
+    unknown = names - set(APPLICATION_EXPANSIONS)
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Cannot expand {', '.join(sorted(unknown))}"
+        )
+    return names
+
+
+def application_options(expand: set[str]) -> list:
+    """Loader options so expanded relationships arrive with the applications.
+
+    Applicant is many-to-one, so it is joined into the same SELECT: the
+    whole list costs one query however many applications there are.
+    """
+    return [joinedload(Application.applicant)] if "applicant" in expand else []
+
+
+def application_details(applications, expand: set[str]) -> list[ApplicationDetail]:
+    """Response models for ``applications``; ``applicant`` is only set when expanded"""
+    details = []
+    for application in applications:
+        fields = ApplicationResponse.model_validate(application).model_dump()
+        if "applicant" in expand:
+            applicant = application.applicant
+            fields["applicant"] = (
+                ApplicantSummary.model_validate(applicant) if applicant is not None else None
+            )
+        details.append(ApplicationDetail(**fields))
+    return details
+
+
+def dedupe_applications(db: Session) -> int:
+    """Delete repeat applications by one applicant to one opportunity, left
+    by databases from before the unique index. Per pair, an accepted row is
+    kept over a rejected one over a pending one, then the earliest.
+
+    Returns how many rows were deleted; the caller commits.
+    """
+    decided_first = case(
+        {status: rank for rank, status in enumerate(DECISION_STATUSES)},
+        value=Application.status,
+        else_=len(DECISION_STATUSES),
+    )
+    ranked = select(
+        Application.id,
+        func.row_number()
+        .over(
+            partition_by=(Application.opportunity_id, Application.applicant_id),
+            order_by=(decided_first, Application.id),
+        )
+        .label("position"),
+    ).where(
+        Application.opportunity_id.isnot(None), Application.applicant_id.isnot(None)
+    ).subquery()
+    result = db.execute(
+        delete(Application)
+        .where(Application.id.in_(select(ranked.c.id).where(ranked.c.position > 1)))
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
@@ -1,11 +1,16 @@
+import hashlib
 from passlib.context import CryptContext  # type: ignore
 from datetime import datetime, timedelta, timezone
 from jose import jwt, JWTError  # type: ignore
 from config import settings  # type: ignore
+from utils.cache import TTLCache  # type: ignore
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Verified token payloads, keyed by a digest of the raw token
+token_cache = TTLCache(maxsize=settings.TOKEN_CACHE_SIZE)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash"""
@@ -47,3 +52,16 @@ def decode_access_token(token: str) -> dict | None:
     except JWTError as e:
         print(f"JWT decode error: {e}")  # Debug output
         return None
+
+
+def decode_access_token_cached(token: str) -> dict | None:
+    """Decode a JWT access token, reusing a previous verification if cached"""
+    key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(key)
+    if payload is not None:
+        return payload
+
+    payload = decode_access_token(token)
+    if payload is not None and "exp" in payload:
+        token_cache.set(key, payload, expires_at=payload["exp"])
+    return payload
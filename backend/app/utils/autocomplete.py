@@ -0,0 +1,185 @@
+import bisect
+import heapq
+import threading
+import time
+from collections import Counter
+from typing import Callable, NamedTuple
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from config import settings  # type: ignore
+from models.user import User  # type: ignore
+from utils.skills import json_names, normalize_skills  # type: ignore
+
+
+# Short prefixes match a large slice of the skills, so their ranking is
+# cached (up to the route's maximum limit) until one of their skills changes
+CACHED_PREFIX_LENGTH = 2
+CACHED_SKILLS = 50
+
+
+class UserSuggestion(NamedTuple):
+    id: int
+    username: str
+    full_name: str | None
+    profile_image: str | None
+    mode: str | None
+
+
+class SkillSuggestion(NamedTuple):
+    name: str
+    users: int  # how many profiles list the skill
+
+
+def _name_keys(username: str, full_name: str | None) -> set[str]:
+    """Lowercased keys a user can be found by: username, full name and each name word"""
+    keys = {username.lower()}
+    if full_name:
+        keys.add(full_name.lower())
+        keys.update(full_name.lower().split())
+    return keys
+
+
+def _prefix_range(entries: list, prefix: str) -> range:
+    """Positions of sorted ``entries`` whose key starts with ``prefix``"""
+    low = bisect.bisect_left(entries, (prefix,))
+    # \U0010ffff sorts after every character a key can continue with
+    high = bisect.bisect_left(entries, (prefix + "\U0010ffff",), low)
+    return range(low, high)
+
+
+class AutocompleteIndex:
+    """Sorted-array prefix index over user names and profile skills.
+
+    Users live in one sorted list of ``(key, user_id)`` pairs and skills in
+    a sorted list of names, so a prefix lookup is two bisects plus a walk
+    over the matching slice; nothing touches the database. Built at startup
+    (or on first use) and kept current by signup and profile edits.
+
+    Like the other caches this is per process, so those edits reach only the
+    worker that served them. ``loaded`` turns False ``ttl`` seconds after a
+    load and the next lookup reloads.
+    """
+
+    def __init__(self, ttl: float | None = None, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.clock = clock
+        self._loaded_at = 0.0
+        self._lock = threading.RLock()
+        self.clear()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the index is built and not older than ``ttl``"""
+        return self._loaded and (self.ttl is None or self.clock() - self._loaded_at < self.ttl)
+
+    def clear(self) -> None:
+        """Forget everything; the next request reloads from the database"""
+        with self._lock:
+            self._user_entries: list[tuple[str, int]] = []
+            self._users: dict[int, UserSuggestion] = {}
+            self._user_keys: dict[int, set[str]] = {}
+            self._user_skills: dict[int, list[str]] = {}
+            self._skills: list[tuple[str]] = []
+            self._skill_counts: Counter = Counter()
+            self._top_skills: dict[str, list[str]] = {}
+            self._loaded = False
+
+    def load(self, db: Session) -> None:
+        """Build the index from every active user"""
+        started = self.clock()
+        rows = db.execute(
+            select(
+                User.id,
+                User.username,
+                User.full_name,
+                User.profile_image,
+                User.mode,
+                User.skills,
+            ).where(User.is_active)
+        ).all()
+        with self._lock:
+            self.clear()
+            for row in rows:
+                suggestion = UserSuggestion(
+                    row.id, row.username, row.full_name, row.profile_image, row.mode
+                )
+                self._users[row.id] = suggestion
+                self._user_keys[row.id] = _name_keys(row.username, row.full_name)
+                self._user_skills[row.id] = normalize_skills(json_names(row.skills))
+                self._user_entries.extend((key, row.id) for key in self._user_keys[row.id])
+                self._skill_counts.update(self._user_skills[row.id])
+            self._user_entries.sort()
+            self._skills = sorted((name,) for name in self._skill_counts)
+            self._loaded = True
+            self._loaded_at = started
+
+    def upsert(self, user) -> None:
+        """Re-index a user after signup or a profile edit"""
+        with self._lock:
+            if not self._loaded:
+                return  # picked up by the first load
+            keys = _name_keys(user.username, user.full_name)
+            old_keys = self._user_keys.get(user.id, set())
+            for key in old_keys - keys:
+                position = bisect.bisect_left(self._user_entries, (key, user.id))
+                del self._user_entries[position]
+            for key in keys - old_keys:
+                bisect.insort(self._user_entries, (key, user.id))
+            self._user_keys[user.id] = keys
+            self._users[user.id] = UserSuggestion(
+                user.id, user.username, user.full_name, user.profile_image, user.mode
+            )
+
+            skills = normalize_skills(json_names(user.skills))
+            old_skills = self._user_skills.get(user.id, [])
+            self._skill_counts.subtract(old_skills)
+            self._skill_counts.update(skills)
+            self._user_skills[user.id] = skills
+            for name in set(old_skills) ^ set(skills):
+                for length in range(1, CACHED_PREFIX_LENGTH + 1):
+                    self._top_skills.pop(name[:length], None)
+            for name in set(old_skills) - set(skills):
+                if self._skill_counts[name] <= 0:
+                    del self._skill_counts[name]
+                    del self._skills[bisect.bisect_left(self._skills, (name,))]
+            for name in set(skills) - set(old_skills):
+                if self._skill_counts[name] == 1:
+                    bisect.insort(self._skills, (name,))
+
+    def suggest(
+        self, prefix: str, limit: int, exclude_user: int | None = None
+    ) -> tuple[list[UserSuggestion], list[SkillSuggestion]]:
+        """Users whose name starts with ``prefix`` (in key order) and the most
+        popular skills starting with it"""
+        prefix = prefix.strip().lower()
+        users: list[UserSuggestion] = []
+        if not prefix:
+            return users, []
+        with self._lock:
+            seen = set()
+            for position in _prefix_range(self._user_entries, prefix):
+                user_id = self._user_entries[position][1]
+                if user_id in seen or user_id == exclude_user:
+                    continue
+                seen.add(user_id)
+                users.append(self._users[user_id])
+                if len(users) == limit:
+                    break
+
+            if len(prefix) > CACHED_PREFIX_LENGTH:
+                names = self._rank_skills(prefix, limit)
+            else:
+                names = self._top_skills.get(prefix)
+                if names is None:
+                    names = self._top_skills[prefix] = self._rank_skills(prefix, CACHED_SKILLS)
+            skills = [SkillSuggestion(name, self._skill_counts[name]) for name in names[:limit]]
+        return users, skills
+
+    def _rank_skills(self, prefix: str, limit: int) -> list[str]:
+        """The ``limit`` most listed skills starting with ``prefix``, ties by name"""
+        counts = self._skill_counts
+        names = (self._skills[position][0] for position in _prefix_range(self._skills, prefix))
+        return heapq.nsmallest(limit, names, key=lambda name: (-counts[name], name))
+
+
+autocomplete_index = AutocompleteIndex(ttl=settings.AUTOCOMPLETE_INDEX_TTL_SECONDS or None)
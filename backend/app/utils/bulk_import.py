@@ -0,0 +1,289 @@
+import codecs
+import csv
+import json
+from typing import Callable, Iterable, Iterator, NamedTuple
+import anyio.from_thread
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from models.opportunity import Opportunity  # type: ignore
+from models.skill import opportunity_skills  # type: ignore
+from models.user import User  # type: ignore
+from schemas.opportunity import OpportunityCreate  # type: ignore
+from schemas.user import UserCreate  # type: ignore
+from utils.auth import get_password_hash  # type: ignore
+from utils.autocomplete import autocomplete_index  # type: ignore
+from utils.dashboard import summary_cache  # type: ignore
+from utils.recommendations import recommendation_index  # type: ignore
+from utils.similarity import user_similarity_index  # type: ignore
+from utils.skills import json_names, normalize_skills, skill_ids  # type: ignore
+
+# Request Content-Type -> parser, and the same by file extension for the CLI
+IMPORT_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/x-ndjson": "jsonl",
+    "application/jsonl": "jsonl",
+}
+IMPORT_EXTENSIONS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+# CSV cells holding a list, as a JSON array or comma-separated text
+LIST_FIELDS = ("required_skills",)
+
+
+class RowError(NamedTuple):
+    line: int
+    error: str
+
+
+class ImportReport:
+    """Running totals of an import; only the first ``max_errors`` failures are
+    kept so a bad file cannot grow the report without bound"""
+
+    def __init__(self, max_errors: int):
+        self.imported = 0
+        self.failed = 0
+        self.errors: list[RowError] = []
+        self._max_errors = max_errors
+
+    def fail(self, line: int, error: str) -> None:
+        self.failed += 1
+        if len(self.errors) < self._max_errors:
+            self.errors.append(RowError(line, error))
+
+
+def import_format(content_type: str | None) -> str | None:
+    """Parser name for a Content-Type header, ignoring parameters such as charset"""
+    return IMPORT_CONTENT_TYPES.get((content_type or "").split(";")[0].strip().lower())
+
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Decode UTF-8 byte chunks into lines (newline kept) without buffering
+    more than one line"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    for chunk in chunks:
+        pending += decoder.decode(chunk)
+        lines = pending.splitlines(keepends=True)
+        pending = lines.pop() if lines and not lines[-1].endswith(("\n", "\r")) else ""
+        yield from lines
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def request_lines(request) -> Iterator[str]:
+    """Lines of a request body, for an import running in a worker thread.
+
+    Each chunk is pulled from the event loop only when the parser needs it,
+    so the body is never held in memory or spooled to disk.
+    """
+    stream = request.stream()
+
+    async def next_chunk() -> bytes | None:
+        return await anext(stream, None)
+
+    def chunks() -> Iterator[bytes]:
+        while (chunk := anyio.from_thread.run(next_chunk)) is not None:
+            yield chunk
+
+    return iter_lines(chunks())
+
+
+def parse_rows(lines: Iterable[str], fmt: str) -> Iterator[tuple[int, dict | str]]:
+    """``(line number, row)`` pairs, or ``(line number, error)`` for a row that
+    cannot be parsed. Blank lines are skipped."""
+    if fmt == "csv":
+        reader = csv.DictReader(lines)
+        for row in reader:
+            if None in row:
+                yield reader.line_num, "more values than header columns"
+                continue
+            # Empty cells mean "not given", so optional fields keep their defaults
+            values = {name: value for name, value in row.items() if value not in ("", None)}
+            for name in LIST_FIELDS:
+                if name in values:
+                    values[name] = [item for item in json_names(values[name]) if item]
+            yield reader.line_num, values
+        return
+
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            yield number, f"invalid JSON: {exc}"
+            continue
+        yield number, row if isinstance(row, dict) else "expected a JSON object"
+
+
+def describe(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        for error in exc.errors()
+    )
+
+
+class OpportunityImport:
+    """Opportunities owned by one creator, with their skill rows"""
+
+    schema = OpportunityCreate
+
+    def __init__(self, creator_id: int):
+        self.creator_id = creator_id
+
+    def values(self, data: OpportunityCreate) -> dict:
+        return {
+            "title": data.title,
+            "description": data.description,
+            "required_skills": json.dumps(data.required_skills)
+            if data.required_skills
+            else None,
+            "bounty_amount": data.bounty_amount,
+            "deadline": data.deadline,
+            "creator_id": self.creator_id,
+        }
+
+    def check(self, db: Session, rows: list, report: ImportReport) -> list:
+        return rows
+
+    def insert(self, db: Session, values: list[dict]) -> None:
+        # Core table insert: the ORM bulk path splits rows with differing NULL
+        # columns into separate statements
+        table = Opportunity.__table__
+        ids = db.scalars(
+            insert(table).returning(table.c.id, sort_by_parameter_order=True), values
+        ).all()
+        names = {
+            opportunity_id: normalize_skills(json_names(row["required_skills"]))
+            for opportunity_id, row in zip(ids, values)
+        }
+        wanted = normalize_skills(name for skills in names.values() for name in skills)
+        known = dict(zip(wanted, skill_ids(db, wanted)))
+        links = [
+            {"opportunity_id": opportunity_id, "skill_id": known[name]}
+            for opportunity_id, skills in names.items()
+            for name in skills
+        ]
+        if links:
+            db.execute(insert(opportunity_skills), links)
+
+    def finish(self) -> None:
+        # Reloaded on next use; cheaper than upserting a large import row by row
+        recommendation_index.clear()
+        summary_cache.invalidate_creator(self.creator_id)
+
+
+class UserImport:
+    """User accounts; bcrypt dominates, so ``hash_passwords`` may fan a chunk's
+    passwords out to worker processes"""
+
+    schema = UserCreate
+
+    def __init__(self, hash_passwords: Callable[[list[str]], list[str]] | None = None):
+        self.hash_passwords = hash_passwords or (
+            lambda passwords: [get_password_hash(password) for password in passwords]
+        )
+
+    def values(self, data: UserCreate) -> dict:
+        return {
+            "email": data.email,
+            "username": data.username,
+            "hashed_password": data.password,  # hashed per chunk, after check()
+            "full_name": data.full_name,
+        }
+
+    def check(self, db: Session, rows: list, report: ImportReport) -> list:
+        """Reject emails and usernames already taken (earlier chunks are
+        committed, so this covers the whole file) and hash the rest"""
+        emails = set(
+            db.scalars(select(User.email).where(User.email.in_([v["email"] for _, v in rows])))
+        )
+        usernames = set(
+            db.scalars(
+                select(User.username).where(User.username.in_([v["username"] for _, v in rows]))
+            )
+        )
+        accepted = []
+        for line, values in rows:
+            if values["email"] in emails:
+                report.fail(line, "Email already registered")
+            elif values["username"] in usernames:
+                report.fail(line, "Username already taken")
+            else:
+                emails.add(values["email"])
+                usernames.add(values["username"])
+                accepted.append((line, values))
+        hashes = self.hash_passwords([values["hashed_password"] for _, values in accepted])
+        for (_, values), hashed in zip(accepted, hashes):
+            values["hashed_password"] = hashed
+        return accepted
+
+    def insert(self, db: Session, values: list[dict]) -> None:
+        db.execute(insert(User.__table__), values)
+
+    def finish(self) -> None:
+        autocomplete_index.clear()
+        user_similarity_index.clear()
+
+
+def _flush(db: Session, importer, rows: list, report: ImportReport) -> None:
+    """Insert one chunk in one transaction. If the chunk hits a constraint
+    (say, a concurrent signup took an email), retry it row by row so only
+    the offending rows fail."""
+    rows = importer.check(db, rows, report)
+    if not rows:
+        return
+    try:
+        importer.insert(db, [values for _, values in rows])
+        db.commit()
+        report.imported += len(rows)
+        return
+    except IntegrityError:
+        db.rollback()
+    for line, values in rows:
+        try:
+            with db.begin_nested():
+                importer.insert(db, [values])
+            report.imported += 1
+        except IntegrityError as exc:
+            report.fail(line, f"conflicts with an existing row: {exc.orig}")
+    db.commit()
+
+
+def run_import(
+    db: Session,
+    rows: Iterable[tuple[int, dict | str]],
+    importer,
+    chunk_size: int,
+    max_errors: int,
+) -> ImportReport:
+    """Validate parsed rows with the importer's schema and insert them in
+    chunks of ``chunk_size``, one executemany transaction per chunk.
+
+    Invalid rows are reported and skipped; the rest of the file still loads.
+    Memory stays at one chunk however large the input is.
+    """
+    report = ImportReport(max_errors)
+    chunk: list[tuple[int, dict]] = []
+    for line, row in rows:
+        if isinstance(row, str):
+            report.fail(line, row)
+            continue
+        try:
+            data: BaseModel = importer.schema.model_validate(row)
+        except ValidationError as exc:
+            report.fail(line, describe(exc))
+            continue
+        chunk.append((line, importer.values(data)))
+        if len(chunk) >= chunk_size:
+            _flush(db, importer, chunk, report)
+            chunk = []
+    if chunk:
+        _flush(db, importer, chunk, report)
+    if report.imported:
+        importer.finish()
+    # Duplicates are only found when their chunk is flushed
+    report.errors.sort()
+    return report
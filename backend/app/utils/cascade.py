@@ -0,0 +1,76 @@
+from typing import Iterable
+from sqlalchemy import delete, exists, or_, select, tuple_
+from sqlalchemy.orm import Session
+from models.application import Application  # type: ignore
+from models.comment import Comment  # type: ignore
+from models.opportunity import Opportunity  # type: ignore
+from models.post import Post, PostLike  # type: ignore
+from models.skill import opportunity_skills  # type: ignore
+
+# (child table, its parent key column, the parent's id column). Deletes go
+# child-first with one statement per table, so they never depend on SQLite's
+# foreign_keys PRAGMA or load child rows into the session.
+OPPORTUNITY_CHILDREN = (
+    (Application.__table__, Application.opportunity_id, Opportunity.id),
+    (opportunity_skills, opportunity_skills.c.opportunity_id, Opportunity.id),
+)
+POST_CHILDREN = (
+    (PostLike.__table__, PostLike.post_id, Post.id),
+    (Comment.__table__, Comment.post_id, Post.id),
+)
+
+
+def _delete_cascade(db: Session, parent, children, ids: Iterable[int]) -> int:
+    ids = list(ids)
+    if not ids:
+        return 0
+    for table, parent_key, _ in children:
+        db.execute(delete(table).where(parent_key.in_(ids)))
+    result = db.execute(
+        delete(parent).where(parent.id.in_(ids)).execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def delete_opportunities(db: Session, ids: Iterable[int]) -> int:
+    """Delete opportunities with their applications and skill rows; returns how
+    many opportunities were deleted. The caller commits."""
+    return _delete_cascade(db, Opportunity, OPPORTUNITY_CHILDREN, ids)
+
+
+def delete_posts(db: Session, ids: Iterable[int]) -> int:
+    """Delete posts with their likes and comments; returns how many posts were
+    deleted. The caller commits."""
+    return _delete_cascade(db, Post, POST_CHILDREN, ids)
+
+
+def _purge_table(db: Session, table, parent_key, parent_id, batch_size: int) -> int:
+    """Delete rows of ``table`` whose parent is gone (or whose key was nulled),
+    ``batch_size`` rows per transaction, walking the primary key"""
+    key = list(table.primary_key.columns)
+    identity = tuple_(*key) if len(key) > 1 else key[0]
+    orphaned = or_(parent_key.is_(None), ~exists().where(parent_id == parent_key))
+    purged = 0
+    last = None
+    while True:
+        query = select(*key).where(orphaned).order_by(*key).limit(batch_size)
+        if last is not None:
+            query = query.where(identity > (tuple_(*last) if len(key) > 1 else last[0]))
+        rows = [tuple(row) for row in db.execute(query)]
+        if not rows:
+            return purged
+        values = rows if len(key) > 1 else [row[0] for row in rows]
+        purged += db.execute(delete(table).where(identity.in_(values))).rowcount
+        db.commit()
+        last = rows[-1]
+
+
+def purge_orphans(db: Session, batch_size: int = 1000) -> dict[str, int]:
+    """Delete child rows left behind by parents deleted without their children.
+
+    Safe to re-run. Returns the number of rows purged per table.
+    """
+    return {
+        table.name: _purge_table(db, table, parent_key, parent_id, batch_size)
+        for table, parent_key, parent_id in OPPORTUNITY_CHILDREN + POST_CHILDREN
+    }
@@ -0,0 +1,95 @@
+import logging
+import threading
+from sqlalchemy import func, select, update
+from config import settings  # type: ignore
+from database import SessionLocal  # type: ignore
+from models.comment import Comment  # type: ignore
+from models.post import Post  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+
+def change_comments_count(post_id: int, delta: int):
+    """UPDATE bumping a post's comments_count, for the comment's transaction"""
+    return (
+        update(Post)
+        .where(Post.id == post_id)
+        .values(comments_count=Post.comments_count + delta)
+    )
+
+
+def reconcile_comment_counts(session_factory, batch_size: int) -> int:
+    """Reset comments_count to the real count wherever it has drifted.
+
+    Posts are walked in id ranges of ``batch_size``; each range is one
+    correlated UPDATE in its own short transaction, so writers are never
+    blocked for long and a concurrent comment cannot be overwritten by a
+    stale count. Returns the number of posts fixed.
+    """
+    actual = (
+        select(func.count(Comment.id))
+        .where(Comment.post_id == Post.id)
+        .correlate(Post)
+        .scalar_subquery()
+    )
+    fixed = 0
+    with session_factory() as db:
+        max_id = db.scalar(select(func.max(Post.id))) or 0
+        for low in range(1, max_id + 1, batch_size):
+            result = db.execute(
+                update(Post)
+                .where(
+                    Post.id.between(low, low + batch_size - 1),
+                    func.coalesce(Post.comments_count, -1) != actual,
+                )
+                .values(comments_count=actual)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            fixed += result.rowcount
+    return fixed
+
+
+class CommentCountReconciler:
+    """Runs reconcile_comment_counts every ``interval_seconds`` on a thread"""
+
+    def __init__(self, session_factory, interval_seconds: int, batch_size: int):
+        self.session_factory = session_factory
+        self.interval = interval_seconds
+        self.batch_size = batch_size
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self) -> int:
+        fixed = reconcile_comment_counts(self.session_factory, self.batch_size)
+        if fixed:
+            logger.warning("Reconciled comments_count on %d posts", fixed)
+        return fixed
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("comments_count reconciliation failed")
+
+    def start(self) -> None:
+        if self._thread is None and self.interval > 0:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="comment-reconcile", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+
+comment_reconciler = CommentCountReconciler(
+    SessionLocal,
+    interval_seconds=settings.COMMENT_RECONCILE_INTERVAL_SECONDS,
+    batch_size=settings.COMMENT_RECONCILE_BATCH_SIZE,
+)
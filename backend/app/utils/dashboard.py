@@ -0,0 +1,108 @@
+import threading
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from config import settings  # type: ignore
+from models.application import Application  # type: ignore
+from models.opportunity import Opportunity  # type: ignore
+from utils.cache import TTLCache  # type: ignore
+
+SUMMARY_STATUSES = ("pending", "accepted", "rejected")
+
+
+def summary_query(creator_id: int):
+    """A creator's opportunities, newest first, with application counts per status.
+
+    One LEFT JOIN ... GROUP BY; the counts come from the (opportunity_id,
+    status) index without reading application rows.
+    """
+    counts = [
+        func.count(Application.id).filter(Application.status == name).label(name)
+        for name in SUMMARY_STATUSES
+    ]
+    return (
+        select(
+            Opportunity.id,
+            Opportunity.title,
+            Opportunity.status,
+            Opportunity.created_at,
+            *counts,
+            func.count(Application.id).label("total"),
+        )
+        .outerjoin(Application, Application.opportunity_id == Opportunity.id)
+        .where(Opportunity.creator_id == creator_id)
+        .group_by(Opportunity.id)
+        .order_by(Opportunity.created_at.desc(), Opportunity.id.desc())
+    )
+
+
+class CreatorSummaryCache:
+    """Per-creator dashboard summaries.
+
+    Applies and status changes only know the opportunity, so the cache also
+    remembers which creator each cached opportunity belongs to and can be
+    invalidated by either. An apply racing a creator's first load can leave
+    that summary stale for at most the TTL. The opportunity map only holds
+    creators whose summary is cached; entries left by summaries the TTLCache
+    evicted or expired are pruned once they outnumber ``maxsize``.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._summaries = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._creators: dict[int, int] = {}  # opportunity id -> creator id
+        self._opportunities: dict[int, list[int]] = {}  # creator id -> opportunity ids
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, creator_id: int) -> list[dict]:
+        """The creator's summary, from the cache or one GROUP BY query"""
+        cached = self._summaries.get(creator_id)
+        if cached is not None:
+            return cached
+
+        generation = self._summaries.generation
+        rows = [row._asdict() for row in db.execute(summary_query(creator_id))]
+        with self._lock:
+            self._forget(creator_id)
+            self._opportunities[creator_id] = [row["id"] for row in rows]
+            for row in rows:
+                self._creators[row["id"]] = creator_id
+        self._summaries.set(creator_id, rows, generation=generation)
+        if len(self._opportunities) > self._summaries.maxsize:
+            self._prune()
+        return rows
+
+    def _forget(self, creator_id: int) -> None:
+        """Drop a creator's opportunity entries; the caller holds the lock"""
+        for opportunity_id in self._opportunities.pop(creator_id, ()):
+            if self._creators.get(opportunity_id) == creator_id:
+                del self._creators[opportunity_id]
+
+    def _prune(self) -> None:
+        with self._lock:
+            for creator_id in list(self._opportunities):
+                if creator_id not in self._summaries:
+                    self._forget(creator_id)
+
+    def invalidate_creator(self, creator_id: int) -> None:
+        with self._lock:
+            self._forget(creator_id)
+        self._summaries.delete(creator_id)
+
+    def invalidate_opportunity(self, opportunity_id: int) -> None:
+        """Drop the summary that counts this opportunity's applications, if cached"""
+        with self._lock:
+            creator_id = self._creators.get(opportunity_id)
+            if creator_id is not None:
+                self._forget(creator_id)
+        if creator_id is not None:
+            self._summaries.delete(creator_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._creators.clear()
+            self._opportunities.clear()
+        self._summaries.clear()
+
+
+summary_cache = CreatorSummaryCache(
+    maxsize=settings.SUMMARY_CACHE_SIZE, ttl=settings.SUMMARY_CACHE_TTL_SECONDS
+)
@@ -1,20 +1,48 @@
+from types import MappingProxyType
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from database import get_db  # type: ignore
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+from config import settings  # type: ignore
+from database import get_async_db, get_db  # type: ignore
 from models.user import User  # type: ignore
-from utils.auth import decode_access_token  # type: ignore
+from utils.auth import decode_access_token_cached  # type: ignore
+from utils.cache import TTLCache  # type: ignore
 
 security = HTTPBearer()
 
+# Read-only column state of authenticated users, keyed by user id. The
+# cache is per process: invalidate_principal only clears this worker, so
+# other workers may serve a principal up to PRINCIPAL_CACHE_TTL_SECONDS old.
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE, ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-) -> User:
-    """Get the current authenticated user"""
+
+def _principal_state(user: User) -> MappingProxyType:
+    """A user's column values, frozen for the cache"""
+    return MappingProxyType(
+        {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+    )
+
+
+def _principal(state: MappingProxyType) -> User:
+    """A fresh detached User for one request, so handlers never share (or
+    mutate) the cached state"""
+    user = User(**state)
+    make_transient_to_detached(user)
+    return user
+
+
+def invalidate_principal(user_id: int) -> None:
+    """Drop a cached user so this process's next request reloads it"""
+    principal_cache.delete(user_id)
+
+
+def _user_id_from_credentials(credentials: HTTPAuthorizationCredentials) -> int:
     token = credentials.credentials
-    payload = decode_access_token(token)
+    payload = decode_access_token_cached(token)
 
     if payload is None:
         raise HTTPException(
@@ -28,11 +56,56 @@ def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token: no user ID",
         )
+    return user_id
+
 
+def _user_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
+    )
+
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db),
+) -> User:
+    """Get the current authenticated user.
+
+    Cache hits return a new detached copy per request: column attributes
+    are readable, relationships are not, and it is not attached to ``db``.
+    Routes that modify the user must load it through the session and call
+    ``invalidate_principal`` afterwards.
+    """
+    user_id = _user_id_from_credentials(credentials)
+
+    cached = principal_cache.get(user_id)
+    if cached is not None:
+        return _principal(cached)
+
+    generation = principal_cache.generation
     user = db.query(User).filter(User.id == user_id).first()
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
-        )
+        raise _user_not_found()
+
+    principal_cache.set(user_id, _principal_state(user), generation=generation)
+    return user
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    """Get the current authenticated user through the async session"""
+    user_id = _user_id_from_credentials(credentials)
+
+    cached = principal_cache.get(user_id)
+    if cached is not None:
+        return _principal(cached)
+
+    generation = principal_cache.generation
+    user = await db.scalar(select(User).where(User.id == user_id))
+    if user is None:
+        raise _user_not_found()
 
+    principal_cache.set(user_id, _principal_state(user), generation=generation)
     return user
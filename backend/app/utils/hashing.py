@@ -0,0 +1,83 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from config import settings  # type: ignore
+from utils.auth import get_password_hash, verify_password  # type: ignore
+
+
+class HashingPoolBusy(Exception):
+    """Raised when the password hashing queue is full"""
+
+
+class PasswordHashingPool:
+    """Bounded executor for bcrypt work.
+
+    bcrypt is deliberately slow and holds the GIL for most of each call, so
+    running it on the request threadpool stalls unrelated endpoints during a
+    login storm. Work is handed to worker processes instead, and at most
+    ``max_workers + max_pending`` calls may be in flight at once; anything
+    beyond that is rejected immediately with ``HashingPoolBusy``. With
+    ``max_workers=0`` the work runs on threads instead (the legacy behaviour,
+    useful for benchmarks and single-core hosts).
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._capacity = max(max_workers, 1) + max_pending
+        self._slots = threading.BoundedSemaphore(self._capacity)
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self.max_workers > 0:
+                        self._executor = ProcessPoolExecutor(
+                            max_workers=self.max_workers,
+                            mp_context=multiprocessing.get_context("spawn"),
+                        )
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self._capacity,
+                            thread_name_prefix="password-hash",
+                        )
+        return self._executor
+
+    def submit(self, fn, *args) -> Future:
+        """Schedule fn(*args) or raise HashingPoolBusy if the queue is full"""
+        if not self._slots.acquire(blocking=False):
+            raise HashingPoolBusy()
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+
+hashing_pool = PasswordHashingPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the hashing pool"""
+    return await asyncio.wrap_future(hashing_pool.submit(get_password_hash, password))
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against a hash on the hashing pool"""
+    return await asyncio.wrap_future(
+        hashing_pool.submit(verify_password, plain_password, hashed_password)
+    )
@@ -0,0 +1,126 @@
+import logging
+import threading
+from collections import defaultdict
+from sqlalchemy import Select, bindparam, select, update
+from config import settings  # type: ignore
+from database import SessionLocal  # type: ignore
+from models.post import Post, PostLike  # type: ignore
+from schemas.post import PostResponse  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Atomic in-database increment; the row lock makes concurrent likes serialize
+# instead of overwriting each other's read-modify-write
+increment_likes = (
+    update(Post)
+    .where(Post.id == bindparam("post_id"))
+    .values(likes_count=Post.likes_count + bindparam("delta"))
+)
+
+
+def liked_post_ids(user_id: int, post_ids: list[int]) -> Select:
+    """Which of ``post_ids`` the user has liked, as one primary-key IN lookup"""
+    return select(PostLike.post_id).where(
+        PostLike.user_id == user_id, PostLike.post_id.in_(post_ids)
+    )
+
+
+def post_response(post: Post, liked_by_me: bool, pending: int = 0) -> PostResponse:
+    """Serialize a post with the caller's like flag and any buffered likes"""
+    return PostResponse.model_validate(post).model_copy(
+        update={"likes_count": post.likes_count + pending, "liked_by_me": liked_by_me}
+    )
+
+
+class LikeAggregator:
+    """Write-behind buffer for like counts.
+
+    Each like adds to an in-memory per-post delta, and a background thread
+    applies all pending deltas in one executemany UPDATE every
+    ``interval_ms``. A hot post therefore costs one write per interval rather
+    than one per like. Deltas not yet flushed are lost if the process dies.
+    """
+
+    def __init__(self, session_factory, interval_ms: int):
+        self.session_factory = session_factory
+        self.interval = interval_ms / 1000
+        self._pending: dict[int, int] = defaultdict(int)
+        # Deltas taken by the flush in progress; still counted as pending
+        # until they are committed or put back
+        self._inflight: dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def add(self, post_id: int, delta: int = 1) -> int:
+        """Buffer a delta and return the total still pending for the post"""
+        with self._lock:
+            self._pending[post_id] += delta
+            return self._pending[post_id] + self._inflight.get(post_id, 0)
+
+    def pending(self, post_id: int) -> int:
+        with self._lock:
+            return self._pending.get(post_id, 0) + self._inflight.get(post_id, 0)
+
+    def flush(self) -> int:
+        """Write every pending delta in a single batch; returns rows updated
+        (deltas for deleted posts match no row)"""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, defaultdict(int)
+                self._inflight = batch
+            if not batch:
+                return 0
+            params = [
+                {"post_id": post_id, "delta": delta} for post_id, delta in batch.items()
+            ]
+            db = self.session_factory()
+            try:
+                updated = db.connection().execute(increment_likes, params).rowcount
+                db.commit()
+            except Exception:
+                db.rollback()
+                # Put the deltas back so the next flush retries them
+                with self._lock:
+                    for post_id, delta in batch.items():
+                        self._pending[post_id] += delta
+                    self._inflight = {}
+                raise
+            else:
+                with self._lock:
+                    self._inflight = {}
+            finally:
+                db.close()
+            return updated
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+            except Exception:
+                # The deltas were put back; the next tick retries them
+                logger.exception("Flushing buffered likes failed")
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="like-flush", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the flush thread and write out whatever is still buffered"""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        try:
+            self.flush()
+        except Exception:
+            # Shutdown carries on; the unwritten deltas are lost with the process
+            logger.exception("Flushing buffered likes failed")
+
+
+like_aggregator = LikeAggregator(SessionLocal, settings.LIKE_FLUSH_INTERVAL_MS)
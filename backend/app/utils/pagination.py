@@ -0,0 +1,44 @@
+import base64
+import json
+from datetime import datetime
+from fastapi import HTTPException, Response
+
+# Response header carrying the cursor for the page after the current one
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(*values) -> str:
+    """Encode keyset values (datetimes, ints, strings) as an opaque cursor"""
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple:
+    """Decode a cursor back into typed keyset values, or raise a 400"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("wrong number of cursor values")
+        return tuple(
+            datetime.fromisoformat(value) if kind is datetime else kind(value)
+            for kind, value in zip(types, values)
+        )
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def set_next_cursor(
+    response: Response, rows: list, limit: int, *columns: str, prefix: tuple = ()
+) -> None:
+    """Advertise the next page cursor when the page came back full.
+
+    ``prefix`` values (such as the active filter) are encoded ahead of the
+    last row's ``columns`` so the cursor can be checked against the request.
+    """
+    if rows and len(rows) >= limit:
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            *prefix, *(getattr(last, column) for column in columns)
+        )
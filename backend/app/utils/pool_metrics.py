@@ -0,0 +1,139 @@
+import threading
+import time
+from collections import deque
+from sqlalchemy import event
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+
+def _percentiles(samples) -> dict:
+    ordered = sorted(samples)
+    if not ordered:
+        return {"p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0}
+    last = len(ordered) - 1
+    return {
+        f"p{pct}_ms": round(ordered[int(pct / 100 * last)] * 1000, 3)
+        for pct in (50, 95, 99)
+    }
+
+
+class PoolMetrics:
+    """Counters and timings for one engine's connection pool.
+
+    ``wait`` is how long callers blocked waiting for a connection (only
+    measured for queue pools), ``hold`` is how long a connection stayed
+    checked out before being returned. Both keep totals plus a window of the
+    most recent samples for percentiles.
+    """
+
+    def __init__(self, window: int = 1024):
+        self._lock = threading.Lock()
+        self._waits: deque[float] = deque(maxlen=window)
+        self._holds: deque[float] = deque(maxlen=window)
+        self.engine: Engine | None = None
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.overflow_checkouts = 0
+        self.peak_overflow = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.hold_total = 0.0
+
+    def attach(self, engine: Engine) -> None:
+        # Listening on the engine keeps the hooks across engine.dispose()
+        self.engine = engine
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self._waits.append(seconds)
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        connection_record.info["checked_out_at"] = time.perf_counter()
+        pool = self.engine.pool
+        overflow = pool.overflow() if isinstance(pool, QueuePool) else 0
+        with self._lock:
+            self.checkouts += 1
+            if overflow > 0:
+                self.overflow_checkouts += 1
+                self.peak_overflow = max(self.peak_overflow, overflow)
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        started = connection_record.info.pop("checked_out_at", None)
+        with self._lock:
+            self.checkins += 1
+            if started is not None:
+                held = time.perf_counter() - started
+                self._holds.append(held)
+                self.hold_total += held
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> dict:
+        pool = self.engine.pool if self.engine is not None else None
+        gauges = {"pool_class": type(pool).__name__ if pool else None}
+        if isinstance(pool, QueuePool):
+            gauges.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+                timeout_seconds=pool.timeout(),
+            )
+        with self._lock:
+            return {
+                **gauges,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "peak_overflow": self.peak_overflow,
+                "wait": {
+                    "total_ms": round(self.wait_total * 1000, 3),
+                    "max_ms": round(self.wait_max * 1000, 3),
+                    **_percentiles(self._waits),
+                },
+                "hold": {
+                    "total_ms": round(self.hold_total * 1000, 3),
+                    **_percentiles(self._holds),
+                },
+            }
+
+
+def instrumented_pool_class(pool_class: type[QueuePool], metrics: PoolMetrics):
+    """Subclass a queue pool so checkout waits and timeouts reach ``metrics``"""
+
+    class InstrumentedPool(pool_class):
+        def _do_get(self):
+            started = time.perf_counter()
+            try:
+                connection = super()._do_get()
+            except sa_exc.TimeoutError:
+                metrics.record_timeout()
+                raise
+            metrics.record_wait(time.perf_counter() - started)
+            return connection
+
+    InstrumentedPool.__name__ = f"Instrumented{pool_class.__name__}"
+    return InstrumentedPool
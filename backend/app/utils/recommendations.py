@@ -0,0 +1,177 @@
+import heapq
+import math
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from typing import Callable, NamedTuple
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from config import settings  # type: ignore
+from models.opportunity import Opportunity  # type: ignore
+from models.skill import Skill, opportunity_skills  # type: ignore
+from utils.skills import json_names, normalize_skills  # type: ignore
+
+# Score = coverage * bounty boost * deadline boost, where coverage is the
+# share of an opportunity's required skills the user has
+BOUNTY_WEIGHT = 0.1  # per e-fold of bounty: 1 + 0.1 * ln(1 + bounty)
+DEADLINE_WEIGHT = 0.5  # up to +50% for a deadline that is about to pass
+DEADLINE_SCALE_DAYS = 7.0  # the deadline boost decays with this time constant
+
+
+class _Doc(NamedTuple):
+    skills: tuple[str, ...]
+    bounty: int
+    deadline: datetime | None
+    creator_id: int
+
+
+class Recommendation(NamedTuple):
+    score: float
+    opportunity_id: int
+    matched_skills: list[str]
+
+
+def user_skills(user) -> list[str]:
+    """Normalized skills from a User's JSON skills column"""
+    return normalize_skills(json_names(user.skills))
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class RecommendationIndex:
+    """In-memory inverted index from skill to open opportunity ids.
+
+    Loaded from the database on first use and then kept current by the
+    opportunity routes (``upsert``/``remove``), so a recommendation only
+    touches the postings of the user's own skills instead of scoring every
+    opportunity.
+
+    Like the other caches this is per process: upserts and clears only reach
+    the worker that made them. ``loaded`` turns False ``ttl`` seconds after a
+    load, so the next request reloads and other workers' changes show up
+    within that time.
+    """
+
+    def __init__(self, ttl: float | None = None, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.clock = clock
+        self._postings: dict[str, set[int]] = defaultdict(set)
+        self._docs: dict[int, _Doc] = {}
+        self._loaded = False
+        self._loaded_at = 0.0
+        self._lock = threading.RLock()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the index is built and not older than ``ttl``"""
+        return self._loaded and (self.ttl is None or self.clock() - self._loaded_at < self.ttl)
+
+    def load(self, db: Session) -> None:
+        """Build the index from every open opportunity"""
+        # Taken before reading, so a write the read misses is covered by the TTL
+        started = self.clock()
+        rows = db.execute(
+            select(
+                Opportunity.id,
+                Opportunity.bounty_amount,
+                Opportunity.deadline,
+                Opportunity.creator_id,
+            ).where(Opportunity.status == "open")
+        ).all()
+        skills: dict[int, list[str]] = defaultdict(list)
+        for opportunity_id, name in db.execute(
+            select(opportunity_skills.c.opportunity_id, Skill.name)
+            .join(Skill, Skill.id == opportunity_skills.c.skill_id)
+            .join(Opportunity, Opportunity.id == opportunity_skills.c.opportunity_id)
+            .where(Opportunity.status == "open")
+        ):
+            skills[opportunity_id].append(name)
+
+        with self._lock:
+            self._postings.clear()
+            self._docs.clear()
+            for opportunity_id, bounty, deadline, creator_id in rows:
+                self._add(opportunity_id, skills[opportunity_id], bounty, deadline, creator_id)
+            self._loaded = True
+            self._loaded_at = started
+
+    def _add(self, opportunity_id, skills, bounty, deadline, creator_id) -> None:
+        doc = _Doc(tuple(skills), bounty or 0, _as_utc(deadline), creator_id)
+        self._docs[opportunity_id] = doc
+        for skill in doc.skills:
+            self._postings[skill].add(opportunity_id)
+
+    def remove(self, opportunity_id: int) -> None:
+        with self._lock:
+            doc = self._docs.pop(opportunity_id, None)
+            for skill in doc.skills if doc else ():
+                postings = self._postings[skill]
+                postings.discard(opportunity_id)
+                if not postings:
+                    del self._postings[skill]
+
+    def upsert(self, opportunity: Opportunity, skills) -> None:
+        """Index (or re-index) an opportunity after it was created or updated"""
+        with self._lock:
+            if not self._loaded:
+                return  # picked up by the first load
+            self.remove(opportunity.id)
+            if opportunity.status == "open":
+                self._add(
+                    opportunity.id,
+                    normalize_skills(skills),
+                    opportunity.bounty_amount,
+                    opportunity.deadline,
+                    opportunity.creator_id,
+                )
+
+    def _score(self, doc: _Doc, matched: int, now: datetime) -> float:
+        score = matched / len(doc.skills)
+        score *= 1 + BOUNTY_WEIGHT * math.log1p(max(doc.bounty, 0))
+        if doc.deadline is not None:
+            days_left = (doc.deadline - now).total_seconds() / 86400
+            if days_left < 0:
+                return 0.0
+            score *= 1 + DEADLINE_WEIGHT * math.exp(-days_left / DEADLINE_SCALE_DAYS)
+        return score
+
+    def recommend(
+        self, skills: list[str], k: int, exclude_creator: int | None = None
+    ) -> list[Recommendation]:
+        """Top ``k`` open opportunities for someone with ``skills``, best first"""
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            # Candidates are the union of the user's postings
+            matched = Counter()
+            for skill in skills:
+                matched.update(self._postings.get(skill, ()))
+            scored = (
+                (self._score(doc, count, now), opportunity_id)
+                for opportunity_id, count in matched.items()
+                if (doc := self._docs[opportunity_id]).creator_id != exclude_creator
+            )
+            top = heapq.nlargest(k, (item for item in scored if item[0] > 0))
+            wanted = set(skills)
+            return [
+                Recommendation(
+                    score,
+                    opportunity_id,
+                    [skill for skill in self._docs[opportunity_id].skills if skill in wanted],
+                )
+                for score, opportunity_id in top
+            ]
+
+    def clear(self) -> None:
+        """Forget everything; the next request reloads from the database"""
+        with self._lock:
+            self._postings.clear()
+            self._docs.clear()
+            self._loaded = False
+
+
+recommendation_index = RecommendationIndex(ttl=settings.RECOMMENDATION_INDEX_TTL_SECONDS or None)
@@ -0,0 +1,123 @@
+import html
+import re
+from sqlalchemy import DDL, Table, column, event, func, inspect, literal_column, table, text
+from sqlalchemy.engine import Connection
+
+# Every FullTextIndex declared by a model, for init_db to backfill
+full_text_indexes: list["FullTextIndex"] = []
+
+# Private-use characters that highlight() and snippet() put around matched
+# terms; marked_html swaps them for <mark> tags once the text is escaped
+MARK_OPEN, MARK_CLOSE = "\ue000", "\ue001"
+
+
+def fts_query(q: str) -> str:
+    """Turn free text into an FTS5 query: every word must match, as a literal.
+
+    Quoting each token keeps user input from being parsed as FTS5 syntax
+    (AND/OR/NEAR, column filters, unbalanced quotes).
+    """
+    return " ".join(f'"{word}"' for word in re.findall(r"\w+", q))
+
+
+def marked_html(text: str | None) -> str:
+    """HTML for a highlight() or snippet() result: the stored text escaped,
+    with matched terms wrapped in <mark>"""
+    return (
+        html.escape(text or "")
+        .replace(MARK_OPEN, "<mark>")
+        .replace(MARK_CLOSE, "</mark>")
+    )
+
+
+class FullTextIndex:
+    """An external-content FTS5 table kept in sync with ``source`` by triggers.
+
+    The virtual table stores only the index; the text is read back from the
+    source table by rowid. It is created and dropped together with the
+    source table (SQLite only); ``ensure`` adds it to databases whose source
+    table predates it.
+    """
+
+    def __init__(self, source: Table, *columns: str, tokenize: str = "porter unicode61"):
+        self.source = source
+        self.columns = columns
+        self.name = f"{source.name}_fts"
+        self.tokenize = tokenize
+        self.table = table(self.name, column("rowid"), *(column(c) for c in columns))
+
+        for statement in self._create_statements():
+            event.listen(source, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+        event.listen(
+            source,
+            "after_drop",
+            DDL(f"DROP TABLE IF EXISTS {self.name}").execute_if(dialect="sqlite"),
+        )
+        full_text_indexes.append(self)
+
+    def _create_statements(self) -> list[str]:
+        name, source = self.name, self.source.name
+        key = self.source.primary_key.columns.values()[0].name
+        cols = ", ".join(self.columns)
+        new = ", ".join(f"new.{c}" for c in self.columns)
+        old = ", ".join(f"old.{c}" for c in self.columns)
+        delete_old = (
+            f"INSERT INTO {name}({name}, rowid, {cols}) VALUES ('delete', old.{key}, {old});"
+        )
+        insert_new = f"INSERT INTO {name}(rowid, {cols}) VALUES (new.{key}, {new});"
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {name} USING fts5("
+            f"{cols}, content='{source}', content_rowid='{key}', tokenize='{self.tokenize}')",
+            f"CREATE TRIGGER IF NOT EXISTS {name}_ai AFTER INSERT ON {source} "
+            f"BEGIN {insert_new} END",
+            f"CREATE TRIGGER IF NOT EXISTS {name}_ad AFTER DELETE ON {source} "
+            f"BEGIN {delete_old} END",
+            f"CREATE TRIGGER IF NOT EXISTS {name}_au AFTER UPDATE OF {cols} ON {source} "
+            f"BEGIN {delete_old} {insert_new} END",
+        ]
+
+    def ensure(self, conn: Connection) -> bool:
+        """Create the index and triggers if missing; returns True if it was built"""
+        if conn.dialect.name != "sqlite" or inspect(conn).has_table(self.name):
+            return False
+        for statement in self._create_statements():
+            conn.execute(text(statement))
+        self.rebuild(conn)
+        return True
+
+    def rebuild(self, conn: Connection) -> None:
+        """Re-index every row of the source table"""
+        conn.execute(text(f"INSERT INTO {self.name}({self.name}) VALUES ('rebuild')"))
+
+    def match(self, q: str):
+        """WHERE clause matching ``q`` (see fts_query)"""
+        return literal_column(self.name).op("MATCH")(fts_query(q))
+
+    def rank(self, *weights: float):
+        """BM25 score (lower is better), optionally weighting each column"""
+        return func.bm25(literal_column(self.name), *weights)
+
+    def highlight(self, column_name: str, open_tag: str = MARK_OPEN, close_tag: str = MARK_CLOSE):
+        """The column's raw text with matched terms between the tags; pass the
+        default markers through marked_html before serving it as HTML"""
+        return func.highlight(
+            literal_column(self.name), self.columns.index(column_name), open_tag, close_tag
+        )
+
+    def snippet(
+        self,
+        column_name: str,
+        open_tag: str = MARK_OPEN,
+        close_tag: str = MARK_CLOSE,
+        ellipsis: str = "…",
+        tokens: int = 24,
+    ):
+        """A short excerpt of the column around the matched terms (see highlight)"""
+        return func.snippet(
+            literal_column(self.name),
+            self.columns.index(column_name),
+            open_tag,
+            close_tag,
+            ellipsis,
+            tokens,
+        )
@@ -0,0 +1,239 @@
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, NamedTuple
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from config import settings  # type: ignore
+from models.user import User  # type: ignore
+from utils.skills import json_names, normalize_skills  # type: ignore
+
+SIMILARITY_METRICS = ("cosine", "jaccard")
+MODES = ("hustler", "builder")
+
+
+class SimilarUser(NamedTuple):
+    score: float
+    user_id: int
+    shared: list[str]
+
+
+def user_terms(user) -> list[str]:
+    """A user's skills and interests as terms; a skill and an interest never match"""
+    return [f"skill:{name}" for name in normalize_skills(json_names(user.skills))] + [
+        f"interest:{name}" for name in normalize_skills(json_names(user.interests))
+    ]
+
+
+def _mode_code(mode: str | None) -> int:
+    return MODES.index(mode) if mode in MODES else -1
+
+
+class UserSimilarityIndex:
+    """Binary user x term matrix for scoring one user against everyone.
+
+    The matrix is kept column-major (term -> rows holding it), so the
+    intersection sizes with every user come from a single ``np.bincount``
+    over the postings of the query's terms, and cosine/Jaccard are then
+    array arithmetic over all rows at once.
+
+    Profile edits do not rebuild the matrix: the user's old row is marked
+    dead and the new terms are appended as a fresh row. Dead rows are
+    compacted away once they make up ``compact_ratio`` of the matrix.
+
+    Like the other caches this is per process, loaded on first use, so
+    profile edits reach only the worker that served them. ``loaded`` turns
+    False ``ttl`` seconds after a load and the next request reloads.
+    """
+
+    def __init__(
+        self,
+        compact_ratio: float = 0.2,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.compact_ratio = compact_ratio
+        self.ttl = ttl
+        self.clock = clock
+        self._loaded_at = 0.0
+        self._lock = threading.RLock()
+        self.clear()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the matrix is built and not older than ``ttl``"""
+        return self._loaded and (self.ttl is None or self.clock() - self._loaded_at < self.ttl)
+
+    def clear(self) -> None:
+        """Forget everything; the next request reloads from the database"""
+        with self._lock:
+            self._columns: dict[str, int] = {}
+            self._terms: list[str] = []
+            self._row_of: dict[int, int] = {}
+            self._row_terms: list[np.ndarray] = []
+            self._user_ids = np.zeros(0, dtype=np.int64)
+            self._modes = np.zeros(0, dtype=np.int8)
+            self._sizes = np.zeros(0, dtype=np.int32)  # 0 marks a dead row
+            self._rows = 0
+            self._dead = 0
+            # CSC over the rows present at the last compaction, plus postings
+            # of rows appended since
+            self._indptr = np.zeros(1, dtype=np.int64)
+            self._indices = np.zeros(0, dtype=np.int32)
+            self._appended: dict[int, list[int]] = defaultdict(list)
+            self._loaded = False
+
+    def load(self, db: Session) -> None:
+        """Build the matrix from every active user"""
+        started = self.clock()
+        users = db.execute(
+            select(User.id, User.mode, User.skills, User.interests).where(User.is_active)
+        ).all()
+        with self._lock:
+            self._fill(users)
+            self._loaded = True
+            self._loaded_at = started
+
+    def _fill(self, users) -> None:
+        """Replace the matrix with rows for ``users`` (id, mode, skills, interests)"""
+        self.clear()
+        user_ids, modes, row_terms = [], [], []
+        for user in users:
+            user_ids.append(user.id)
+            modes.append(_mode_code(user.mode))
+            row_terms.append(self._column_ids(user_terms(user), add=True))
+        self._user_ids = np.array(user_ids, dtype=np.int64)
+        self._modes = np.array(modes, dtype=np.int8)
+        self._sizes = np.array([len(columns) for columns in row_terms], dtype=np.int32)
+        self._row_terms = row_terms
+        self._rows = len(row_terms)
+        self._compact()
+
+    def _column_ids(self, terms: list[str], add: bool) -> np.ndarray:
+        columns = []
+        for term in terms:
+            column = self._columns.get(term)
+            if column is None and add:
+                column = self._columns[term] = len(self._terms)
+                self._terms.append(term)
+            if column is not None:
+                columns.append(column)
+        return np.array(sorted(set(columns)), dtype=np.int32)
+
+    def _append(self, user_id: int, mode: str | None, terms: list[str]) -> None:
+        if self._rows == len(self._sizes):
+            capacity = max(1024, 2 * self._rows)
+            self._user_ids = np.resize(self._user_ids, capacity)
+            self._modes = np.resize(self._modes, capacity)
+            self._sizes = np.resize(self._sizes, capacity)
+        row = self._rows
+        self._rows += 1
+        columns = self._column_ids(terms, add=True)
+        self._row_of[user_id] = row
+        self._row_terms.append(columns)
+        self._user_ids[row] = user_id
+        self._modes[row] = _mode_code(mode)
+        self._sizes[row] = len(columns)
+        for column in columns.tolist():
+            self._appended[column].append(row)
+
+    def _kill(self, user_id: int) -> None:
+        row = self._row_of.pop(user_id, None)
+        if row is not None:
+            self._sizes[row] = 0
+            self._row_terms[row] = self._row_terms[row][:0]
+            self._dead += 1
+
+    def _compact(self) -> None:
+        """Drop dead rows and rebuild the CSC arrays from the live ones"""
+        live = np.flatnonzero(self._sizes[: self._rows] > 0)
+        row_terms = [self._row_terms[row] for row in live.tolist()]
+        self._user_ids = self._user_ids[live]
+        self._modes = self._modes[live]
+        self._sizes = self._sizes[live]
+        self._row_terms = row_terms
+        self._rows = len(live)
+        self._row_of = {int(user_id): row for row, user_id in enumerate(self._user_ids)}
+        self._dead = 0
+
+        columns = np.concatenate(row_terms) if row_terms else np.zeros(0, dtype=np.int32)
+        rows = np.repeat(np.arange(self._rows, dtype=np.int32), self._sizes)
+        order = np.argsort(columns, kind="stable")
+        self._indices = rows[order]
+        self._indptr = np.zeros(len(self._terms) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(columns, minlength=len(self._terms)), out=self._indptr[1:])
+        self._appended.clear()
+
+    def upsert(self, user) -> None:
+        """Re-index a user after their profile changed"""
+        with self._lock:
+            if not self._loaded:
+                return  # picked up by the first load
+            self._kill(user.id)
+            self._append(user.id, user.mode, user_terms(user))
+            if self._dead > self.compact_ratio * self._rows:
+                self._compact()
+
+    def similar(
+        self,
+        user,
+        k: int,
+        metric: str = "cosine",
+        mode: str | None = None,
+    ) -> list[SimilarUser]:
+        """Top ``k`` other users by ``metric`` over skills and interests, best first"""
+        terms = user_terms(user)
+        with self._lock:
+            columns = self._column_ids(terms, add=False)
+            if not len(columns):
+                return []
+            postings = [
+                self._indices[self._indptr[column] : self._indptr[column + 1]]
+                for column in columns.tolist()
+                if column < len(self._indptr) - 1
+            ]
+            postings += [
+                np.array(self._appended[column], dtype=np.int32)
+                for column in columns.tolist()
+                if column in self._appended
+            ]
+            # Shared terms with every row in one pass
+            shared = np.bincount(np.concatenate(postings), minlength=self._rows)
+            sizes = self._sizes[: self._rows]
+            query_size = len(terms)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                if metric == "jaccard":
+                    scores = shared / (query_size + sizes - shared)
+                else:
+                    scores = shared / np.sqrt(query_size * sizes.astype(np.float64))
+            scores[(sizes == 0) | (shared == 0)] = 0.0
+            own_row = self._row_of.get(user.id)
+            if own_row is not None:
+                scores[own_row] = 0.0
+            if mode is not None:
+                scores[self._modes[: self._rows] != _mode_code(mode)] = 0.0
+
+            candidates = np.flatnonzero(scores)
+            if len(candidates) > k:
+                candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+            # Best score first, lower user id breaking ties
+            candidates = candidates[
+                np.lexsort((self._user_ids[candidates], -scores[candidates]))
+            ]
+            query_columns = set(columns.tolist())
+            return [
+                SimilarUser(
+                    float(scores[row]),
+                    int(self._user_ids[row]),
+                    [
+                        self._terms[column]
+                        for column in self._row_terms[row].tolist()
+                        if column in query_columns
+                    ],
+                )
+                for row in candidates.tolist()
+            ]
+
+
+user_similarity_index = UserSimilarityIndex(ttl=settings.SIMILARITY_INDEX_TTL_SECONDS or None)
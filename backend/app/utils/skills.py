@@ -0,0 +1,118 @@
+import json
+from sqlalchemy import delete, exists, func, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from models.opportunity import Opportunity  # type: ignore
+from models.skill import Skill, opportunity_skills  # type: ignore
+
+SKILL_MATCH_MODES = ("any", "all")
+
+
+def normalize_skills(names) -> list[str]:
+    """Lowercased, stripped, de-duplicated skill names in their original order"""
+    normalized = (str(name).strip().lower() for name in names or ())
+    return list(dict.fromkeys(name for name in normalized if name))
+
+
+def json_names(value: str | None) -> list:
+    """Names from a JSON list column, tolerating legacy comma-separated text"""
+    if not value:
+        return []
+    try:
+        names = json.loads(value)
+    except ValueError:
+        names = value.split(",")
+    if isinstance(names, str):
+        names = [names]
+    return names if isinstance(names, list) else []
+
+
+def parse_skills_param(skills: str | None) -> list[str]:
+    """Split a ``?skills=python,react`` query value"""
+    return normalize_skills(skills.split(",")) if skills else []
+
+
+def skills_filter_key(names: list[str], match: str) -> str:
+    """Canonical form of a skills filter, so a cursor can be tied to it"""
+    return f"{match}:{','.join(sorted(names))}" if names else ""
+
+
+def skill_ids(db: Session, names: list[str]) -> list[int]:
+    """Ids for ``names``, inserting any skills that do not exist yet"""
+    if not names:
+        return []
+    known = dict(db.execute(select(Skill.name, Skill.id).where(Skill.name.in_(names))).all())
+    missing = [name for name in names if name not in known]
+    if missing:
+        for name in missing:
+            try:
+                with db.begin_nested():
+                    db.execute(insert(Skill).values(name=name))
+            except IntegrityError:
+                pass  # another request added it first
+        known.update(
+            db.execute(select(Skill.name, Skill.id).where(Skill.name.in_(missing))).all()
+        )
+    return [known[name] for name in names]
+
+
+def set_opportunity_skills(db: Session, opportunity_id: int, names) -> None:
+    """Replace an opportunity's skill rows (within the caller's transaction)"""
+    db.execute(
+        delete(opportunity_skills).where(opportunity_skills.c.opportunity_id == opportunity_id)
+    )
+    ids = skill_ids(db, normalize_skills(names))
+    if ids:
+        db.execute(
+            insert(opportunity_skills),
+            [{"opportunity_id": opportunity_id, "skill_id": skill_id} for skill_id in ids],
+        )
+
+
+def skills_filter(names: list[str], match: str = "any"):
+    """WHERE clause on Opportunity for the skills filter.
+
+    ``any`` keeps opportunities requiring at least one of ``names``; ``all``
+    keeps those requiring every one. Both resolve through the skills.name and
+    (skill_id, opportunity_id) indexes without reading required_skills.
+    """
+    matching = (
+        select(opportunity_skills.c.opportunity_id)
+        .join(Skill, Skill.id == opportunity_skills.c.skill_id)
+        .where(Skill.name.in_(names))
+    )
+    if match == "all":
+        matching = matching.group_by(opportunity_skills.c.opportunity_id).having(
+            func.count() == len(names)
+        )
+    return Opportunity.id.in_(matching)
+
+
+def migrate_opportunity_skills(db: Session, batch_size: int = 1000) -> int:
+    """Copy required_skills JSON into opportunity_skills for rows not yet migrated.
+
+    Safe to re-run: opportunities that already have skill rows are skipped.
+    Returns the number of opportunities migrated.
+    """
+    migrated = 0
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(Opportunity.id, Opportunity.required_skills)
+            .where(
+                Opportunity.id > last_id,
+                Opportunity.required_skills.isnot(None),
+                ~exists().where(opportunity_skills.c.opportunity_id == Opportunity.id),
+            )
+            .order_by(Opportunity.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return migrated
+        for opportunity_id, required_skills in rows:
+            names = json_names(required_skills)
+            if normalize_skills(names):
+                set_opportunity_skills(db, opportunity_id, names)
+                migrated += 1
+        db.commit()
+        last_id = rows[-1].id
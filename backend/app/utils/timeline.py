@@ -0,0 +1,262 @@
+import heapq
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session
+from config import settings  # type: ignore
+from models.follow import Follow  # type: ignore
+from models.post import Post  # type: ignore
+
+
+def followers_of(author_id: int, limit: int) -> Select:
+    """Follower ids of an author, capped so huge audiences stay cheap to detect"""
+    return select(Follow.follower_id).where(Follow.followee_id == author_id).limit(limit)
+
+
+class _Timeline:
+    """Fixed-size ring of post ids addressed by an ever-increasing sequence"""
+
+    __slots__ = ("slots", "first_seq", "next_seq", "followees", "built_at")
+
+    def __init__(self, capacity: int, start_seq: int, followees: set[int], built_at: float):
+        self.slots = [0] * capacity
+        self.first_seq = self.next_seq = start_seq
+        self.followees = followees
+        self.built_at = built_at
+
+    def push(self, post_id: int) -> None:
+        self.slots[self.next_seq % len(self.slots)] = post_id
+        self.next_seq += 1
+
+    def page(self, before_seq: int | None, limit: int) -> list[tuple[int, int]]:
+        """Up to ``limit`` (seq, post_id) pairs older than ``before_seq``"""
+        end = self.next_seq if before_seq is None else min(before_seq, self.next_seq)
+        start = max(end - limit, self.next_seq - len(self.slots), self.first_seq)
+        return [(seq, self.slots[seq % len(self.slots)]) for seq in range(end - 1, start - 1, -1)]
+
+
+class TimelineStore:
+    """In-memory home timelines with fan-out on write.
+
+    Creating a post pushes its id into the ring buffer of every follower
+    whose timeline is in memory, so reading a page is a slice of the ring
+    plus one primary-key lookup; no query sorts posts. Authors with more
+    than ``fanout_limit`` followers are not fanned out; their recent posts
+    are merged in when a follower reads instead. Timelines that are not in
+    memory (cold start, LRU eviction, follow changes) are rebuilt from the
+    database on the next read.
+
+    Like the other caches this is per process: a post fans out only in the
+    worker that created it. Other workers pick it up when the follower's
+    timeline is rebuilt, which a first-page read does once the timeline is
+    older than ``ttl`` seconds. Later pages keep reading the same ring so a
+    cursor stays valid.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        max_users: int,
+        fanout_limit: int,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.capacity = capacity
+        self.max_users = max_users
+        self.fanout_limit = fanout_limit
+        self.ttl = ttl
+        self.clock = clock
+        self._timelines: OrderedDict[int, _Timeline] = OrderedDict()
+        self._high_fanout: set[int] = set()
+        # Rebuilt rings start past every sequence a dropped ring handed out,
+        # so a cursor from before the rebuild reads as exhausted, not as page 1
+        self._seq_floor = 0
+        # Posts fanned out to a user while a rebuild of their timeline is
+        # querying, one list per rebuild in progress
+        self._rebuilds: dict[int, list[list[int]]] = {}
+        self._lock = threading.Lock()
+
+    def _retire(self, timeline: _Timeline | None) -> None:
+        if timeline is not None:
+            self._seq_floor = max(self._seq_floor, timeline.next_seq)
+
+    def is_warm(self, user_id: int) -> bool:
+        with self._lock:
+            return user_id in self._timelines
+
+    def begin_rebuild(self, user_id: int) -> list[int]:
+        """Start recording posts fanned out to the user; call before querying
+        and pass the result to install()"""
+        fanned_out: list[int] = []
+        with self._lock:
+            self._rebuilds.setdefault(user_id, []).append(fanned_out)
+        return fanned_out
+
+    def end_rebuild(self, user_id: int, fanned_out: list[int]) -> None:
+        with self._lock:
+            rebuilds = [
+                log for log in self._rebuilds.pop(user_id, []) if log is not fanned_out
+            ]
+            if rebuilds:
+                self._rebuilds[user_id] = rebuilds
+
+    def install(
+        self,
+        user_id: int,
+        post_ids: list[int],
+        followees: set[int],
+        high_fanout: set[int],
+        fanned_out: list[int] | None = None,
+    ) -> None:
+        """Load a rebuilt timeline (``post_ids`` oldest first), merging in
+        posts fanned out since begin_rebuild() that the query missed"""
+        with self._lock:
+            if fanned_out:
+                post_ids = sorted(set(post_ids).union(fanned_out))
+            self._retire(self._timelines.pop(user_id, None))
+            timeline = _Timeline(self.capacity, self._seq_floor, followees, self.clock())
+            for post_id in post_ids[-self.capacity :]:
+                timeline.push(post_id)
+            self._high_fanout |= high_fanout
+            self._timelines[user_id] = timeline
+            while len(self._timelines) > self.max_users:
+                self._retire(self._timelines.popitem(last=False)[1])
+
+    def fan_out(self, author_id: int, post_id: int, follower_ids: list[int]) -> bool:
+        """Push a new post to its author's and followers' timelines.
+
+        Returns False when the author has too many followers, in which case
+        only the author's own timeline gets the post.
+        """
+        high_fanout = len(follower_ids) > self.fanout_limit
+        with self._lock:
+            if high_fanout:
+                self._high_fanout.add(author_id)
+                follower_ids = []
+            else:
+                self._high_fanout.discard(author_id)
+            for user_id in itertools.chain((author_id,), follower_ids):
+                timeline = self._timelines.get(user_id)
+                if timeline is not None:
+                    timeline.push(post_id)
+                for fanned_out in self._rebuilds.get(user_id, ()):
+                    fanned_out.append(post_id)
+        return not high_fanout
+
+    def page(
+        self, user_id: int, before_seq: int | None, limit: int
+    ) -> tuple[list[tuple[int, int]], set[int]] | None:
+        """A page of (seq, post_id) pairs and the high-fanout authors to merge
+        in, or None when the timeline must be rebuilt first"""
+        with self._lock:
+            timeline = self._timelines.get(user_id)
+            if timeline is None:
+                return None
+            if (
+                before_seq is None
+                and self.ttl is not None
+                and self.clock() - timeline.built_at >= self.ttl
+            ):
+                return None
+            self._timelines.move_to_end(user_id)
+            return (
+                timeline.page(before_seq, limit),
+                timeline.followees & self._high_fanout,
+            )
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._retire(self._timelines.pop(user_id, None))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._timelines.clear()
+            self._high_fanout.clear()
+            self._rebuilds.clear()
+
+
+timeline_store = TimelineStore(
+    capacity=settings.TIMELINE_SIZE,
+    max_users=settings.TIMELINE_MAX_USERS,
+    fanout_limit=settings.TIMELINE_FANOUT_LIMIT,
+    ttl=settings.TIMELINE_TTL_SECONDS or None,
+)
+
+
+def rebuild_timeline(db: Session, user_id: int) -> None:
+    """Materialize a user's timeline from the follows and posts tables"""
+    # A post fanned out while these queries run may not be in their snapshot;
+    # the store records it so install() keeps it
+    fanned_out = timeline_store.begin_rebuild(user_id)
+    try:
+        followees = set(
+            db.scalars(select(Follow.followee_id).where(Follow.follower_id == user_id))
+        )
+        high_fanout = set(
+            db.scalars(
+                select(Follow.followee_id)
+                .where(Follow.followee_id.in_(followees))
+                .group_by(Follow.followee_id)
+                .having(func.count() > timeline_store.fanout_limit)
+            )
+        ) if followees else set()
+        post_ids = db.scalars(
+            select(Post.id)
+            .where(Post.author_id.in_((followees - high_fanout) | {user_id}))
+            .order_by(Post.id.desc())
+            .limit(timeline_store.capacity)
+        ).all()
+        timeline_store.install(
+            user_id, post_ids[::-1], followees, high_fanout, fanned_out
+        )
+    finally:
+        timeline_store.end_rebuild(user_id, fanned_out)
+
+
+def read_timeline(
+    db: Session, user_id: int, before_seq: int | None, before_id: int, limit: int
+) -> tuple[list[int], int, int]:
+    """Post ids for one page, newest first, with the cursor for the next page.
+
+    Ring entries and high-fanout authors' posts (below ``before_id``) are
+    merged by id; the returned cursor is (next ring seq, next before_id).
+    """
+    page = timeline_store.page(user_id, before_seq, limit)
+    while page is None:
+        # Cold, stale, or dropped by an invalidation or eviction; page() looks
+        # the ring up under the store's lock, so a rebuilt one is read whole
+        rebuild_timeline(db, user_id)
+        page = timeline_store.page(user_id, before_seq, limit)
+    entries, high_fanout = page
+
+    pulled: list[int] = []
+    if high_fanout:
+        pulled = db.scalars(
+            select(Post.id)
+            .where(Post.author_id.in_(high_fanout), Post.id < before_id)
+            .order_by(Post.id.desc())
+            .limit(limit)
+        ).all()
+
+    post_ids: list[int] = []
+    seen: set[int] = set()
+    next_seq = before_seq if before_seq is not None else entries[0][0] + 1 if entries else 0
+    merged = heapq.merge(
+        ((post_id, seq) for seq, post_id in entries),
+        ((post_id, None) for post_id in pulled),
+        key=lambda item: item[0],
+        reverse=True,
+    )
+    for post_id, seq in itertools.islice(merged, limit):
+        if seq is None:
+            before_id = post_id
+        else:
+            next_seq = seq
+        # An author can cross the fan-out limit with older posts already pushed
+        if post_id not in seen:
+            seen.add(post_id)
+            post_ids.append(post_id)
+    return post_ids, next_seq, before_id
@@ -1,6 +1,7 @@
 import { useState, useEffect } from 'react';
 import { useAuth } from '../../contexts/useAuth';
 import { Users } from 'lucide-react';
+import { opportunitiesAPI } from '../../services/api';
 
 interface Application {
   id: number;
@@ -19,6 +20,7 @@ export default function Applicants() {
   const [loading, setLoading] = useState(true);
   const [filter, setFilter] = useState<'all' | 'pending' | 'accepted' | 'rejected'>('all');
   const [processingId, setProcessingId] = useState<number | null>(null);
+  const [counts, setCounts] = useState<Record<Application['status'], number>>({ pending: 0, accepted: 0, rejected: 0 });
 
   useEffect(() => {
     fetchApplications();
@@ -26,31 +28,33 @@ export default function Applicants() {
 
   const fetchApplications = async () => {
     try {
-      // This is a placeholder - you'll need to implement this API endpoint
-      // const data = await opportunitiesAPI.getApplications();
-      // For now, showing mock data
-      setApplications([
-        {
-          id: 1,
-          opportunity_id: 1,
-          opportunity_title: 'Integration Test Opportunity',
-          applicant_name: 'John Smith',
-          applicant_email: 'john@example.com',
-          message: 'I have experience with testing and would love to contribute to this project.',
-          status: 'pending',
-          created_at: '2025-11-25'
-        },
-        {
-          id: 2,
-          opportunity_id: 2,
-          opportunity_title: 'Test Opportunity',
-          applicant_name: 'Jane Doe',
-          applicant_email: 'jane@example.com',
-          message: 'Very interested in this FastAPI project. I have solid Python experience.',
-          status: 'pending',
-          created_at: '2025-11-24'
-        }
-      ]);
+      // The builder's opportunities with their counts, then the applications
+      // (applicant profiles embedded) of those that have any
+      const summary = await opportunitiesAPI.getMySummary();
+      setCounts(summary.reduce(
+        (totals, opp) => ({
+          pending: totals.pending + opp.pending,
+          accepted: totals.accepted + opp.accepted,
+          rejected: totals.rejected + opp.rejected
+        }),
+        { pending: 0, accepted: 0, rejected: 0 }
+      ));
+      const withApplications = summary.filter(opp => opp.total > 0);
+      const received = (await Promise.all(withApplications.map(opp => opportunitiesAPI.getApplicationsWithApplicants(opp.id))))
+        .flat()
+        .sort((a, b) => b.created_at.localeCompare(a.created_at));
+      const titles = new Map(summary.map(opp => [opp.id, opp.title]));
+
+      setApplications(received.map(app => ({
+        id: app.id,
+        opportunity_id: app.opportunity_id,
+        opportunity_title: titles.get(app.opportunity_id) ?? '',
+        applicant_name: app.applicant?.full_name ?? 'Unknown applicant',
+        applicant_email: app.applicant?.email ?? '',
+        message: app.message,
+        status: app.status,
+        created_at: app.created_at
+      })));
     } catch (error) {
       console.error('Error fetching applications:', error);
     } finally {
@@ -58,37 +62,27 @@ export default function Applicants() {
     }
   };
 
-  const handleAccept = async (id: number) => {
-    setProcessingId(id);
+  // Both buttons go through the bulk endpoint, which also takes a single id
+  const decide = async (app: Application, status: 'accepted' | 'rejected') => {
+    setProcessingId(app.id);
     try {
-      // Update the application status
-      setApplications(applications.map(app =>
-        app.id === id ? { ...app, status: 'accepted' } : app
+      const [result] = await opportunitiesAPI.updateApplicationStatuses(app.opportunity_id, [app.id], status);
+      if (!result?.updated) throw new Error(result?.detail || 'Application not updated');
+      setApplications(applications.map(a =>
+        a.id === app.id ? { ...a, status } : a
       ));
-      alert('Application accepted!');
+      setCounts(current => ({ ...current, [app.status]: current[app.status] - 1, [status]: current[status] + 1 }));
+      alert(`Application ${status}!`);
     } catch (error) {
-      console.error('Error accepting application:', error);
-      alert('Failed to accept application');
+      console.error(`Error updating application to ${status}:`, error);
+      alert('Failed to update application');
     } finally {
       setProcessingId(null);
     }
   };
 
-  const handleReject = async (id: number) => {
-    setProcessingId(id);
-    try {
-      // Update the application status
-      setApplications(applications.map(app =>
-        app.id === id ? { ...app, status: 'rejected' } : app
-      ));
-      alert('Application rejected!');
-    } catch (error) {
-      console.error('Error rejecting application:', error);
-      alert('Failed to reject application');
-    } finally {
-      setProcessingId(null);
-    }
-  };
+  const handleAccept = (app: Application) => decide(app, 'accepted');
+  const handleReject = (app: Application) => decide(app, 'rejected');
 
   const filteredApplications = applications.filter(app => 
     filter === 'all' ? true : app.status === filter
@@ -128,7 +122,7 @@ export default function Applicants() {
             }`}
           >
             {status.charAt(0).toUpperCase() + status.slice(1)}
-            {status !== 'all' && ` (${applications.filter(a => a.status === status).length})`}
+            {status !== 'all' && ` (${counts[status]})`}
           </button>
         ))}
       </div>
@@ -173,14 +167,14 @@ export default function Applicants() {
                 {app.status === 'pending' && (
                   <div className="flex gap-3">
                     <button
-                      onClick={() => handleReject(app.id)}
+                      onClick={() => handleReject(app)}
                       disabled={processingId === app.id}
                       className="px-4 py-2 border border-red-300 text-red-600 rounded-lg hover:bg-red-50 transition-colors font-medium disabled:opacity-50 disabled:cursor-not-allowed"
                     >
                       {processingId === app.id ? 'Rejecting...' : 'Reject'}
                     </button>
                     <button
-                      onClick={() => handleAccept(app.id)}
+                      onClick={() => handleAccept(app)}
                       disabled={processingId === app.id}
                       className="px-4 py-2 bg-emerald-600 text-white rounded-lg hover:bg-emerald-700 transition-colors font-medium disabled:opacity-50 disabled:cursor-not-allowed"
                     >
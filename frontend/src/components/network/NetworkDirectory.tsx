@@ -1,19 +1,68 @@
-import { useState, useEffect } from 'react';
-import { Users } from 'lucide-react';
+import { useState, useEffect, useRef } from 'react';
+import { Users, Search } from 'lucide-react';
 import { networkAPI } from '../../services/api';
 import FilterButton from '../common/FilterButton';
 import UserCard from './UserCard';
-import type { User } from '../../types';
+import type { AutocompleteResult, User } from '../../types';
 
 export default function NetworkDirectory() {
   const [users, setUsers] = useState<User[]>([]);
   const [loading, setLoading] = useState(true);
   const [filter, setFilter] = useState('all');
+  const [searchInput, setSearchInput] = useState('');
+  const [suggestions, setSuggestions] = useState<AutocompleteResult | null>(null);
+  const [skillFilter, setSkillFilter] = useState<string | null>(null);
+  const [pickedUser, setPickedUser] = useState(false);
+  const latestRequest = useRef(0);
 
   useEffect(() => {
+    setPickedUser(false);
     fetchUsers();
   }, [filter]);
 
+  // Autocomplete runs on every keystroke; drop responses that arrive out of order
+  useEffect(() => {
+    const q = searchInput.trim();
+    const request = ++latestRequest.current;
+    if (!q) {
+      setSuggestions(null);
+      return;
+    }
+    networkAPI.autocomplete(q)
+      .then(result => {
+        if (request === latestRequest.current) setSuggestions(result);
+      })
+      .catch(error => console.error('Error fetching suggestions:', error));
+  }, [searchInput]);
+
+  const selectUser = async (id: number) => {
+    setSearchInput('');
+    setSkillFilter(null);
+    try {
+      setUsers([await networkAPI.getUserById(id)]);
+      setPickedUser(true);
+    } catch (error) {
+      console.error('Error fetching user:', error);
+    }
+  };
+
+  const selectSkill = (name: string) => {
+    setSearchInput('');
+    setSkillFilter(name);
+    if (pickedUser) clearSearch();
+  };
+
+  const clearSearch = () => {
+    setPickedUser(false);
+    fetchUsers();
+  };
+
+  const shownUsers = skillFilter
+    ? users.filter(u => (u.skills ? JSON.parse(u.skills) : []).some(
+        (skill: string) => skill.toLowerCase() === skillFilter
+      ))
+    : users;
+
   const fetchUsers = async () => {
     try {
       const params = filter === 'all' ? {} : { mode: filter };
@@ -33,6 +82,47 @@ export default function NetworkDirectory() {
         <p className="text-slate-600">Connect with builders and hustlers in your community</p>
       </div>
 
+      <div className="relative mb-6">
+        <Search className="w-5 h-5 text-slate-400 absolute left-3 top-1/2 -translate-y-1/2" />
+        <input
+          type="search"
+          value={searchInput}
+          onChange={e => setSearchInput(e.target.value)}
+          placeholder="Search people or skills"
+          className="w-full pl-10 pr-4 py-2.5 border border-slate-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500"
+        />
+        {suggestions && (suggestions.users.length > 0 || suggestions.skills.length > 0) && (
+          <div className="absolute z-20 mt-1 w-full bg-white border border-slate-200 rounded-lg shadow-lg overflow-hidden">
+            {suggestions.users.map(u => (
+              <button
+                key={`user-${u.id}`}
+                onClick={() => selectUser(u.id)}
+                className="w-full text-left px-4 py-2 hover:bg-slate-50"
+              >
+                <span className="font-medium text-slate-900">{u.full_name}</span>
+                <span className="text-sm text-slate-500 ml-2">@{u.username}</span>
+              </button>
+            ))}
+            {suggestions.skills.map(skill => (
+              <button
+                key={`skill-${skill.name}`}
+                onClick={() => selectSkill(skill.name)}
+                className="w-full text-left px-4 py-2 hover:bg-slate-50 text-sm text-slate-700"
+              >
+                Skill: {skill.name}
+                <span className="text-slate-400 ml-2">{skill.users} members</span>
+              </button>
+            ))}
+          </div>
+        )}
+      </div>
+
+      {(skillFilter || pickedUser) && (
+        <button onClick={() => { setSkillFilter(null); clearSearch(); }} className="mb-4 text-sm text-blue-600 hover:underline">
+          {skillFilter ? `Showing members with ${skillFilter}` : 'Showing selected member'} · Clear
+        </button>
+      )}
+
       <div className="flex gap-2 mb-6 flex-wrap">
         <FilterButton active={filter === 'all'} onClick={() => setFilter('all')} label="All Members" />
         <FilterButton active={filter === 'builder'} onClick={() => setFilter('builder')} label="🔨 Builders" />
@@ -47,13 +137,13 @@ export default function NetworkDirectory() {
         </div>
       ) : (
         <div className="grid gap-6 grid-cols-1 md:grid-cols-2 lg:grid-cols-3">
-          {users.length === 0 ? (
+          {shownUsers.length === 0 ? (
             <div className="col-span-full text-center py-12 bg-white rounded-xl border border-slate-200 shadow-sm">
               <Users className="w-12 h-12 text-slate-300 mx-auto mb-4" />
               <p className="text-slate-600">No users found</p>
             </div>
           ) : (
-            users.map(u => <UserCard key={u.id} user={u} />)
+            shownUsers.map(u => <UserCard key={u.id} user={u} />)
           )}
         </div>
       )}
@@ -1,31 +1,79 @@
-import { useState, useEffect } from 'react';
-import { Plus, Briefcase } from 'lucide-react';
+import { useState, useEffect, useRef, useCallback } from 'react';
+import { Plus, Briefcase, Search } from 'lucide-react';
 import { useAuth } from '../../contexts/useAuth';
 import { opportunitiesAPI } from '../../services/api';
 import OpportunityCard from './OpportunityCard';
 import CreateOpportunityModal from './CreateOpportunityModal';
 import type { Opportunity } from '../../types';
 
+const PAGE_SIZE = 20;
+const SEARCH_DEBOUNCE_MS = 300;
+
 export default function OpportunityBoard() {
   const { user } = useAuth();
   const [opportunities, setOpportunities] = useState<Opportunity[]>([]);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [showCreateModal, setShowCreateModal] = useState(false);
+  const [searchInput, setSearchInput] = useState('');
+  const [query, setQuery] = useState('');
+  const sentinelRef = useRef<HTMLDivElement | null>(null);
 
-  useEffect(() => {
-    fetchOpportunities();
-  }, []);
+  // Full-text search when there is a query, otherwise the newest-first board
+  const loadPage = useCallback(
+    (cursor?: string | null) => query
+      ? opportunitiesAPI.search(query, { limit: PAGE_SIZE }, cursor)
+      : opportunitiesAPI.getPage({ limit: PAGE_SIZE }, cursor),
+    [query]
+  );
 
-  const fetchOpportunities = async () => {
+  // Reload from the first page (after create/update/delete or a new query)
+  const fetchOpportunities = useCallback(async () => {
     try {
-      const data = await opportunitiesAPI.getAll();
-      setOpportunities(data);
+      const page = await loadPage();
+      setOpportunities(page.items);
+      setNextCursor(page.nextCursor);
     } catch (error) {
       console.error('Error fetching opportunities:', error);
     } finally {
       setLoading(false);
     }
-  };
+  }, [loadPage]);
+
+  // Each page seeks from the previous page's cursor, so cost stays constant
+  const fetchMore = useCallback(async () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const page = await loadPage(nextCursor);
+      setOpportunities(prev => [...prev, ...page.items]);
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      console.error('Error fetching more opportunities:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  }, [nextCursor, loadingMore, loadPage]);
+
+  useEffect(() => {
+    fetchOpportunities();
+  }, [fetchOpportunities]);
+
+  useEffect(() => {
+    const timer = setTimeout(() => setQuery(searchInput.trim()), SEARCH_DEBOUNCE_MS);
+    return () => clearTimeout(timer);
+  }, [searchInput]);
+
+  useEffect(() => {
+    const sentinel = sentinelRef.current;
+    if (!sentinel || !nextCursor) return;
+    const observer = new IntersectionObserver(entries => {
+      if (entries[0].isIntersecting) fetchMore();
+    }, { rootMargin: '400px' });
+    observer.observe(sentinel);
+    return () => observer.disconnect();
+  }, [nextCursor, fetchMore]);
 
   if (loading) {
     return (
@@ -61,6 +109,17 @@ export default function OpportunityBoard() {
         </button>
       </div>
 
+      <div className="relative mb-8">
+        <Search className="w-5 h-5 text-slate-400 absolute left-3 top-1/2 -translate-y-1/2" />
+        <input
+          type="search"
+          value={searchInput}
+          onChange={e => setSearchInput(e.target.value)}
+          placeholder="Search opportunities by title or description"
+          className="w-full pl-10 pr-4 py-2.5 border border-slate-300 rounded-lg focus:outline-none focus:ring-2 focus:ring-blue-500"
+        />
+      </div>
+
       {loading ? (
         <div className="space-y-12">
           {[1, 2, 3].map(i => (
@@ -72,13 +131,18 @@ export default function OpportunityBoard() {
           {opportunities.length === 0 ? (
             <div className="text-center py-12 bg-white rounded-lg border border-slate-200 shadow-sm">
               <Briefcase className="w-12 h-12 text-slate-300 mx-auto mb-4" />
-              <p className="text-slate-600">No opportunities yet. Be the first to post!</p>
+              <p className="text-slate-600">
+                {query ? 'No opportunities match your search.' : 'No opportunities yet. Be the first to post!'}
+              </p>
             </div>
           ) : (
             opportunities.map(opp => (
               <OpportunityCard key={opp.id} opportunity={opp} onUpdate={fetchOpportunities} />
             ))
           )}
+          {nextCursor && (
+            <div ref={sentinelRef} className="h-24 bg-slate-100 rounded-lg animate-pulse"></div>
+          )}
         </div>
       )}
 
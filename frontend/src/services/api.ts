@@ -1,14 +1,19 @@
 import { API_URL } from '../config/constants';
 import type { 
   User, 
+  AutocompleteResult,
   UserCreate, 
   UserLogin, 
   UserProfile, 
   AuthResponse,
   Opportunity,
+  OpportunitySearchResult,
+  OpportunitySummary,
   OpportunityCreate,
   OpportunityUpdate,
   Application,
+  ApplicationWithApplicant,
+  ApplicationStatusResult,
   ApplicationCreate
 } from '../types';
 
@@ -35,6 +40,33 @@ const apiCall = async <T>(endpoint: string, options: RequestInit = {}): Promise<
   return response.json();
 };
 
+// Cursor-paginated list: the next page cursor travels in the X-Next-Cursor header
+export interface CursorPage<T> {
+  items: T[];
+  nextCursor: string | null;
+}
+
+const apiPageCall = async <T>(endpoint: string): Promise<CursorPage<T>> => {
+  const token = localStorage.getItem('token');
+  const response = await fetch(`${API_URL}${endpoint}`, {
+    headers: {
+      'Content-Type': 'application/json',
+      ...(token && { 'Authorization': `Bearer ${token}` })
+    }
+  });
+
+  if (!response.ok) {
+    const error = await response.json();
+    console.error(`API Error on ${endpoint}:`, error);
+    throw new Error(error.detail || JSON.stringify(error) || 'API request failed');
+  }
+
+  return {
+    items: await response.json(),
+    nextCursor: response.headers.get('X-Next-Cursor')
+  };
+};
+
 // Auth API
 export const authAPI = {
   signup: (data: UserCreate) => apiCall<AuthResponse>('/auth/signup', {
@@ -70,6 +102,23 @@ export const opportunitiesAPI = {
     return apiCall<Opportunity[]>(`/opportunities${queryString ? `?${queryString}` : ''}`);
   },
   
+  getPage: (params: Record<string, string | number> = {}, cursor?: string | null) => {
+    const query = new URLSearchParams(Object.entries(params).map(([k, v]) => [k, String(v)]));
+    if (cursor) query.set('cursor', cursor);
+    const queryString = query.toString();
+    return apiPageCall<Opportunity>(`/opportunities${queryString ? `?${queryString}` : ''}`);
+  },
+
+  search: (q: string, params: Record<string, string | number> = {}, cursor?: string | null) => {
+    const query = new URLSearchParams(Object.entries(params).map(([k, v]) => [k, String(v)]));
+    query.set('q', q);
+    if (cursor) query.set('cursor', cursor);
+    return apiPageCall<OpportunitySearchResult>(`/opportunities/search?${query.toString()}`);
+  },
+
+  // The current user's opportunities with application counts per status
+  getMySummary: () => apiCall<OpportunitySummary[]>('/opportunities/mine/summary'),
+
   getById: (id: number) => apiCall<Opportunity>(`/opportunities/${id}`),
   
   create: (data: OpportunityCreate) => apiCall<Opportunity>('/opportunities', {
@@ -91,17 +140,41 @@ export const opportunitiesAPI = {
     body: JSON.stringify({ message })
   }),
   
-  getApplications: (id: number) => apiCall<Application[]>(`/opportunities/${id}/applications`)
+  getApplications: (id: number) => apiCall<Application[]>(`/opportunities/${id}/applications`),
+
+  // Accept or reject many applications to one opportunity in a single request
+  updateApplicationStatuses: (id: number, ids: number[], status: 'accepted' | 'rejected') =>
+    apiCall<ApplicationStatusResult[]>(`/opportunities/${id}/applications/status`, {
+      method: 'PUT',
+      body: JSON.stringify({ ids, status })
+    }),
+
+  // Applications with each applicant's profile summary embedded
+  getApplicationsWithApplicants: (id: number) =>
+    apiCall<ApplicationWithApplicant[]>(`/opportunities/${id}/applications?expand=applicant`)
 };
 
 // Network API
+const BATCH_GET_MAX_IDS = 100;
+
 export const networkAPI = {
   getUsers: (params: Record<string, string> = {}) => {
     const queryString = new URLSearchParams(params).toString();
     return apiCall<User[]>(`/network${queryString ? `?${queryString}` : ''}`);
   },
   
+  autocomplete: (q: string, limit = 8) =>
+    apiCall<AutocompleteResult>(`/network/autocomplete?${new URLSearchParams({ q, limit: String(limit) })}`),
+
   getUserById: (id: number) => apiCall<User>(`/network/${id}`),
+
+  // Many profiles in one request, keyed by id; long id lists go in a POST body
+  getBatch: (ids: number[]) => ids.length > BATCH_GET_MAX_IDS
+    ? apiCall<Record<number, User>>('/network/batch', {
+        method: 'POST',
+        body: JSON.stringify({ ids })
+      })
+    : apiCall<Record<number, User>>(`/network/batch?ids=${ids.join(',')}`),
   
   getMyApplications: () => apiCall<Application[]>('/network/applications/my')
 };
\ No newline at end of file
@@ -12,6 +12,24 @@ export interface User {
   created_at: string;
 }
 
+export interface UserSuggestion {
+  id: number;
+  username: string;
+  full_name: string | null;
+  profile_image: string | null;
+  mode: 'builder' | 'hustler' | null;
+}
+
+export interface SkillSuggestion {
+  name: string;
+  users: number;
+}
+
+export interface AutocompleteResult {
+  users: UserSuggestion[];
+  skills: SkillSuggestion[];
+}
+
 export interface UserCreate {
   email: string;
   username: string;
@@ -63,6 +81,23 @@ export interface Opportunity {
   deadline: string | null;
 }
 
+export interface OpportunitySearchResult extends Opportunity {
+  rank: number;
+  title_highlight: string;
+  description_snippet: string;
+}
+
+export interface OpportunitySummary {
+  id: number;
+  title: string;
+  status: Opportunity['status'];
+  created_at: string;
+  pending: number;
+  accepted: number;
+  rejected: number;
+  total: number;
+}
+
 export interface OpportunityCreate {
   title: string;
   description: string;
@@ -90,6 +125,26 @@ export interface Application {
   created_at: string;
 }
 
+export interface ApplicantSummary {
+  id: number;
+  username: string;
+  full_name: string;
+  email: string;
+  profile_image: string | null;
+  mode: 'builder' | 'hustler';
+}
+
+export interface ApplicationWithApplicant extends Application {
+  applicant: ApplicantSummary | null;
+}
+
+export interface ApplicationStatusResult {
+  id: number;
+  updated: boolean;
+  status?: 'accepted' | 'rejected';
+  detail?: string;
+}
+
 export interface ApplicationCreate {
   message: string;
 }